@@ -0,0 +1,360 @@
+"""
+Jahrgangsweite Auswertungen für die Studienberatung.
+
+Lädt Prüfungen, Fristen und Ziele aller Studenten spaltenweise in Arrays
+und berechnet daraus
+- die Notenverteilung je Modul,
+- gefährdete Studenten (Notendurchschnitt schlechter als die Ziel-Note),
+- die Fristenlast je Kalenderwoche über alle Studenten.
+
+Mit NumPy laufen die Berechnungen vektorisiert; ohne NumPy werden
+dieselben Spalten als array.array in einfachen Schleifen ausgewertet.
+Beide Wege liefern identische Ergebnisse. Die Ergebnisse werden je
+Datenstand zwischengespeichert.
+
+Das Modul importiert dashboard.py nicht, sondern liest über eine
+sqlite3-Verbindung (Schema siehe dort).
+"""
+import array
+import bisect
+import datetime
+import threading
+from collections import Counter
+
+try:
+    import numpy
+except ImportError:  # NumPy ist optional
+    numpy = None
+
+# Notenstufen in Zehnteln und die Grenzen zwischen zwei Stufen
+GRADE_STEPS = (10, 13, 17, 20, 23, 27, 30, 33, 37, 40, 50)
+GRADE_BOUNDS = tuple((low + high) / 2 for low, high in zip(GRADE_STEPS, GRADE_STEPS[1:]))
+PASSING_GRADE = 40
+DEFAULT_TARGET_GPA = 3.0  # wie Dashboard
+
+
+class CohortColumns:
+    """
+    Spaltenweiser Stand aller Prüfungen, Fristen und Ziele.
+
+    Studenten und Module werden auf fortlaufende Indizes abgebildet; jede
+    benotete Prüfung bzw. jede Frist ist eine Zeile über gleich lange
+    Spalten. Noten werden in Zehnteln als ganze Zahlen geführt, damit
+    Summen exakt sind und beide Rechenwege dasselbe Ergebnis liefern.
+
+    Attribute:
+        version: Datenstand beim Laden (höchste Inhaltsversion)
+        changed: Zeitpunkt der letzten Änderung als Unix-Zeit
+        student_ids, student_names: je Studentenindex
+        target_gpa: Ziel-Note je Studentenindex
+        module_ids, module_names: je Modulindex
+        exam_student, exam_module, exam_grade: je benoteter Prüfung
+        deadline_student, deadline_week: je Frist (Woche = Tagesnummer des Montags // 7)
+    """
+    __slots__ = ('version', 'changed', 'student_ids', 'student_names', 'target_gpa',
+                 'module_ids', 'module_names', 'exam_student', 'exam_module', 'exam_grade',
+                 'deadline_student', 'deadline_week')
+
+    @classmethod
+    def load(cls, conn, use_numpy):
+        """
+        Liest alle Tabellen in einer Lesetransaktion, also mit einheitlichem Stand.
+
+        Args:
+            conn: sqlite3-Verbindung zur Dashboard-Datenbank
+            use_numpy: Spalten als numpy.ndarray statt array.array anlegen
+        """
+        columns = cls()
+        own_transaction = not conn.in_transaction
+        if own_transaction:
+            conn.execute('BEGIN')
+        try:
+            columns.version, columns.changed = read_version(conn)
+            student_ids, student_index = [], {}
+            student_names = {}
+            for student_id, name in conn.execute('SELECT student_id, name FROM students ORDER BY student_id'):
+                student_index[student_id] = len(student_ids)
+                student_ids.append(student_id)
+                student_names[student_id] = name
+
+            def student(student_id):
+                position = student_index.get(student_id)
+                if position is None:
+                    # Prüfungen oder Fristen zu Studenten, die (noch) nicht angelegt sind
+                    position = student_index[student_id] = len(student_ids)
+                    student_ids.append(student_id)
+                return position
+
+            module_names = dict(conn.execute('SELECT module_id, MIN(name) FROM course_modules GROUP BY module_id'))
+            module_ids, module_index = [], {}
+
+            def module(module_id):
+                position = module_index.get(module_id)
+                if position is None:
+                    position = module_index[module_id] = len(module_ids)
+                    module_ids.append(module_id)
+                return position
+
+            exams = conn.execute('''SELECT student_id, module_id, CAST(ROUND(grade * 10) AS INTEGER)
+                                    FROM exams WHERE grade IS NOT NULL''').fetchall()
+            exam_student = [student(row[0]) for row in exams]
+            exam_module = [module(row[1]) for row in exams]
+            exam_grade = [row[2] for row in exams]
+            del exams
+
+            weeks = {}
+            deadline_student, deadline_week = [], []
+            for student_id, date in conn.execute('SELECT student_id, deadline_date FROM deadlines'):
+                week = weeks.get(date)
+                if week is None:
+                    week = weeks[date] = week_number(date)
+                if week >= 0:
+                    deadline_student.append(student(student_id))
+                    deadline_week.append(week)
+
+            targets = dict(conn.execute('SELECT student_id, target_gpa FROM dashboard_data '
+                                        'WHERE target_gpa IS NOT NULL'))
+        finally:
+            if own_transaction:
+                conn.execute('COMMIT')
+
+        columns.student_ids = student_ids
+        columns.student_names = [student_names.get(student_id) for student_id in student_ids]
+        columns.module_ids = module_ids
+        columns.module_names = [module_names.get(module_id, module_id) for module_id in module_ids]
+        target_gpa = [targets.get(student_id, DEFAULT_TARGET_GPA) for student_id in student_ids]
+        if use_numpy:
+            columns.target_gpa = numpy.array(target_gpa, dtype=numpy.float64)
+            columns.exam_student = numpy.array(exam_student, dtype=numpy.int64)
+            columns.exam_module = numpy.array(exam_module, dtype=numpy.int64)
+            columns.exam_grade = numpy.array(exam_grade, dtype=numpy.int64)
+            columns.deadline_student = numpy.array(deadline_student, dtype=numpy.int64)
+            columns.deadline_week = numpy.array(deadline_week, dtype=numpy.int64)
+        else:
+            columns.target_gpa = array.array('d', target_gpa)
+            columns.exam_student = array.array('q', exam_student)
+            columns.exam_module = array.array('q', exam_module)
+            columns.exam_grade = array.array('q', exam_grade)
+            columns.deadline_student = array.array('q', deadline_student)
+            columns.deadline_week = array.array('q', deadline_week)
+        return columns
+
+
+def read_version(conn):
+    """Gibt (höchste Inhaltsversion, Zeitpunkt der Änderung) der Datenbank zurück."""
+    row = conn.execute('SELECT version, changed FROM content_versions ORDER BY version DESC LIMIT 1').fetchone()
+    return (row[0], row[1]) if row is not None else (0, 0.0)
+
+
+def week_number(date):
+    """Gibt die Woche eines ISO-Datums als Tagesnummer des Montags // 7 zurück (-1 bei ungültigem Datum)."""
+    try:
+        # Tag 1 (1.1.0001) ist ein Montag
+        return (datetime.date.fromisoformat(str(date)[:10]).toordinal() - 1) // 7
+    except ValueError:
+        return -1
+
+
+def week_label(week):
+    """Gibt (ISO-Woche wie '2025-W03', Datum des Montags) einer Wochennummer zurück."""
+    monday = datetime.date.fromordinal(week * 7 + 1)
+    year, number, _ = monday.isocalendar()
+    return f'{year}-W{number:02d}', monday.isoformat()
+
+
+def mean_grade(total, count):
+    """Durchschnitt aus einer Notensumme in Zehnteln, gerundet wie GpaCalculator.calculate()."""
+    return round(int(total) / (10 * int(count)), 2)
+
+
+class CohortAnalytics:
+    """
+    Berechnet jahrgangsweite Kennzahlen und hält sie je Datenstand vor.
+
+    Der Datenstand ist die höchste Inhaltsversion der Datenbank (Tabelle
+    content_versions); sie steigt bei jeder Änderung eines Studenten, auch
+    durch andere Prozesse oder einen Import. Solange sie gleich bleibt,
+    werden weder die Spalten neu geladen noch Kennzahlen neu berechnet.
+
+    Attribute:
+        use_numpy: Ob vektorisiert mit NumPy gerechnet wird
+        loads: Anzahl der bisherigen Ladevorgänge
+    """
+    def __init__(self, connect, use_numpy=None):
+        """
+        Initialisiert die Auswertung.
+
+        Args:
+            connect: Liefert die sqlite3-Verbindung des aufrufenden Threads
+            use_numpy: NumPy verwenden (Standard: wenn installiert)
+        """
+        if use_numpy and numpy is None:
+            raise RuntimeError('NumPy ist nicht installiert')
+        self._connect = connect
+        self.use_numpy = numpy is not None if use_numpy is None else use_numpy
+        self.loads = 0
+        self._columns = None
+        self._results = {}
+        self._lock = threading.Lock()
+
+    def version(self):
+        """Gibt (Datenstand, Zeitpunkt der letzten Änderung) zurück; eine indizierte Abfrage."""
+        return read_version(self._connect())
+
+    def columns(self):
+        """Gibt die Spalten des aktuellen Datenstands zurück und lädt sie bei Bedarf neu."""
+        version = self.version()[0]
+        with self._lock:
+            if self._columns is None or self._columns.version != version:
+                self._columns = CohortColumns.load(self._connect(), self.use_numpy)
+                self._results = {}
+                self.loads += 1
+            return self._columns
+
+    def module_distribution(self):
+        """
+        Notenverteilung je Modul über alle benoteten Prüfungen, nach Modul-ID sortiert.
+
+        Returns:
+            list[dict]: module_id, name, exams, passed, pass_rate, mean und
+            grades (Anzahl je Notenstufe)
+        """
+        return self._cached('modules', self._module_distribution)
+
+    def at_risk(self):
+        """
+        Studenten, deren Notendurchschnitt schlechter (größer) als ihre Ziel-Note ist.
+
+        Der Durchschnitt entspricht GpaCalculator.calculate(). Sortiert nach
+        Abstand zum Ziel, der größte zuerst.
+
+        Returns:
+            list[dict]: student_id, name, gpa, target_gpa, gap und exams
+        """
+        return self._cached('at_risk', self._at_risk)
+
+    def deadline_weeks(self):
+        """
+        Fristen je Kalenderwoche über alle Studenten, nach Woche sortiert.
+
+        Returns:
+            list[dict]: week (ISO-Woche), start (Montag), deadlines, students
+            und max_per_student (meiste Fristen eines Studenten in der Woche)
+        """
+        return self._cached('deadline_weeks', self._deadline_weeks)
+
+    def _cached(self, name, compute):
+        """Gibt ein Ergebnis des aktuellen Datenstands zurück und berechnet es höchstens einmal."""
+        columns = self.columns()
+        key = (name, columns.version)
+        with self._lock:
+            result = self._results.get(key)
+        if result is None:
+            result = compute(columns)
+            with self._lock:
+                if self._columns is columns:
+                    self._results[key] = result
+        return result
+
+    def _module_distribution(self, columns):
+        modules = len(columns.module_ids)
+        steps = len(GRADE_STEPS)
+        if self.use_numpy:
+            module, grade = columns.exam_module, columns.exam_grade
+            bucket = numpy.searchsorted(GRADE_BOUNDS, grade, side='right')
+            counts = numpy.bincount(module * steps + bucket, minlength=modules * steps).reshape(modules, steps)
+            totals = numpy.bincount(module, weights=grade, minlength=modules)
+            passed = numpy.bincount(module[grade <= PASSING_GRADE], minlength=modules)
+            counts, totals, passed = counts.tolist(), totals.tolist(), passed.tolist()
+        else:
+            counts = [[0] * steps for _ in range(modules)]
+            totals = [0] * modules
+            passed = [0] * modules
+            for module, grade in zip(columns.exam_module, columns.exam_grade):
+                counts[module][bisect.bisect_right(GRADE_BOUNDS, grade)] += 1
+                totals[module] += grade
+                if grade <= PASSING_GRADE:
+                    passed[module] += 1
+
+        result = []
+        for index in sorted(range(modules), key=columns.module_ids.__getitem__):
+            exams = sum(counts[index])
+            result.append({
+                'module_id': columns.module_ids[index],
+                'name': columns.module_names[index],
+                'exams': exams,
+                'passed': passed[index],
+                'pass_rate': round(passed[index] / exams, 3),
+                'mean': mean_grade(totals[index], exams),
+                'grades': {f'{step / 10:.1f}': count for step, count in zip(GRADE_STEPS, counts[index])},
+            })
+        return result
+
+    def _at_risk(self, columns):
+        students = len(columns.student_ids)
+        if self.use_numpy:
+            student, grade = columns.exam_student, columns.exam_grade
+            counts = numpy.bincount(student, minlength=students)
+            totals = numpy.bincount(student, weights=grade, minlength=students)
+            with numpy.errstate(divide='ignore', invalid='ignore'):
+                means = totals / (10 * counts)
+            # Vorauswahl vektorisiert; exakt gerundet wird nur für die Kandidaten
+            candidates = numpy.flatnonzero((counts > 0) & (means > columns.target_gpa - 0.01)).tolist()
+            counts, totals = counts.tolist(), totals.tolist()
+        else:
+            counts = [0] * students
+            totals = [0] * students
+            for student, grade in zip(columns.exam_student, columns.exam_grade):
+                counts[student] += 1
+                totals[student] += grade
+            candidates = [index for index in range(students) if counts[index]]
+
+        target = columns.target_gpa.tolist()
+        result = []
+        for index in candidates:
+            gpa = mean_grade(totals[index], counts[index])
+            if gpa > target[index]:
+                result.append({
+                    'student_id': columns.student_ids[index],
+                    'name': columns.student_names[index],
+                    'gpa': gpa,
+                    'target_gpa': target[index],
+                    'gap': round(gpa - target[index], 2),
+                    'exams': int(counts[index]),
+                })
+        result.sort(key=lambda record: (-record['gap'], record['student_id']))
+        return result
+
+    def _deadline_weeks(self, columns):
+        if self.use_numpy:
+            week, student = columns.deadline_week, columns.deadline_student
+            weeks, week_index = numpy.unique(week, return_inverse=True)
+            deadlines = numpy.bincount(week_index, minlength=len(weeks))
+            # Paare (Woche, Student) zählen: verschiedene Studenten und Höchstlast je Woche
+            stride = max(1, len(columns.student_ids))
+            pairs, pair_counts = numpy.unique(week_index * stride + student, return_counts=True)
+            pair_week = pairs // stride
+            students = numpy.bincount(pair_week, minlength=len(weeks))
+            most = numpy.zeros(len(weeks), dtype=numpy.int64)
+            numpy.maximum.at(most, pair_week, pair_counts)
+            rows = zip(weeks.tolist(), deadlines.tolist(), students.tolist(), most.tolist())
+        else:
+            per_student = Counter(zip(columns.deadline_week, columns.deadline_student))
+            deadlines, students, most = Counter(), Counter(), Counter()
+            for (week, _), count in per_student.items():
+                deadlines[week] += count
+                students[week] += 1
+                most[week] = max(most[week], count)
+            rows = ((week, deadlines[week], students[week], most[week]) for week in sorted(deadlines))
+
+        result = []
+        for week, deadline_count, student_count, most_count in rows:
+            label, start = week_label(week)
+            result.append({
+                'week': label,
+                'start': start,
+                'deadlines': deadline_count,
+                'students': student_count,
+                'max_per_student': most_count,
+            })
+        return result
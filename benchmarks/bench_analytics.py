@@ -0,0 +1,113 @@
+"""
+Jahrgangsweite Auswertungen mit NumPy gegenüber reinem Python.
+
+Legt über Database einen synthetischen Jahrgang an (Standard: 5 000
+Studenten mit je 20 Prüfungen und 20 Fristen) und misst für beide
+Rechenwege von CohortAnalytics das Laden der Spalten sowie jede
+Auswertung ohne Zwischenspeicher. Vorab wird geprüft, dass beide Wege
+identische Ergebnisse liefern. Ohne installiertes NumPy wird nur der
+Python-Weg gemessen.
+
+Aufruf:
+    python benchmarks/bench_analytics.py [--students 5000] [--modules 40] [--exams 20] [--repeat 5]
+"""
+import argparse
+import datetime
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import analytics  # noqa: E402
+from analytics import CohortAnalytics, CohortColumns  # noqa: E402
+from dashboard import Database, Module, Student, StudyCourse  # noqa: E402
+
+GRADES = (1.0, 1.3, 1.7, 2.0, 2.3, 2.7, 3.0, 3.3, 3.7, 4.0, 5.0, None)
+DEADLINE_TYPES = ('Prüfung', 'Abgabe', 'Projekt')
+
+
+def build_cohort(db, students, modules, exams, seed=42):
+    """Speichert einen reproduzierbaren Jahrgang in einer einzigen Transaktion."""
+    rng = random.Random(seed)
+    course = StudyCourse('Benchmark-Studiengang', 'BENCH', 6)
+    for m in range(modules):
+        course.add_module(Module(f'Modul {m}', f'M{m:04d}', 5))
+    first_day = datetime.date(2025, 1, 1)
+    with db.transaction():
+        for s in range(students):
+            student = Student(f'Student {s}', f'S{s:06d}', course)
+            db.save_student(student)
+            db.save_dashboard_data(student.student_id, {
+                'gpa': None, 'target_gpa': rng.choice((1.7, 2.0, 2.5, 3.0)), 'target_end_date': '2028-01-01',
+                'avg_module_time': 45, 'target_module_time': 60})
+            db.save_exams(student.student_id, [(rng.choice(course.modules).module_id, k % 6 + 1, 2020 + k // 2,
+                                                rng.choice(GRADES)) for k in range(exams)])
+            for _ in range(exams):
+                date = first_day + datetime.timedelta(days=rng.randrange(365))
+                db.save_deadline(student.student_id, rng.choice(DEADLINE_TYPES),
+                                 rng.choice(course.modules).name, date.isoformat())
+
+
+def timed(function, repeat):
+    """Gibt den Median der Laufzeit von function() in Millisekunden zurück."""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        durations.append((time.perf_counter() - start) * 1000)
+    return statistics.median(durations)
+
+
+def measure(db, use_numpy, repeat):
+    """Misst Laden und Auswertungen eines Rechenwegs; gibt (Zeiten, Ergebnisse) zurück."""
+    engine = CohortAnalytics(db.connection, use_numpy=use_numpy)
+    columns = engine.columns()
+    cases = {
+        'Spalten laden': lambda: CohortColumns.load(db.connection(), use_numpy),
+        'Notenverteilung': lambda: engine._module_distribution(columns),
+        'Gefährdete': lambda: engine._at_risk(columns),
+        'Fristen je Woche': lambda: engine._deadline_weeks(columns),
+    }
+    times = {name: timed(case, repeat) for name, case in cases.items()}
+    results = (engine.module_distribution(), engine.at_risk(), engine.deadline_weeks())
+    return times, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--students', type=int, default=5000, help='Anzahl Studenten')
+    parser.add_argument('--modules', type=int, default=40, help='Module des Studiengangs')
+    parser.add_argument('--exams', type=int, default=20, help='Prüfungen und Fristen je Student')
+    parser.add_argument('--repeat', type=int, default=5, help='Wiederholungen je Messung')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(os.path.join(tmp, 'bench.db'))
+        start = time.perf_counter()
+        build_cohort(db, args.students, args.modules, args.exams)
+        print(f"Jahrgang: {args.students:,} Studenten, {args.students * args.exams:,} Prüfungen und Fristen "
+              f"in {time.perf_counter() - start:.1f} s\n")
+
+        python_times, python_results = measure(db, False, args.repeat)
+        numpy_times = None
+        if analytics.numpy is not None:
+            numpy_times, numpy_results = measure(db, True, args.repeat)
+            if numpy_results != python_results:
+                raise SystemExit('NumPy und Python liefern unterschiedliche Ergebnisse')
+        db.close()
+
+    print(f"{'Messung':20}{'Python (ms)':>14}{'NumPy (ms)':>14}{'Faktor':>10}")
+    for name, python_ms in python_times.items():
+        if numpy_times is None:
+            print(f"{name:20}{python_ms:>14.1f}{'-':>14}{'-':>10}")
+        else:
+            numpy_ms = numpy_times[name]
+            print(f"{name:20}{python_ms:>14.1f}{numpy_ms:>14.1f}{python_ms / numpy_ms:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark für die Datenbankschicht: Abfragen pro Sekunde vorher/nachher.
+
+"Vorher" entspricht dem ursprünglichen Verhalten (eine neue Verbindung pro
+Abfrage, Standard-Journal), "nachher" dem ConnectionPool mit langlebigen
+Verbindungen, WAL und abgestimmten Pragmas.
+
+Aufruf:
+    python benchmarks/bench_database.py [--queries 2000]
+"""
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dashboard import ConnectionPool, Database  # noqa: E402
+
+
+class UnpooledConnections(ConnectionPool):
+    """
+    Bildet das alte Verhalten nach: jede Abfrage öffnet eine eigene Verbindung.
+
+    Transaktionen und after_commit() stammen vom ConnectionPool; innerhalb
+    einer Transaktion wird deren Verbindung weiterverwendet. Pragmas werden
+    keine gesetzt, es gelten die Standardwerte von SQLite.
+    """
+    PRAGMAS = ()
+
+    def connection(self):
+        local = self._local
+        if not getattr(local, 'depth', 0):
+            local.conn = sqlite3.connect(self.db_name)
+        return local.conn
+
+
+def run_workload(db, queries):
+    """Führt eine gemischte Lese-/Schreiblast aus und gibt (Lese-QPS, Schreib-QPS) zurück."""
+    student_id = 'BENCH-1'
+    db.save_dashboard_data(student_id, {'gpa': 2.0, 'target_gpa': 2.5, 'target_end_date': '2027-01-01',
+                                        'avg_module_time': 45, 'target_module_time': 60})
+    for i in range(20):
+        db.save_deadline(student_id, 'Prüfung', f'Modul {i}', f'2027-01-{i + 1:02d}')
+
+    start = time.perf_counter()
+    for _ in range(queries):
+        db.get_deadlines(student_id)
+        db.get_completed_modules(student_id)
+    read_qps = 2 * queries / (time.perf_counter() - start)
+
+    writes = max(queries // 10, 1)
+    start = time.perf_counter()
+    for i in range(writes):
+        db.update_target_gpa(student_id, 2.0 + (i % 10) / 10)
+    write_qps = writes / (time.perf_counter() - start)
+    return read_qps, write_qps
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--queries', type=int, default=2000, help='Anzahl Leseiterationen')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy = Database(os.path.join(tmp, 'legacy.db'))
+        legacy.close()
+        legacy._pool = UnpooledConnections(legacy.db_name)
+        # Ohne Pool läuft die Datei mit dem Standard-Journal, wie vor der Umstellung
+        with sqlite3.connect(legacy.db_name) as conn:
+            conn.execute('PRAGMA journal_mode = DELETE')
+        before = run_workload(legacy, args.queries)
+
+        pooled = Database(os.path.join(tmp, 'pooled.db'))
+        after = run_workload(pooled, args.queries)
+        pooled.close()
+
+    print(f"{'':12}{'Lesen (q/s)':>16}{'Schreiben (q/s)':>18}")
+    print(f"{'vorher':12}{before[0]:>16,.0f}{before[1]:>18,.0f}")
+    print(f"{'nachher':12}{after[0]:>16,.0f}{after[1]:>18,.0f}")
+    print(f"{'Faktor':12}{after[0] / before[0]:>16.1f}{after[1] / before[1]:>18.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark für Batch-Schreibzugriffe und den Jahrgangsimport.
+
+Misst das Speichern von Modulabschlüssen einzeln (eine Transaktion je
+Abschluss) gegenüber executemany in einer Transaktion sowie den Durchsatz
+des BulkImporter für synthetische CSV/JSONL-Dateien.
+
+Aufruf:
+    python benchmarks/bench_import.py [--students 2000] [--modules 30]
+"""
+import argparse
+import csv
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dashboard import BulkImporter, Database  # noqa: E402
+
+
+def write_cohort(directory, students, modules):
+    """Erzeugt Modul-, Studenten- und Prüfungsdateien und gibt deren Pfade zurück."""
+    paths = {kind: os.path.join(directory, f'{kind}.{ext}')
+             for kind, ext in (('modules', 'csv'), ('students', 'csv'), ('exams', 'jsonl'))}
+    rng = random.Random(42)
+    with open(paths['modules'], 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['course_id', 'course_name', 'duration_semesters', 'module_id', 'name', 'credits', 'position'])
+        for m in range(modules):
+            writer.writerow(['BENCH', 'Benchmark', 6, f'M{m:04d}', f'Modul {m}', 5, m])
+    with open(paths['students'], 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['student_id', 'name', 'course_id', 'target_gpa'])
+        for s in range(students):
+            writer.writerow([f'S{s:06d}', f'Student {s}', 'BENCH', 2.5])
+    with open(paths['exams'], 'w', encoding='utf-8') as f:
+        for s in range(students):
+            for m in range(modules):
+                f.write(json.dumps({'student_id': f'S{s:06d}', 'module_id': f'M{m:04d}',
+                                    'grade': round(rng.uniform(1.0, 5.0), 1), 'date': '2025-01-15'}) + '\n')
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--students', type=int, default=2000, help='Anzahl Studenten')
+    parser.add_argument('--modules', type=int, default=30, help='Module je Studiengang')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(os.path.join(tmp, 'bench.db'))
+        completions = [(f'M{m:04d}', 2.0, '2025-01-15') for m in range(args.modules)]
+
+        start = time.perf_counter()
+        for module_id, grade, date in completions:
+            db.save_module_completion('SINGLE', module_id, grade, date)
+        single = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with db.transaction():
+            db.save_module_completions('BATCH', completions)
+        batch = time.perf_counter() - start
+        print(f"{args.modules} Abschlüsse einzeln: {single * 1000:.1f} ms, gebündelt: {batch * 1000:.1f} ms")
+
+        paths = write_cohort(tmp, args.students, args.modules)
+        importer = BulkImporter(db)
+        for kind in ('modules', 'students', 'exams'):
+            start = time.perf_counter()
+            count = importer.import_file(kind, paths[kind])
+            elapsed = time.perf_counter() - start
+            print(f"Import {kind:9}: {count:>9,} Zeilen, {count / elapsed:>10,.0f} Zeilen/s")
+        db.close()
+
+
+if __name__ == '__main__':
+    main()
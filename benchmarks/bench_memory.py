@@ -0,0 +1,105 @@
+"""
+Speicherbedarf von Prüfungen großer Jahrgänge, gemessen mit tracemalloc.
+
+Vergleicht für n Prüfungen (Standard: 100 000)
+- das frühere Objektmodell (Exam mit __dict__, eigenes Semester je Prüfung),
+- Exam-Objekte mit __slots__ und geteilten Semester-Flyweights,
+- den spaltenweisen ExamStore eines Dashboards einschließlich der
+  laufenden Kennzahlen.
+
+Aufruf:
+    python benchmarks/bench_memory.py [--exams 100000] [--modules 40]
+"""
+import argparse
+import gc
+import os
+import random
+import sys
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dashboard import Dashboard, Database, Exam, Module, Semester, Student, StudyCourse  # noqa: E402
+
+GRADES = (1.0, 1.3, 1.7, 2.0, 2.3, 2.7, 3.0, 3.3, 3.7, 4.0, 5.0, None)
+
+
+class LegacySemester:
+    """Bildet das alte Semester nach: ein eigenes Objekt mit __dict__."""
+    def __init__(self, number, year):
+        self.number = number
+        self.year = year
+
+
+class LegacyExam:
+    """Bildet die alte Prüfung nach: ein Objekt mit __dict__ je Prüfung."""
+    def __init__(self, module, student, semester, grade=None):
+        self.module = module
+        self.student = student
+        self.semester = semester
+        self.grade = grade
+
+
+def synthetic_rows(course, count, seed=42):
+    """Erzeugt reproduzierbare (Modul, Semesternummer, Jahr, Note)-Tupel."""
+    rng = random.Random(seed)
+    return [(rng.choice(course.modules), rng.randint(1, 6), rng.randint(2018, 2025), rng.choice(GRADES))
+            for _ in range(count)]
+
+
+def traced(build):
+    """Gibt den von build() belegten Speicher in Bytes zurück (Ergebnis bleibt bis zur Messung erhalten)."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del result
+    return used
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--exams', type=int, default=100000, help='Anzahl der Prüfungen')
+    parser.add_argument('--modules', type=int, default=40, help='Module des Studiengangs')
+    args = parser.parse_args()
+
+    course = StudyCourse('Benchmark', 'BENCH', 6)
+    for m in range(args.modules):
+        course.add_module(Module(f'Modul {m}', f'M{m:04d}', 5))
+    student = Student('Benchmark', 'S-MEM', course)
+    rows = synthetic_rows(course, args.exams)
+    # Semester-Flyweights vorab anlegen, damit nur die Ablage der Prüfungen zählt
+    for number in range(1, 7):
+        for year in range(2018, 2026):
+            Semester(number, year)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(os.path.join(tmp, 'bench.db'))
+
+        def store():
+            dashboard = Dashboard(student, db=db)
+            dashboard.add_exams((module, Semester(number, year), grade) for module, number, year, grade in rows)
+            return dashboard
+
+        results = {
+            'Objekte (alt)': traced(lambda: [LegacyExam(module, student, LegacySemester(number, year), grade)
+                                             for module, number, year, grade in rows]),
+            'Objekte (__slots__)': traced(lambda: [Exam(module, student, Semester(number, year), grade)
+                                                   for module, number, year, grade in rows]),
+            'ExamStore': traced(store),
+        }
+        db.close()
+
+    baseline = results['Objekte (alt)']
+    print(f"{args.exams:,} Prüfungen")
+    print(f"{'Variante':22}{'Speicher (MB)':>15}{'Byte/Prüfung':>15}{'Anteil':>10}")
+    for name, used in results.items():
+        print(f"{name:22}{used / 1e6:>15.2f}{used / args.exams:>15.1f}{used / baseline:>10.0%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark für die Aufteilung in abgeschlossene und verbleibende Module.
+
+Vergleicht die frühere Listen-Variante ([m for m in total if m not in
+completed], O(n·m)) mit dem Modulindex von StudyCourse und der
+Mengen-Sicht der bestandenen Module (linear) für große Studiengänge.
+
+Aufruf:
+    python benchmarks/bench_modules.py [--sizes 1000 5000 20000] [--legacy-limit 5000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dashboard import Dashboard, Database, Exam, Module, Semester, Student, StudyCourse  # noqa: E402
+
+
+def build_dashboard(db, size):
+    """Erzeugt ein Dashboard mit size Modulen, von denen die Hälfte bestanden ist."""
+    course = StudyCourse('Benchmark', f'BENCH-{size}', 6)
+    for i in range(size):
+        course.add_module(Module(f'Modul {i}', f'M{i:06d}', 5))
+    student = Student('Benchmark', f'S-{size}', course)
+    dashboard = Dashboard(student, db=db)
+    semester = Semester(1, 2025)
+    for module in course.modules[::2]:
+        dashboard.add_exam(Exam(module, student, semester, 2.0))
+    return dashboard
+
+
+def timed(function, repeat=3):
+    """Gibt die beste Laufzeit aus repeat Durchläufen in Millisekunden zurück."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 5000, 20000], help='Anzahl Module')
+    parser.add_argument('--legacy-limit', type=int, default=5000, help='Listen-Variante nur bis zu dieser Größe')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(os.path.join(tmp, 'bench.db'))
+        print(f"{'Module':>8}{'Liste (ms)':>14}{'Index (ms)':>14}{'Credits (ms)':>14}")
+        for size in args.sizes:
+            dashboard = build_dashboard(db, size)
+            total = dashboard.student.study_course.modules
+            completed = dashboard.get_completed_modules()
+
+            legacy = '-'
+            if size <= args.legacy_limit:
+                legacy = f"{timed(lambda: [m for m in total if m not in completed], repeat=1):.1f}"
+            indexed = timed(dashboard.get_remaining_modules)
+            credits = timed(lambda: (dashboard.get_completed_credits(),
+                                     dashboard.student.study_course.total_credits))
+            print(f"{size:>8}{legacy:>14}{indexed:>14.2f}{credits:>14.4f}")
+        db.close()
+
+
+if __name__ == '__main__':
+    main()
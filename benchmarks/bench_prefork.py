@@ -0,0 +1,129 @@
+"""
+Skalierung des Modus prefork mit der Anzahl der Worker-Prozesse.
+
+Legt in einem temporären Verzeichnis die Testdaten an, startet für jede
+Prozessanzahl ``python dashboard.py serve --mode prefork`` als eigenen
+Prozess und belastet die Dashboard-Seite mit Clients in separaten
+Prozessen (damit der Lastgenerator nicht selbst an der GIL hängt). Zum
+Vergleich wird der Modus threaded gemessen. Ausgegeben werden Durchsatz,
+p50/p99-Latenz und die Beschleunigung gegenüber einem Prozess.
+
+Clients und Server teilen sich die Kerne des Rechners; der Durchsatz
+kann daher höchstens bis etwa zur halben Kernzahl linear steigen.
+
+Aufruf:
+    python benchmarks/bench_prefork.py [--processes 1 2 4] [--clients 8] [--duration 5]
+"""
+import argparse
+import http.client
+import multiprocessing
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT = os.path.join(ROOT, 'dashboard.py')
+
+
+def free_port():
+    """Gibt einen aktuell freien TCP-Port zurück."""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def wait_ready(port, timeout=30):
+    """Wartet, bis der Server auf GET / antwortet."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=timeout)
+            conn.request('GET', '/')
+            conn.getresponse().read()
+            conn.close()
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError('Server hat nicht rechtzeitig geantwortet')
+
+
+def client(port, path, duration):
+    """Sendet bis zum Ablauf der Messdauer Anfragen und gibt (Latenzen, Fehler) zurück."""
+    latencies, errors = [], 0
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+            conn.request('GET', path)
+            response = conn.getresponse()
+            response.read()
+            conn.close()
+            if response.status != 200:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - start)
+        except OSError:
+            errors += 1
+    return latencies, errors
+
+
+def run(db_path, mode, processes, args):
+    """Misst einen Server-Aufbau und gibt (Durchsatz, p50, p99, Fehler) zurück."""
+    port = free_port()
+    command = [sys.executable, SCRIPT, 'serve', '--mode', mode, '--port', str(port),
+               '--db', db_path, '--workers', str(args.workers)]
+    if mode == 'prefork':
+        command += ['--processes', str(processes)]
+    server = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_ready(port)
+        with multiprocessing.Pool(args.clients) as pool:
+            start = time.perf_counter()
+            results = pool.starmap(client, [(port, args.path, args.duration)] * args.clients)
+            elapsed = time.perf_counter() - start
+    finally:
+        server.terminate()
+        server.wait()
+
+    latencies = sorted(latency for part, _ in results for latency in part)
+    errors = sum(count for _, count in results)
+    if not latencies:
+        return 0.0, 0.0, 0.0, errors
+    p50 = latencies[int(len(latencies) * 0.50)]
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    return len(latencies) / elapsed, p50, p99, errors
+
+
+def main():
+    cores = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--processes', type=int, nargs='+',
+                        default=sorted({1, 2, max(1, cores // 2), cores}), help='Zu messende Prozessanzahlen')
+    parser.add_argument('--clients', type=int, default=max(4, cores), help='Client-Prozesse')
+    parser.add_argument('--workers', type=int, default=8, help='Worker-Threads je Server-Prozess')
+    parser.add_argument('--duration', type=float, default=5.0, help='Messdauer je Aufbau in Sekunden')
+    parser.add_argument('--path', default='/', help='Abgefragter Pfad')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'bench.db')
+        subprocess.run([sys.executable, SCRIPT, 'seed', '--db', db_path], check=True, stdout=subprocess.DEVNULL)
+
+        print(f"{cores} Kerne, {args.clients} Client-Prozesse, {args.duration:g} s je Messung\n")
+        print(f"{'Aufbau':16}{'Anfragen/s':>12}{'p50 (ms)':>10}{'p99 (ms)':>10}{'Fehler':>8}{'Faktor':>8}")
+        throughput, p50, p99, errors = run(db_path, 'threaded', 1, args)
+        print(f"{'threaded':16}{throughput:>12,.0f}{p50 * 1000:>10.1f}{p99 * 1000:>10.1f}{errors:>8}{'':>8}")
+        single = None
+        for processes in args.processes:
+            throughput, p50, p99, errors = run(db_path, 'prefork', processes, args)
+            single = single or throughput
+            print(f"{f'prefork × {processes}':16}{throughput:>12,.0f}{p50 * 1000:>10.1f}{p99 * 1000:>10.1f}"
+                  f"{errors:>8}{throughput / single if single else 0:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmark für den Programmstart: Import-Zeit und Zeit bis zum ersten Byte.
+
+Misst in frischen Prozessen, wie lange ``import dashboard`` dauert und wie
+lange es vom Start von ``python dashboard.py serve`` bis zum ersten Byte
+der Antwort auf GET / vergeht. Die Datenbank wird vorher einmalig mit
+``seed`` in einem temporären Verzeichnis angelegt. Mit --max-import-ms bzw.
+--max-ttfb-ms endet das Skript mit Exit-Code 1, wenn der Median die
+Grenze überschreitet (Schutz vor Regressionen).
+
+Aufruf:
+    python benchmarks/bench_startup.py [--runs 5] [--max-import-ms 300] [--max-ttfb-ms 1500]
+"""
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT = os.path.join(ROOT, 'dashboard.py')
+
+IMPORT_PROBE = (
+    "import sys, time\n"
+    "sys.path.insert(0, {root!r})\n"
+    "start = time.perf_counter()\n"
+    "import dashboard\n"
+    "elapsed = time.perf_counter() - start\n"
+    "assert dashboard._database is None and dashboard._registry is None, 'Import mit Seiteneffekten'\n"
+    "print(elapsed)\n"
+)
+
+
+def measure_import():
+    """Gibt die Import-Zeit in einem frischen Prozess in Millisekunden zurück."""
+    output = subprocess.run([sys.executable, '-c', IMPORT_PROBE.format(root=ROOT)],
+                            check=True, capture_output=True, text=True).stdout
+    return float(output) * 1000
+
+
+def free_port():
+    """Gibt einen aktuell freien TCP-Port zurück."""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def measure_ttfb(db_path, timeout=30):
+    """Startet den Server und gibt die Zeit bis zum ersten Antwortbyte in Millisekunden zurück."""
+    port = free_port()
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, SCRIPT, 'serve', '--port', str(port), '--db', db_path],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        while time.perf_counter() - start < timeout:
+            try:
+                with socket.create_connection(('127.0.0.1', port), timeout=timeout) as sock:
+                    sock.sendall(b'GET / HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n')
+                    if sock.recv(1):
+                        return (time.perf_counter() - start) * 1000
+            except OSError:
+                time.sleep(0.005)
+        raise RuntimeError('Server hat nicht rechtzeitig geantwortet')
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=5, help='Messungen je Kennzahl')
+    parser.add_argument('--max-import-ms', type=float, help='Obergrenze für den Median der Import-Zeit')
+    parser.add_argument('--max-ttfb-ms', type=float, help='Obergrenze für den Median der Zeit bis zum ersten Byte')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'bench.db')
+        subprocess.run([sys.executable, SCRIPT, 'seed', '--db', db_path], check=True, stdout=subprocess.DEVNULL)
+
+        results = {
+            'Import': ([measure_import() for _ in range(args.runs)], args.max_import_ms),
+            'Erstes Byte': ([measure_ttfb(db_path) for _ in range(args.runs)], args.max_ttfb_ms),
+        }
+
+    failed = False
+    print(f"{'Kennzahl':14}{'Median (ms)':>14}{'Min (ms)':>12}{'Max (ms)':>12}{'Grenze':>10}")
+    for name, (values, limit) in results.items():
+        median = statistics.median(values)
+        exceeded = limit is not None and median > limit
+        failed = failed or exceeded
+        print(f"{name:14}{median:>14.1f}{min(values):>12.1f}{max(values):>12.1f}"
+              f"{'-' if limit is None else f'{limit:.0f}':>10}{'  ÜBERSCHRITTEN' if exceeded else ''}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,332 @@
+"""
+Reproduzierbare Benchmark-Suite für den gesamten Dashboard-Stack.
+
+Erzeugt einen synthetischen Jahrgang (N Studenten × M Module × K Prüfungen
+und Fristen) über StudyCourse, Student, Exam und Dashboard, misst
+Mikro-Benchmarks (GpaCalculator.calculate, DeadlineManager.reload, das
+Rendern von /, jede Database-Methode) und einen Lasttest über HTTP gegen
+Server auf localhost. Die Ergebnisse werden als JSON geschrieben; mit
+--baseline wird gegen einen früheren Lauf verglichen und bei einer
+Verschlechterung über --threshold mit Exit-Code 1 beendet.
+
+Aufruf:
+    python benchmarks/bench_suite.py [--students 200] [--modules 30] [--exams 10]
+                                     [--output ergebnis.json] [--baseline alt.json] [--threshold 0.2]
+"""
+import argparse
+import datetime
+import http.client
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dashboard  # noqa: E402
+from analytics import CohortColumns  # noqa: E402
+from dashboard import Dashboard, Database, Exam, Module, Semester, Student, StudyCourse  # noqa: E402
+
+GRADES = (1.0, 1.3, 1.7, 2.0, 2.3, 2.7, 3.0, 3.3, 3.7, 4.0, 5.0)
+DEADLINE_TYPES = ('Prüfung', 'Abgabe', 'Projekt')
+
+
+def build_cohort(db, students, modules, exams, seed):
+    """
+    Legt einen synthetischen Jahrgang an und speichert ihn in db.
+
+    Returns:
+        list: Die Dashboards aller Studenten
+    """
+    rng = random.Random(seed)
+    course = StudyCourse('Benchmark-Studiengang', 'BENCH', 6)
+    for m in range(modules):
+        course.add_module(Module(f'Modul {m}', f'M{m:04d}', rng.choice((5, 5, 5, 10))))
+
+    dashboards = []
+    for s in range(students):
+        student = Student(f'Student {s}', f'S{s:06d}', course)
+        dashboard_ = Dashboard(student, target_gpa=rng.choice((1.7, 2.0, 2.5, 3.0)), db=db)
+        for k in range(exams):
+            semester = Semester(k % 6 + 1, 2020 + k // 2)
+            dashboard_.add_exam(Exam(rng.choice(course.modules), student, semester, rng.choice(GRADES)))
+        with dashboard_.transaction():
+            for k in range(exams):
+                date = datetime.date(2025, 1, 1) + datetime.timedelta(days=rng.randrange(365))
+                dashboard_.add_deadline(rng.choice(DEADLINE_TYPES), rng.choice(course.modules).name, date.isoformat())
+        dashboard_.save_data()
+        dashboards.append(dashboard_)
+    return dashboards
+
+
+def measure(function, repeat):
+    """Gibt Median und Minimum der Laufzeit je Aufruf in Mikrosekunden zurück."""
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    per_call = [total / number * 1e6 for total in timer.repeat(repeat, number)]
+    return {'unit': 'us', 'better': 'lower', 'median': statistics.median(per_call),
+            'min': min(per_call), 'number': number}
+
+
+def database_cases(db, dashboard_):
+    """Ordnet jeder öffentlichen Database-Methode einen repräsentativen Aufruf zu."""
+    student = dashboard_.student
+    student_id = student.student_id
+    course_id = student.study_course.course_id
+    module_id = student.study_course.modules[0].module_id
+    data = {'gpa': 2.0, 'target_gpa': 2.5, 'target_end_date': '2028-01-01',
+            'avg_module_time': 45, 'target_module_time': 60}
+    now = datetime.datetime.now().isoformat()
+    completions = [(module.module_id, 2.0, now) for module in student.study_course.modules[:10]]
+    exam_id = db.get_exams(student_id)[0][0]
+
+    def claim_reminder():
+        deadline_id = db.save_deadline(student_id, 'Abgabe', 'Benchmark', '2025-06-01')
+        db.claim_reminder(deadline_id)
+        db.delete_deadline(deadline_id)
+
+    backup_path = os.path.join(os.path.dirname(db.db_name), 'bench-backup.db')
+    snapshot = list(db.export_rows())
+
+    return {
+        'init_database': db.init_database,
+        'save_dashboard_data': lambda: db.save_dashboard_data(student_id, data),
+        'update_target_gpa': lambda: db.update_target_gpa(student_id, 2.5),
+        'update_target_end_date': lambda: db.update_target_end_date(student_id, '2028-01-01'),
+        # Einfügen und Löschen zusammen, damit die Tabelle nicht wächst
+        'save_deadline+delete_deadline': lambda: db.delete_deadline(
+            db.save_deadline(student_id, 'Abgabe', 'Benchmark', '2025-06-01')),
+        'save_module_completion': lambda: db.save_module_completion(student_id, module_id, 2.0, now),
+        'save_module_completions': lambda: db.save_module_completions(student_id, completions),
+        'get_completed_modules': lambda: db.get_completed_modules(student_id),
+        # Nur Noten ändern, damit die Tabelle nicht wächst
+        'save_exams': lambda: db.save_exams(student_id, grades=[(exam_id, 2.0)]),
+        'get_exams': lambda: db.get_exams(student_id),
+        'get_exam_statistics': lambda: db.get_exam_statistics(student_id),
+        'poll_changes': db.poll_changes,
+        'get_deadlines': lambda: db.get_deadlines(student_id),
+        # Startladung des ReminderScheduler über alle Studenten
+        'get_pending_reminders': lambda: db.get_pending_reminders('2025-01-01'),
+        'save_deadline+claim_reminder+delete_deadline': claim_reminder,
+        'save_student': lambda: db.save_student(student),
+        'get_student': lambda: db.get_student(student_id),
+        'get_first_student_id': db.get_first_student_id,
+        'get_course': lambda: db.get_course(course_id),
+        'get_course_modules': lambda: db.get_course_modules(course_id),
+        'get_dashboard_data': lambda: db.get_dashboard_data(student_id),
+        # Ohne Pause zwischen den Schritten, gemessen wird nur das Kopieren
+        'backup': lambda: db.backup(backup_path, pause=0),
+        'export_rows': lambda: sum(1 for _ in db.export_rows()),
+        # Überschreibt den Jahrgang mit seinem eigenen Export
+        'import_rows': lambda: db.import_rows(snapshot),
+    }
+
+
+def run_micro(db, dashboards, repeat):
+    """Führt die Mikro-Benchmarks aus und gibt die Ergebnisse nach Namen zurück."""
+    results = {}
+    dashboard_ = dashboards[len(dashboards) // 2]
+    deadline_manager = dashboard_.deadline_manager
+
+    def render_cold():
+        dashboard.render_completed_modules_html.cache_clear()
+        dashboard.render_remaining_modules_html.cache_clear()
+        dashboard.render_deadlines_html.cache_clear()
+        dashboard.render_dashboard_html(dashboard_)
+
+    # 100 Event-Streams desselben Studenten, ohne Event-Loop (nur Einreihen)
+    bus = dashboard.EventBus(lambda student_id: None)
+    for _ in range(100):
+        bus.subscribe('bench')
+
+    # Heap des ReminderScheduler mit einer Frist je Student und Woche (ohne Thread)
+    reminders = dashboard.ReminderScheduler(db, [])
+    for index, row in enumerate(db.get_pending_reminders('2025-01-01')):
+        reminders.add(index, row[1], row[2], row[3], '2099-01-01')
+
+    def add_discard_reminder():
+        reminders.add(-1, 'bench', 'Abgabe', 'Modul', '2099-01-01')
+        reminders.discard(-1)
+
+    # Token-Bucket eines Clients, der nie an die Grenze stößt
+    admission = dashboard.AdmissionControl(rate=1e9, burst=1e9)
+
+    # Jahrgangsweite Auswertungen ohne Zwischenspeicher (der Rechenweg hängt davon ab, ob NumPy installiert ist)
+    analytics = dashboard.get_analytics()
+    columns = analytics.columns()
+
+    cases = {
+        'gpa.calculate': dashboard_.gpa_calculator.calculate,
+        'gpa.calculate_full': lambda: dashboard_.gpa_calculator.calculate(dashboard_.exams),
+        'gpa.calculate_weighted': dashboard_.gpa_calculator.calculate_weighted,
+        'gpa.statistics_sql': dashboard_.exam_repository.statistics,
+        'exams.reload_unchanged': dashboard_.reload_exams,
+        'progress.avg_module_time': dashboard_.calculate_avg_module_time,
+        'progress.projected_end_date': dashboard_.calculate_projected_end_date,
+        'deadlines.reload': lambda: deadline_manager.reload(force=True),
+        'deadlines.reload_unchanged': deadline_manager.reload,
+        'render.dashboard': lambda: dashboard.render_dashboard_html(dashboard_),
+        'render.dashboard_cold': render_cold,
+        'events.publish_100': lambda: bus.publish('bench', 'target_gpa', '{"target_gpa": 2.0}'),
+        'reminders.add+discard': add_discard_reminder,
+        'admission.admit': lambda: admission.admit('127.0.0.1'),
+        'analytics.load': lambda: CohortColumns.load(db.connection(), analytics.use_numpy),
+        'analytics.modules': lambda: analytics._module_distribution(columns),
+        'analytics.at_risk': lambda: analytics._at_risk(columns),
+        'analytics.deadline_weeks': lambda: analytics._deadline_weeks(columns),
+    }
+    cases.update({f'db.{name}': case for name, case in database_cases(db, dashboard_).items()})
+
+    skipped = {'close', 'transaction', 'after_commit', 'add_change_listener', 'connection'}
+    public = {name for name, value in vars(Database).items() if callable(value) and not name.startswith('_')}
+    covered = {part for name in cases if name.startswith('db.') for part in name[3:].split('+')}
+    for name in sorted(public - covered - skipped):
+        print(f"Hinweis: Database.{name} wird nicht gemessen")
+
+    for name, case in cases.items():
+        results[name] = measure(case, repeat)
+        print(f"{name:36}{results[name]['median']:>12.1f} µs")
+    return results
+
+
+def http_client(port, paths, requests, latencies, errors, seed):
+    """Sendet Anfragen über eine Verbindung je Anfrage und sammelt die Latenzen."""
+    rng = random.Random(seed)
+    for _ in range(requests):
+        start = time.perf_counter()
+        try:
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+            conn.request('GET', rng.choice(paths))
+            response = conn.getresponse()
+            response.read()
+            conn.close()
+            if response.status != 200:
+                errors.append(response.status)
+            latencies.append(time.perf_counter() - start)
+        except OSError:
+            errors.append(0)
+
+
+def run_http(dashboards, args):
+    """Misst Durchsatz und Latenz je Server-Modus und gibt die Ergebnisse zurück."""
+    results = {}
+    paths = [f'/students/{d.student.student_id}' for d in dashboards]
+    dashboard.DashboardHandler.log_message = lambda *a: None
+    for mode in args.modes:
+        server = dashboard.Server(port=0, mode=mode, workers=args.workers)
+        httpd = server.create_httpd()
+        thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+        thread.start()
+
+        latencies, errors = [], []
+        clients = [threading.Thread(target=http_client,
+                                    args=(server.port, paths, args.requests, latencies, errors, args.seed + i))
+                   for i in range(args.clients)]
+        start = time.perf_counter()
+        for client in clients:
+            client.start()
+        for client in clients:
+            client.join()
+        elapsed = time.perf_counter() - start
+
+        server.stop()
+        thread.join()
+        httpd.server_close()
+
+        latencies.sort()
+        p50 = latencies[int(len(latencies) * 0.50)] * 1000 if latencies else 0.0
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000 if latencies else 0.0
+        results[f'http.{mode}.throughput'] = {'unit': 'req/s', 'better': 'higher', 'median': len(latencies) / elapsed}
+        results[f'http.{mode}.p50'] = {'unit': 'ms', 'better': 'lower', 'median': p50}
+        results[f'http.{mode}.p99'] = {'unit': 'ms', 'better': 'lower', 'median': p99}
+        results[f'http.{mode}.errors'] = {'unit': 'count', 'better': 'lower', 'median': len(errors)}
+        print(f"http {mode:10}{len(latencies) / elapsed:>10,.0f} req/s   p50 {p50:.1f} ms   p99 {p99:.1f} ms"
+              f"   Fehler {len(errors)}")
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    Vergleicht die Mediane mit einem früheren Lauf.
+
+    Returns:
+        list: (Name, alter Wert, neuer Wert, relative Verschlechterung) aller Regressionen
+    """
+    regressions = []
+    for name, result in results.items():
+        old = baseline.get('results', {}).get(name)
+        if old is None or not old['median']:
+            continue
+        change = (result['median'] - old['median']) / old['median']
+        if result['better'] == 'higher':
+            change = -change
+        if change > threshold:
+            regressions.append((name, old['median'], result['median'], change))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--students', type=int, default=200, help='Anzahl Studenten (N)')
+    parser.add_argument('--modules', type=int, default=30, help='Module des Studiengangs (M)')
+    parser.add_argument('--exams', type=int, default=10, help='Prüfungen und Fristen je Student (K)')
+    parser.add_argument('--seed', type=int, default=42, help='Startwert des Zufallsgenerators')
+    parser.add_argument('--repeat', type=int, default=5, help='Wiederholungen je Mikro-Benchmark')
+    parser.add_argument('--clients', type=int, default=8, help='Parallele HTTP-Clients')
+    parser.add_argument('--requests', type=int, default=100, help='Anfragen pro Client')
+    parser.add_argument('--workers', type=int, default=8, help='Worker-Threads des Servers')
+    parser.add_argument('--modes', nargs='+', choices=dashboard.Server.MODES, default=list(dashboard.Server.MODES))
+    parser.add_argument('--skip-http', action='store_true', help='Keinen HTTP-Lasttest ausführen')
+    parser.add_argument('--output', help='Ergebnisse als JSON in diese Datei schreiben')
+    parser.add_argument('--baseline', help='JSON-Ergebnisse eines früheren Laufs zum Vergleich')
+    parser.add_argument('--threshold', type=float, default=0.2, help='Erlaubte Verschlechterung (0.2 = 20 %%)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Der Server nutzt die gemeinsame Datenbank des Moduls; sie zeigt auf die Benchmark-Datei
+        dashboard.database_name = os.path.join(tmp, 'bench.db')
+        db = dashboard.get_database()
+
+        start = time.perf_counter()
+        dashboards = build_cohort(db, args.students, args.modules, args.exams, args.seed)
+        print(f"Jahrgang: {args.students} × {args.modules} × {args.exams} in {time.perf_counter() - start:.1f} s\n")
+
+        results = run_micro(db, dashboards, args.repeat)
+        if not args.skip_http:
+            print()
+            results.update(run_http(dashboards, args))
+        db.close()
+
+    report = {
+        'created': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'parameters': {name: getattr(args, name) for name in
+                       ('students', 'modules', 'exams', 'seed', 'repeat', 'clients', 'requests', 'workers')},
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\nErgebnisse gespeichert in {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        print(f"\nVergleich mit {args.baseline} (Grenze {args.threshold:.0%}):")
+        for name, old, new, change in regressions:
+            print(f"  {name:36}{old:>12.1f} -> {new:>12.1f}  (+{change:.0%})")
+        if regressions:
+            sys.exit(1)
+        print("  keine Regressionen")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""
+Lokaler Lastgenerator für die Server-Modi (single, threaded, asyncio).
+
+Legt die Testdaten an, startet den Dashboard-Server nacheinander in jedem
+Modus auf einem freien Port, feuert parallele GET-Anfragen auf die
+Dashboard-Seite und gibt Durchsatz sowie p50/p99-Latenz aus. Mit --slow-clients halten zusätzliche
+Verbindungen eine unvollständige Anfrage offen, um blockierende Clients
+nachzustellen.
+
+Aufruf:
+    python benchmarks/load_generator.py [--clients 16] [--requests 50] [--slow-clients 1]
+"""
+import argparse
+import http.client
+import os
+import socket
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dashboard  # noqa: E402
+
+
+def percentile(values, fraction):
+    """Gibt das Perzentil einer sortierten Liste zurück."""
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def client(port, path, requests, latencies, errors):
+    """Sendet nacheinander Anfragen und sammelt die Latenzen in Sekunden."""
+    for _ in range(requests):
+        start = time.perf_counter()
+        try:
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+            conn.request('GET', path)
+            conn.getresponse().read()
+            conn.close()
+            latencies.append(time.perf_counter() - start)
+        except OSError:
+            errors.append(1)
+
+
+def run_mode(mode, args):
+    """Misst einen Server-Modus und gibt (Durchsatz, p50, p99, Fehler) zurück."""
+    server = dashboard.Server(port=0, mode=mode, workers=args.workers)
+    httpd = server.create_httpd()
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+
+    slow = []
+    for _ in range(args.slow_clients):
+        sock = socket.create_connection(('127.0.0.1', server.port))
+        sock.sendall(b'GET / HTTP/1.1\r\nHost: localhost\r\n')
+        slow.append(sock)
+
+    latencies, errors = [], []
+    threads = [threading.Thread(target=client, args=(server.port, args.path, args.requests, latencies, errors))
+               for _ in range(args.clients)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    for sock in slow:
+        sock.close()
+    server.stop()
+    thread.join()
+    httpd.server_close()
+
+    latencies.sort()
+    return len(latencies) / elapsed, percentile(latencies, 0.50), percentile(latencies, 0.99), len(errors)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--clients', type=int, default=16, help='Parallele Clients')
+    parser.add_argument('--requests', type=int, default=50, help='Anfragen pro Client')
+    parser.add_argument('--workers', type=int, default=8, help='Worker-Threads des Servers')
+    parser.add_argument('--slow-clients', type=int, default=0, help='Verbindungen mit hängender Anfrage')
+    parser.add_argument('--path', default='/', help='Abgefragter Pfad')
+    parser.add_argument('--modes', nargs='+', choices=dashboard.Server.MODES, default=list(dashboard.Server.MODES))
+    args = parser.parse_args()
+
+    if args.slow_clients:
+        # Im Einzel-Modus blockiert ein hängender Client alle anderen dauerhaft
+        dashboard.DashboardHandler.timeout = 5
+    dashboard.DashboardHandler.log_message = lambda *a: None
+    dashboard.create_test_data(dashboard.get_database())
+
+    print(f"{'Modus':10}{'Anfragen/s':>12}{'p50 (ms)':>12}{'p99 (ms)':>12}{'Fehler':>8}")
+    for mode in args.modes:
+        throughput, p50, p99, errors = run_mode(mode, args)
+        print(f"{mode:10}{throughput:>12,.0f}{p50 * 1000:>12.1f}{p99 * 1000:>12.1f}{errors:>8}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,188 @@
+const studentId = document.body.dataset.studentId;
+let editType = '';
+
+function openEditModal(type) {
+    editType = type;
+    const modal = document.getElementById('editModal');
+    const title = document.getElementById('modal-title');
+    const label = document.getElementById('modal-label');
+    const input = document.getElementById('modal-input');
+    
+    if (type === 'gpa') {
+        title.textContent = 'Ziel-GPA bearbeiten';
+        label.textContent = 'Neuer Ziel-GPA:';
+        input.type = 'number';
+        input.step = '0.1';
+        input.min = '1.0';
+        input.max = '4.0';
+        input.value = document.body.dataset.targetGpa;
+    } else if (type === 'date') {
+        title.textContent = 'Ziel-Enddatum bearbeiten';
+        label.textContent = 'Neues Ziel-Enddatum:';
+        input.type = 'date';
+        input.value = document.body.dataset.endDate;
+    }
+    
+    modal.style.display = 'block';
+}
+
+function closeEditModal() {
+    document.getElementById('editModal').style.display = 'none';
+}
+
+function saveEdit() {
+    const type = editType;
+    const value = document.getElementById('modal-input').value;
+    const formData = new URLSearchParams();
+    formData.append('student_id', studentId);
+    formData.append('action', type === 'gpa' ? 'update_gpa' : 'update_date');
+    formData.append('value', value);
+    
+    fetch('/api', {
+        method: 'POST',
+        headers: {'Content-Type': 'application/x-www-form-urlencoded'},
+        body: formData
+    })
+    .then(response => response.json())
+    .then(data => {
+        if (data.success) {
+            if (type === 'gpa') {
+                setTargetGpa(parseFloat(value));
+            } else {
+                setEndDate(value);
+            }
+        } else {
+            alert('Fehler: ' + data.message);
+        }
+    });
+    
+    closeEditModal();
+}
+
+function addDeadline(event) {
+    event.preventDefault();
+    const type = document.getElementById('deadline-type').value;
+    const module = document.getElementById('module-name').value;
+    const date = document.getElementById('deadline-date').value;
+    
+    const formData = new URLSearchParams();
+    formData.append('student_id', studentId);
+    formData.append('action', 'add_deadline');
+    formData.append('type', type);
+    formData.append('module', module);
+    formData.append('date', date);
+    
+    fetch('/api', {
+        method: 'POST',
+        headers: {'Content-Type': 'application/x-www-form-urlencoded'},
+        body: formData
+    })
+    .then(response => response.json())
+    .then(data => {
+        if (data.success) {
+            insertDeadline({id: data.id, type: type, module: module, date: date});
+            event.target.reset();
+        } else {
+            alert('Fehler: ' + data.message);
+        }
+    });
+}
+
+function deleteDeadline(id) {
+    if (confirm('Frist wirklich löschen?')) {
+        const formData = new URLSearchParams();
+        formData.append('student_id', studentId);
+        formData.append('action', 'delete_deadline');
+        formData.append('id', id);
+        
+        fetch('/api', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/x-www-form-urlencoded'},
+            body: formData
+        })
+        .then(response => response.json())
+        .then(data => {
+            if (data.success) {
+                removeDeadline(id);
+            } else {
+                alert('Fehler: ' + data.message);
+            }
+        });
+    }
+}
+
+// Anzeige wie in Python (str(float)): 3 -> "3.0"
+function formatNumber(value) {
+    return Number.isInteger(value) ? value.toFixed(1) : String(value);
+}
+
+function setTargetGpa(value) {
+    document.body.dataset.targetGpa = value;
+    document.getElementById('target-gpa').textContent = formatNumber(value);
+}
+
+function setEndDate(value) {
+    document.body.dataset.endDate = value;
+    document.getElementById('end-date').textContent = value;
+}
+
+function createDeadlineItem(deadline) {
+    const item = document.createElement('div');
+    item.className = 'deadline-item';
+    item.dataset.id = deadline.id;
+    item.dataset.date = deadline.date;
+    const text = document.createElement('div');
+    const date = document.createElement('span');
+    date.className = 'deadline-date';
+    date.textContent = deadline.date;
+    text.append(date, ' - ' + deadline.type + ': ' + deadline.module);
+    const button = document.createElement('button');
+    button.className = 'delete-btn';
+    button.textContent = 'Löschen';
+    button.addEventListener('click', () => deleteDeadline(deadline.id));
+    item.append(text, button);
+    return item;
+}
+
+// Fügt eine Frist nach (Datum, ID) sortiert ein; eine bereits angezeigte wird ersetzt
+function insertDeadline(deadline) {
+    removeDeadline(deadline.id);
+    const list = document.getElementById('deadline-list');
+    const next = Array.from(list.children).find(item =>
+        item.dataset.date > deadline.date ||
+        (item.dataset.date === deadline.date && Number(item.dataset.id) > deadline.id));
+    list.insertBefore(createDeadlineItem(deadline), next || null);
+}
+
+function removeDeadline(id) {
+    const item = document.querySelector('#deadline-list [data-id="' + id + '"]');
+    if (item) {
+        item.remove();
+    }
+}
+
+function applySnapshot(state) {
+    setTargetGpa(state.target_gpa);
+    setEndDate(state.target_end_date);
+    document.getElementById('deadline-list').replaceChildren(...state.deadlines.map(createDeadlineItem));
+}
+
+// Änderungen anderer Tabs und Clients ohne Neuladen der Seite übernehmen
+function connectEvents() {
+    const events = new EventSource('/events?student_id=' + encodeURIComponent(studentId));
+    events.addEventListener('snapshot', event => applySnapshot(JSON.parse(event.data)));
+    events.addEventListener('target_gpa', event => setTargetGpa(JSON.parse(event.data).target_gpa));
+    events.addEventListener('target_end_date', event => setEndDate(JSON.parse(event.data).target_end_date));
+    events.addEventListener('deadline_added', event => insertDeadline(JSON.parse(event.data)));
+    events.addEventListener('deadline_deleted', event => removeDeadline(JSON.parse(event.data).id));
+    // Nach einer Abweisung (429, 503) verbindet EventSource nicht selbst neu
+    events.addEventListener('error', () => {
+        if (events.readyState === EventSource.CLOSED) {
+            setTimeout(connectEvents, 5000);
+        }
+    });
+}
+
+if (window.EventSource) {
+    connectEvents();
+}
@@ -1,10 +1,39 @@
+import array
+import base64
+import bisect
 import datetime
+import gzip
+import hashlib
+import heapq
+import io
+import itertools
+import logging
+import math
 import sqlite3
 import os
+import queue
+import random
+import re
+import select
+import signal
+import socket
+import sys
+import threading
+import time
+import traceback
+import zlib
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+from fractions import Fraction
 from statistics import mean
 from http.server import HTTPServer, BaseHTTPRequestHandler
-from urllib.parse import urlparse, parse_qs
+from socketserver import ThreadingMixIn
+from urllib.parse import urlparse, parse_qs, unquote
 import json
+from email.utils import formatdate, parsedate_to_datetime
+# asyncio, argparse, concurrent.futures, cProfile/pstats, logging.handlers, csv, email.message und analytics
+# importieren erst die Funktionen, die sie brauchen: "import dashboard" allein soll sie nicht laden.
 
 class StudyCourse:
     """
@@ -15,17 +44,47 @@ class StudyCourse:
         course_id: Eindeutige Kennung des Studiengangs
         duration_semesters: Regelstudienzeit in Semestern
         modules: Liste der zugehörigen Module
+        total_credits: Summe der Credits aller Module
+
+    Die Module sind zusätzlich über ihre module_id indiziert, sodass
+    Nachschlagen und die Aufteilung in abgeschlossene und verbleibende
+    Module in linearer Zeit möglich sind.
     """
+    __slots__ = ('name', 'course_id', 'duration_semesters', 'modules', 'total_credits', '_modules_by_id')
+
     def __init__(self, name, course_id, duration_semesters):
         """Initialisiert einen neuen Studiengang."""
         self.name = name
         self.course_id = course_id
         self.duration_semesters = duration_semesters
         self.modules = []
+        self.total_credits = 0
+        self._modules_by_id = {}
     
     def add_module(self, module):
         """Fügt ein Modul zum Studiengang hinzu."""
         self.modules.append(module)
+        self._modules_by_id[module.module_id] = module
+        self.total_credits += module.credits
+
+    def get_module(self, module_id):
+        """Gibt das Modul mit der angegebenen ID zurück oder None (O(1))."""
+        return self._modules_by_id.get(module_id)
+
+    def partition_modules(self, completed_ids):
+        """
+        Teilt die Module in abgeschlossene und verbleibende auf.
+
+        Args:
+            completed_ids: Menge (oder Mengen-Sicht) der abgeschlossenen module_ids
+
+        Returns:
+            tuple: (abgeschlossene Module, verbleibende Module) in Studiengangsreihenfolge
+        """
+        completed, remaining = [], []
+        for module in self.modules:
+            (completed if module.module_id in completed_ids else remaining).append(module)
+        return completed, remaining
 
 class Student:
     """
@@ -36,6 +95,8 @@ class Student:
         student_id: Matrikelnummer
         study_course: Zugeordneter Studiengang
     """
+    __slots__ = ('name', 'student_id', 'study_course')
+
     def __init__(self, name, student_id, study_course):
         """Initialisiert einen neuen Studenten."""
         self.name = name
@@ -49,11 +110,28 @@ class Semester:
     Attribute:
         number: Semesternummer (z.B. 1, 2, 3)
         year: Jahr des Semesters
+
+    Semester sind Flyweights: Semester(1, 2024) liefert bei jedem Aufruf
+    dieselbe, unveränderliche Instanz, sodass viele Prüfungen sie teilen.
     """
-    def __init__(self, number, year):
-        """Initialisiert ein neues Semester."""
-        self.number = number
-        self.year = year
+    __slots__ = ('number', 'year')
+    _instances = {}
+
+    def __new__(cls, number, year):
+        """Gibt die gemeinsame Instanz für (number, year) zurück und legt sie bei Bedarf an."""
+        semester = cls._instances.get((number, year))
+        if semester is None:
+            semester = super().__new__(cls)
+            object.__setattr__(semester, 'number', number)
+            object.__setattr__(semester, 'year', year)
+            semester = cls._instances.setdefault((number, year), semester)
+        return semester
+
+    def __setattr__(self, name, value):
+        raise AttributeError('Semester sind unveränderlich')
+
+    def __reduce__(self):
+        return Semester, (self.number, self.year)
 
 class Module:
     """
@@ -63,13 +141,25 @@ class Module:
         name: Name des Moduls
         module_id: Eindeutige Modulkennung
         credits: ECTS-Punkte des Moduls
+
+    Module sind über ihre module_id vergleich- und hashbar.
     """
+    __slots__ = ('name', 'module_id', 'credits')
+
     def __init__(self, name, module_id, credits):
         """Initialisiert ein neues Modul."""
         self.name = name
         self.module_id = module_id
         self.credits = credits
 
+    def __eq__(self, other):
+        if not isinstance(other, Module):
+            return NotImplemented
+        return self.module_id == other.module_id
+
+    def __hash__(self):
+        return hash(self.module_id)
+
 class Exam:
     """
     Repräsentiert eine Prüfung eines Studenten in einem Modul.
@@ -79,337 +169,3264 @@ class Exam:
         student: Der zugehörige Student
         semester: Das Semester der Prüfung
         grade: Die erzielte Note (None wenn noch nicht bewertet)
+
+    Eine neu erzeugte Prüfung hält ihre Werte selbst. Wird sie einem
+    Dashboard hinzugefügt, wandern die Werte in dessen ExamStore und die
+    Prüfung wird zur Ansicht auf die gespeicherte Zeile; Notenänderungen
+    schreiben dann in den Store und halten die laufenden Kennzahlen aktuell.
+    Ansichten derselben Zeile sind gleich und haben denselben Hashwert.
     """
+    __slots__ = ('_module', '_student', '_semester', '_grade', '_store', '_index')
+
     def __init__(self, module, student, semester, grade=None):
         """Initialisiert eine neue Prüfung."""
-        self.module = module
-        self.student = student
-        self.semester = semester
-        self.grade = grade
+        self._module = module
+        self._student = student
+        self._semester = semester
+        self._grade = grade
+        self._store = None
+        self._index = None
 
-class Database:
+    @classmethod
+    def _view(cls, store, index):
+        """Erzeugt eine Ansicht auf die Zeile index eines ExamStore."""
+        exam = cls.__new__(cls)
+        exam._module = exam._student = exam._semester = exam._grade = None
+        exam._store = store
+        exam._index = index
+        return exam
+
+    def _bind(self, store, index):
+        """Macht die Prüfung zur Ansicht auf eine gespeicherte Zeile."""
+        self._module = self._student = self._semester = self._grade = None
+        self._store = store
+        self._index = index
+
+    @property
+    def module(self):
+        return self._module if self._store is None else self._store.module(self._index)
+
+    @property
+    def student(self):
+        return self._student if self._store is None else self._store.student
+
+    @property
+    def semester(self):
+        return self._semester if self._store is None else self._store.semester(self._index)
+
+    @property
+    def grade(self):
+        return self._grade if self._store is None else self._store.grade(self._index)
+
+    @grade.setter
+    def grade(self, grade):
+        if self._store is None:
+            self._grade = grade
+        else:
+            self._store.set_grade(self._index, grade)
+
+    def __eq__(self, other):
+        if not isinstance(other, Exam):
+            return NotImplemented
+        if self._store is None:
+            return self is other
+        return self._store is other._store and self._index == other._index
+
+    def __hash__(self):
+        return id(self) if self._store is None else hash((id(self._store), self._index))
+
+
+class ExamStore:
     """
-    Verwaltet die SQLite-Datenbankverbindung und -operationen.
-    
-    Speichert Dashboard-Daten, Fristen und abgeschlossene Module persistent.
+    Spaltenweise Ablage aller Prüfungen eines Studenten.
+
+    Noten liegen als 32-Bit-Gleitkommazahlen in einem array('f') (NaN für
+    unbewertet) und werden beim Lesen auf GRADE_DIGITS Stellen gerundet.
+    Module und Semester werden interniert und je Prüfung nur als kleine
+    ganzzahlige ID gespeichert. Pro Prüfung fallen so 10 Byte an statt eines
+    eigenen Objekts; Exam-Objekte entstehen nur als Ansicht beim Zugriff.
+
+    Der Store verhält sich wie eine Liste von Prüfungen (len, Index,
+    Iteration, append). Notenänderungen werden dem observer als
+    (index, alte Note, neue Note) gemeldet.
+
+    Attribute:
+        student: Der Student, dem die Prüfungen gehören
     """
-    def __init__(self, db_name='student_dashboard.db'):
-        """Initialisiert die Datenbank und erstellt ggf. die Tabellen."""
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        self.db_name = os.path.join(script_dir, db_name)
-        self.init_database()
-    
-    def init_database(self):
-        """Erstellt die Datenbanktabellen, falls sie noch nicht existieren."""
-        with sqlite3.connect(self.db_name) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''CREATE TABLE IF NOT EXISTS dashboard_data
-                                (id INTEGER PRIMARY KEY, student_id TEXT, gpa REAL,
-                                target_gpa REAL, target_end_date TEXT, avg_module_time INTEGER,
-                                target_module_time INTEGER, last_updated TEXT)''')
-            
-            cursor.execute('''CREATE TABLE IF NOT EXISTS deadlines
-                                (id INTEGER PRIMARY KEY, student_id TEXT, deadline_type TEXT,
-                                module_name TEXT, deadline_date TEXT)''')
-            
-            cursor.execute('''CREATE TABLE IF NOT EXISTS completed_modules
-                                (id INTEGER PRIMARY KEY, student_id TEXT, module_id TEXT,
-                                completion_date TEXT, grade REAL)''')
-    
-    def save_dashboard_data(self, student_id, data):
-        """Speichert oder aktualisiert die Dashboard-Daten eines Studenten."""
-        with sqlite3.connect(self.db_name) as conn:
-            conn.execute('''INSERT OR REPLACE INTO dashboard_data
-                            (student_id, gpa, target_gpa, target_end_date, 
-                            avg_module_time, target_module_time, last_updated)
-                            VALUES (?, ?, ?, ?, ?, ?, ?)''',
-                        (student_id, data['gpa'], data['target_gpa'],
-                        data['target_end_date'], data['avg_module_time'],
-                        data['target_module_time'], datetime.datetime.now().isoformat()))
-    
-    def update_target_gpa(self, student_id, target_gpa):
-        """Aktualisiert die Ziel-Note eines Studenten."""
-        with sqlite3.connect(self.db_name) as conn:
-            conn.execute('''UPDATE dashboard_data SET target_gpa = ?, last_updated = ? 
-                           WHERE student_id = ?''', 
-                        (target_gpa, datetime.datetime.now().isoformat(), student_id))
-    
-    def update_target_end_date(self, student_id, target_end_date):
-        """Aktualisiert das Ziel-Enddatum eines Studenten."""
-        with sqlite3.connect(self.db_name) as conn:
-            conn.execute('''UPDATE dashboard_data SET target_end_date = ?, last_updated = ? 
-                           WHERE student_id = ?''', 
-                        (target_end_date, datetime.datetime.now().isoformat(), student_id))
-    
-    def save_deadline(self, student_id, deadline_type, module_name, deadline_date):
-        """Speichert eine neue Frist in der Datenbank."""
-        with sqlite3.connect(self.db_name) as conn:
-            conn.execute('''INSERT INTO deadlines (student_id, deadline_type, module_name, deadline_date)
-                            VALUES (?, ?, ?, ?)''', (student_id, deadline_type, module_name, deadline_date))
-    
-    def delete_deadline(self, deadline_id):
-        """Löscht eine Frist anhand ihrer ID."""
-        with sqlite3.connect(self.db_name) as conn:
-            conn.execute('DELETE FROM deadlines WHERE id = ?', (deadline_id,))
-    
-    def save_module_completion(self, student_id, module_id, grade, completion_date):
-        """Speichert den Abschluss eines Moduls mit Note und Datum."""
-        with sqlite3.connect(self.db_name) as conn:
-            conn.execute('''INSERT OR REPLACE INTO completed_modules
-                            (student_id, module_id, completion_date, grade)
-                            VALUES (?, ?, ?, ?)''', (student_id, module_id, completion_date, grade))
-    
-    def get_completed_modules(self, student_id):
-        """Gibt alle abgeschlossenen Module eines Studenten zurück."""
-        with sqlite3.connect(self.db_name) as conn:
-            return conn.execute('SELECT * FROM completed_modules WHERE student_id = ?', (student_id,)).fetchall()
-    
-    def get_deadlines(self, student_id):
-        """Gibt alle Fristen eines Studenten sortiert nach Datum zurück."""
-        with sqlite3.connect(self.db_name) as conn:
-            return conn.execute('SELECT * FROM deadlines WHERE student_id = ? ORDER BY deadline_date',
-                              (student_id,)).fetchall()
+    __slots__ = ('student', '_grades', '_module_ids', '_semester_ids', '_modules', '_module_index',
+                 '_semesters', '_semester_index', '_observer')
+    GRADE_DIGITS = 4
 
+    def __init__(self, student, observer=None):
+        """Initialisiert einen leeren Store für einen Studenten."""
+        self.student = student
+        self._grades = array.array('f')
+        self._module_ids = array.array('I')
+        self._semester_ids = array.array('H')
+        self._modules = []
+        self._module_index = {}
+        self._semesters = [None]
+        self._semester_index = {None: 0}
+        self._observer = observer
 
-class GpaCalculator:
+    def add(self, module, semester, grade=None):
+        """Speichert eine Prüfung ohne Exam-Objekt und gibt ihren Index zurück."""
+        module_id = self._module_index.get(module)
+        if module_id is None:
+            module_id = self._module_index[module] = len(self._modules)
+            self._modules.append(module)
+        semester_id = self._semester_index.get(semester)
+        if semester_id is None:
+            semester_id = self._semester_index[semester] = len(self._semesters)
+            self._semesters.append(semester)
+        self._grades.append(math.nan if grade is None else grade)
+        self._module_ids.append(module_id)
+        self._semester_ids.append(semester_id)
+        return len(self._grades) - 1
+
+    def append(self, exam):
+        """Übernimmt eine Prüfung in den Store; sie wird zur Ansicht auf ihre Zeile."""
+        index = self.add(exam.module, exam.semester, exam.grade)
+        exam._bind(self, index)
+        return index
+
+    def module(self, index):
+        return self._modules[self._module_ids[index]]
+
+    def semester(self, index):
+        return self._semesters[self._semester_ids[index]]
+
+    def grade(self, index):
+        grade = self._grades[index]
+        return None if math.isnan(grade) else round(grade, self.GRADE_DIGITS)
+
+    def set_grade(self, index, grade):
+        """Ändert eine Note und meldet die Änderung dem observer."""
+        old_grade = self.grade(index)
+        self._grades[index] = math.nan if grade is None else grade
+        new_grade = self.grade(index)
+        if self._observer is not None and old_grade != new_grade:
+            self._observer(index, old_grade, new_grade)
+
+    def view(self, index):
+        """Gibt eine Exam-Ansicht auf die Zeile index zurück."""
+        return Exam._view(self, index)
+
+    def __len__(self):
+        return len(self._grades)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.view(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('Prüfungsindex außerhalb des Bereichs')
+        return self.view(index)
+
+    def __iter__(self):
+        return (self.view(index) for index in range(len(self)))
+
+
+class Histogram:
     """
-    Berechnet den Notendurchschnitt und verwaltet die Ziel-Note.
+    Histogramm mit festen Klassengrenzen je Kombination von Label-Werten.
+
+    Beobachtungen werden per bisect einer Klasse zugeordnet; beim Export
+    werden die Klassen wie in Prometheus kumuliert (le="...").
 
     Attribute:
-        target_gpa: Angestrebter Notendurchschnitt
+        name: Name der Metrik
+        documentation: Beschreibung für die HELP-Zeile
+        label_names: Namen der Labels in der Reihenfolge der Werte
+        buckets: Obergrenzen der Klassen in Sekunden
     """
-    def __init__(self, target_gpa: float, db: Database, student_id: str):
-        """Initialisiert den GpaCalculator mit Ziel-Note und Datenbankzugang."""
-        self.target_gpa = target_gpa
-        self._db = db
-        self._student_id = student_id
+    BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
 
-    def calculate(self, exams: list) -> float:
-        """Berechnet den aktuellen Notendurchschnitt aller benoteten Prüfungen."""
-        graded_exams = [exam for exam in exams if exam.grade is not None]
-        return round(mean([exam.grade for exam in graded_exams]), 2) if graded_exams else 0.0
+    def __init__(self, name, documentation, label_names=(), buckets=BUCKETS):
+        """Initialisiert ein leeres Histogramm."""
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self.buckets = buckets
+        self._series = {}
+        self._lock = threading.Lock()
 
-    def update_target(self, new_target_gpa: float):
-        """Aktualisiert die Ziel-Note und speichert sie in der Datenbank."""
-        self.target_gpa = new_target_gpa
-        self._db.update_target_gpa(self._student_id, new_target_gpa)
+    def observe(self, value, *label_values):
+        """Erfasst einen Messwert für die angegebenen Label-Werte."""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
 
+    @contextmanager
+    def timer(self, *label_values):
+        """Misst die Dauer des Blocks und erfasst sie in Sekunden."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, *label_values)
 
-class DeadlineManager:
+    def exposition(self):
+        """Gibt die Zeilen im Prometheus-Textformat zurück."""
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} histogram']
+        with self._lock:
+            series = sorted((labels, list(counts), total) for labels, (counts, total) in self._series.items())
+        for label_values, counts, total in series:
+            pairs = list(zip(self.label_names, label_values))
+            labels = format_labels(pairs)
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(f'{self.name}_bucket{format_labels(pairs, le=le)} {cumulative}')
+            lines.append(f'{self.name}_sum{labels} {total!r}')
+            lines.append(f'{self.name}_count{labels} {cumulative}')
+        return lines
+
+
+def format_labels(pairs, **extra):
+    """Formatiert Label-Paare als {name="wert",...} mit maskierten Werten."""
+    items = list(pairs) + list(extra.items())
+    if not items:
+        return ''
+    escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, value in items)
+    return '{' + ','.join(f'{name}="{value}"' for (name, _), value in zip(items, escaped)) + '}'
+
+
+class MetricsRegistry:
     """
-    Verwaltet Fristen: Hinzufügen, Löschen und Neuladen aus der Datenbank.
+    Sammelt die Metriken des Prozesses und gibt sie im Prometheus-Textformat aus.
 
-    Attribute:
-        deadlines: Liste der aktuellen Fristen als Dictionaries
+    Histogramme werden fortlaufend befüllt; Zähler, die ohnehin anderswo
+    geführt werden (z.B. Cache-Treffer), liefern Collector-Funktionen erst
+    beim Abruf. Ein Collector gibt Tupel (Name, Typ, Beschreibung,
+    [(Labels, Wert), ...]) zurück.
     """
-    def __init__(self, student_id: str, db: Database):
-        """Initialisiert den DeadlineManager mit Studenten-ID und Datenbankzugang."""
-        self._student_id = student_id
-        self._db = db
-        self.deadlines = []
+    def __init__(self):
+        """Initialisiert eine leere Registry."""
+        self._histograms = []
+        self._collectors = []
 
-    def add(self, deadline_type: str, module_name: str, deadline_date: str):
-        """Fügt eine neue Frist hinzu und speichert sie in der Datenbank."""
-        self.deadlines.append({'type': deadline_type, 'module': module_name, 'date': deadline_date})
-        self._db.save_deadline(self._student_id, deadline_type, module_name, deadline_date)
-
-    def delete(self, index: int):
-        """Löscht eine Frist anhand ihres Index."""
-        if 0 <= index < len(self.deadlines):
-            db_deadlines = self._db.get_deadlines(self._student_id)
-            if index < len(db_deadlines):
-                self._db.delete_deadline(db_deadlines[index][0])
-            del self.deadlines[index]
-
-    def reload(self):
-        """Lädt alle Fristen aus der Datenbank neu."""
-        self.deadlines = []
-        for deadline in self._db.get_deadlines(self._student_id):
-            self.deadlines.append({'type': deadline[2], 'module': deadline[3], 'date': deadline[4]})
+    def histogram(self, name, documentation, label_names=()):
+        """Legt ein Histogramm an und registriert es."""
+        histogram = Histogram(name, documentation, label_names)
+        self._histograms.append(histogram)
+        return histogram
 
+    def register_collector(self, collector):
+        """Registriert eine Funktion, die beim Abruf weitere Metriken liefert."""
+        self._collectors.append(collector)
+        return collector
 
-class StudyProgressService:
+    def exposition(self):
+        """Gibt alle Metriken als Text zurück."""
+        lines = []
+        for histogram in self._histograms:
+            lines.extend(histogram.exposition())
+        for collector in self._collectors:
+            for name, kind, documentation, samples in collector():
+                lines.append(f'# HELP {name} {documentation}')
+                lines.append(f'# TYPE {name} {kind}')
+                for labels, value in samples:
+                    lines.append(f'{name}{format_labels(labels.items())} {value!r}')
+        return '\n'.join(lines) + '\n'
+
+
+metrics = MetricsRegistry()
+http_request_seconds = metrics.histogram(
+    'dashboard_http_request_duration_seconds', 'Bearbeitungsdauer der HTTP-Anfragen je Route.',
+    ('method', 'route', 'status'))
+db_call_seconds = metrics.histogram(
+    'dashboard_db_call_duration_seconds', 'Dauer der Datenbankabfragen (siehe DATABASE_QUERIES).', ('method',))
+template_render_seconds = metrics.histogram(
+    'dashboard_template_render_duration_seconds', 'Dauer des Renderns einer Vorlage.', ('template',))
+
+
+def instrument_methods(cls, histogram, names):
+    """Ersetzt die genannten Methoden einer Klasse durch Hüllen, die ihre Dauer erfassen."""
+    def instrumented(name, method):
+        @wraps(method)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                histogram.observe(time.perf_counter() - start, name)
+        return wrapper
+
+    for name in names:
+        setattr(cls, name, instrumented(name, getattr(cls, name)))
+
+
+class ConnectionPool:
     """
-    Berechnet und verfolgt den Studienfortschritt:
-    abgeschlossene Module, Bearbeitungszeit und voraussichtliches Studienende.
+    Verwaltet langlebige SQLite-Verbindungen, jeweils eine pro Thread.
+
+    Eine Verbindung wird beim ersten Zugriff eines Threads geöffnet, mit
+    WAL-Journal und abgestimmten Pragmas konfiguriert und danach für alle
+    weiteren Abfragen wiederverwendet. Der Statement-Cache von sqlite3
+    (``cached_statements``) hält die vorbereiteten Anweisungen je Verbindung,
+    sodass wiederholte Abfragen nicht erneut kompiliert werden.
 
     Attribute:
-        target_module_days: Ziel-Tage pro Modul
-        target_end_date: Manuell gesetztes Ziel-Enddatum (optional)
+        db_name: Pfad zur Datenbankdatei
+        cached_statements: Größe des Statement-Caches je Verbindung
     """
-    def __init__(self, student: Student, target_module_days: int, db: Database):
-        """Initialisiert den StudyProgressService."""
-        self._student = student
-        self._db = db
-        self.target_module_days = target_module_days
-        self.target_end_date = None
+    PRAGMAS = (
+        ('journal_mode', 'WAL'),
+        ('synchronous', 'NORMAL'),
+        ('cache_size', -16000),      # ca. 16 MB Seiten-Cache
+        ('mmap_size', 268435456),    # 256 MB Memory-Mapped I/O
+        ('temp_store', 'MEMORY'),
+        ('busy_timeout', 5000),
+    )
 
-    def get_completed_modules(self, exams: list) -> list:
-        """Gibt eine Liste aller bestandenen Module zurück (Note <= 4.0)."""
-        return [exam.module for exam in exams if exam.grade is not None and exam.grade <= 4.0]
+    def __init__(self, db_name, cached_statements=256):
+        """Initialisiert den Pool; Verbindungen werden erst bei Bedarf geöffnet."""
+        self.db_name = db_name
+        self.cached_statements = cached_statements
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections = {}
+        self._generation = 0
 
-    def calculate_avg_module_time(self) -> int:
-        """Berechnet die durchschnittliche Bearbeitungszeit pro Modul in Tagen."""
-        return 45  # Platzhalter
+    def connection(self):
+        """Gibt die Verbindung des aktuellen Threads zurück und öffnet sie bei Bedarf."""
+        local = self._local
+        if getattr(local, 'generation', None) != self._generation:
+            local.conn = self._open()
+            local.generation = self._generation
+        return local.conn
 
-    def calculate_target_end_date(self) -> str:
-        """Berechnet das voraussichtliche Studienende basierend auf der Regelstudienzeit."""
-        if self.target_end_date:
-            return self.target_end_date
-        remaining_semesters = self._student.study_course.duration_semesters
-        end_date = datetime.datetime.now() + datetime.timedelta(days=remaining_semesters * 180)
-        return end_date.strftime('%Y-%m-%d')
+    @contextmanager
+    def transaction(self):
+        """
+        Kontextmanager: führt den Block in einer Transaktion aus (Commit oder Rollback).
 
-    def update_target_end_date(self, new_date: str):
-        """Aktualisiert das Ziel-Enddatum und speichert es in der Datenbank."""
-        self.target_end_date = new_date
-        self._db.update_target_end_date(self._student.student_id, new_date)
+        Verschachtelte Aufrufe im selben Thread schließen sich der äußeren
+        Transaktion an; erst deren Ende schreibt alles in einem Commit.
+        """
+        conn = self.connection()
+        local = self._local
+        if getattr(local, 'depth', 0):
+            local.depth += 1
+            try:
+                yield conn
+            finally:
+                local.depth -= 1
+            return
 
-    def save_module_completions(self, student_id: str, exams: list):
-        """Speichert alle abgeschlossenen Module in der Datenbank."""
-        for exam in exams:
-            if exam.grade is not None and exam.grade <= 4.0:
-                self._db.save_module_completion(student_id, exam.module.module_id,
-                                                exam.grade, datetime.datetime.now().isoformat())
+        local.depth = 1
+        local.callbacks = {}
+        try:
+            with conn:
+                yield conn
+        except BaseException:
+            local.callbacks = {}
+            raise
+        finally:
+            local.depth = 0
+        callbacks, local.callbacks = local.callbacks, {}
+        for callback, args in callbacks:
+            callback(*args)
 
+    def after_commit(self, callback, *args):
+        """
+        Führt callback(*args) nach dem Commit der laufenden Transaktion aus.
 
-class Dashboard:
+        Gleiche Aufrufe werden zusammengefasst; bei einem Rollback entfallen
+        sie. Außerhalb einer Transaktion wird sofort ausgeführt.
+        """
+        if getattr(self._local, 'depth', 0):
+            self._local.callbacks[(callback, args)] = None
+        else:
+            callback(*args)
+
+    def close_all(self):
+        """Schließt alle offenen Verbindungen aller Threads."""
+        with self._lock:
+            self._generation += 1
+            connections, self._connections = self._connections, {}
+        for conn in connections.values():
+            conn.close()
+
+    def _open(self):
+        """Öffnet eine neue Verbindung und setzt die Pragmas."""
+        conn = sqlite3.connect(self.db_name, cached_statements=self.cached_statements,
+                               check_same_thread=False)
+        for name, value in self.PRAGMAS:
+            conn.execute(f'PRAGMA {name} = {value}')
+        with self._lock:
+            # Verbindungen beendeter Threads (z.B. nach Server-Neustart) freigeben
+            for thread in [t for t in self._connections if not t.is_alive()]:
+                self._connections.pop(thread).close()
+            self._connections[threading.current_thread()] = conn
+        return conn
+
+
+class ContentVersions:
     """
-    Zentrale Koordinationsklasse (Facade) für das Studenten-Dashboard.
+    Führt je Student eine Inhaltsversion, die bei jeder Änderung hochgezählt wird.
 
-    Delegiert GPA-Berechnungen an GpaCalculator, Fristenverwaltung an
-    DeadlineManager und Studienfortschritt an StudyProgressService.
+    Die Version ist die datenbankweit fortlaufende Nummer der letzten
+    gespeicherten Änderung (Tabelle content_versions) und damit in allen
+    Prozessen gleich, die dieselbe Datenbank nutzen. Änderungen, die nur im
+    Speicher eines Prozesses stattfinden (bump()), hängen einen
+    prozesseigenen Zähler an. Aus Version und Änderungszeitpunkt werden
+    ETag und Last-Modified der Dashboard-Seite gebildet; die Datenbank wird
+    dafür nur beim ersten Zugriff auf einen Studenten abgefragt.
+
+    Attribute:
+        epoch: Kennung der Datenbank, damit ETags nur für sie gelten
+        started: Startzeitpunkt als Unix-Zeit (Last-Modified ohne Änderung)
     """
-    def __init__(self, student, target_gpa=3.0, target_module_days=60):
+    def __init__(self, epoch=None, loader=None):
         """
-        Initialisiert ein neues Dashboard für einen Studenten.
+        Initialisiert die Versionstabelle.
 
         Args:
-            student: Der zugehörige Student
-            target_gpa: Ziel-Notendurchschnitt (Standard: 3.0)
-            target_module_days: Ziel-Tage pro Modul (Standard: 60)
+            epoch: Kennung der Datenbank (Standard: aus dem Startzeitpunkt)
+            loader: Liefert zu einer Studenten-ID (Version, Zeitpunkt) oder None
         """
-        self.student = student
-        self.exams = []
-        self._db = Database()
-        self.gpa_calculator   = GpaCalculator(target_gpa, self._db, student.student_id)
-        self.deadline_manager = DeadlineManager(student.student_id, self._db)
-        self.study_progress   = StudyProgressService(student, target_module_days, self._db)
+        self.started = time.time()
+        self.epoch = epoch or f'{int(self.started * 1000):x}'
+        self._process = f'{os.getpid():x}.{int(self.started * 1000):x}'
+        self._loader = loader
+        self._versions = {}
+        self._lock = threading.Lock()
 
-    @property
-    def target_gpa(self):
-        return self.gpa_calculator.target_gpa
+    def bump(self, student_id):
+        """Zählt eine Änderung im Speicher dieses Prozesses und gibt die neue Version zurück."""
+        with self._lock:
+            shared, local, _ = self._entry(student_id)
+            self._versions[student_id] = (shared, local + 1, time.time())
+        return self.get(student_id)[0]
 
-    @property
-    def deadlines(self):
-        return self.deadline_manager.deadlines
+    def update(self, student_id, version, changed):
+        """Übernimmt eine gespeicherte Version; ältere als die bekannte werden ignoriert."""
+        with self._lock:
+            shared, local, _ = self._entry(student_id)
+            if version > shared:
+                self._versions[student_id] = (version, local, changed)
 
-    def add_exam(self, exam):
-        """Fügt eine Prüfung zum Dashboard hinzu."""
-        self.exams.append(exam)
+    def get(self, student_id):
+        """Gibt (Version, Änderungszeitpunkt) eines Studenten zurück."""
+        entry = self._versions.get(student_id)
+        if entry is None:
+            with self._lock:
+                entry = self._entry(student_id)
+        shared, local, changed = entry
+        return (f'{shared}.{self._process}.{local}' if local else str(shared)), changed
 
-    def add_deadline(self, deadline_type, module_name, deadline_date):
-        """Fügt eine neue Frist hinzu."""
-        self.deadline_manager.add(deadline_type, module_name, deadline_date)
+    def _entry(self, student_id):
+        """Gibt (gespeicherte Version, lokale Änderungen, Zeitpunkt) zurück und lädt sie beim ersten Zugriff."""
+        entry = self._versions.get(student_id)
+        if entry is None:
+            row = self._loader(student_id) if self._loader is not None else None
+            entry = (row[0], 0, row[1]) if row is not None else (0, 0, self.started)
+            self._versions[student_id] = entry
+        return entry
 
-    def update_target_gpa(self, new_target_gpa):
-        """Aktualisiert die Ziel-Note."""
-        self.gpa_calculator.update_target(new_target_gpa)
 
-    def update_target_end_date(self, new_target_end_date):
-        """Aktualisiert das Ziel-Enddatum."""
-        self.study_progress.update_target_end_date(new_target_end_date)
+def _create_base_schema(conn):
+    """Migration 1: Legt die Tabellen an (bestehende Datenbanken bleiben unverändert)."""
+    cursor = conn.cursor()
+    cursor.execute('''CREATE TABLE IF NOT EXISTS dashboard_data
+                        (id INTEGER PRIMARY KEY, student_id TEXT, gpa REAL,
+                        target_gpa REAL, target_end_date TEXT, avg_module_time INTEGER,
+                        target_module_time INTEGER, last_updated TEXT)''')
+    
+    cursor.execute('''CREATE TABLE IF NOT EXISTS deadlines
+                        (id INTEGER PRIMARY KEY, student_id TEXT, deadline_type TEXT,
+                        module_name TEXT, deadline_date TEXT)''')
+    
+    cursor.execute('''CREATE TABLE IF NOT EXISTS completed_modules
+                        (id INTEGER PRIMARY KEY, student_id TEXT, module_id TEXT,
+                        completion_date TEXT, grade REAL)''')
 
-    def delete_deadline(self, deadline_index):
-        """Löscht eine Frist anhand ihres Index."""
-        self.deadline_manager.delete(deadline_index)
+    cursor.execute('''CREATE TABLE IF NOT EXISTS courses
+                        (course_id TEXT PRIMARY KEY, name TEXT, duration_semesters INTEGER)''')
 
-    def reload_deadlines(self):
-        """Lädt alle Fristen aus der Datenbank neu."""
-        self.deadline_manager.reload()
+    cursor.execute('''CREATE TABLE IF NOT EXISTS course_modules
+                        (course_id TEXT, module_id TEXT, name TEXT, credits INTEGER,
+                        position INTEGER, PRIMARY KEY (course_id, module_id))''')
 
-    def calculate_gpa(self):
-        """Berechnet den aktuellen Notendurchschnitt."""
-        return self.gpa_calculator.calculate(self.exams)
+    cursor.execute('''CREATE TABLE IF NOT EXISTS students
+                        (student_id TEXT PRIMARY KEY, name TEXT, course_id TEXT)''')
 
-    def calculate_avg_module_time(self):
-        """Gibt die durchschnittliche Bearbeitungszeit pro Modul zurück."""
-        return self.study_progress.calculate_avg_module_time()
 
-    def calculate_target_end_date(self):
-        """Berechnet das voraussichtliche Studienende."""
-        return self.study_progress.calculate_target_end_date()
+def _add_indexes_and_constraints(conn):
+    """
+    Migration 2: Bereinigt Duplikate und legt Indizes und Eindeutigkeiten an.
 
-    def get_completed_modules(self):
-        """Gibt eine Liste aller bestandenen Module zurück."""
-        return self.study_progress.get_completed_modules(self.exams)
+    Bisher hat jedes save_data() neue Zeilen angehängt, da ohne eindeutigen
+    Schlüssel INSERT OR REPLACE nie ersetzt hat. Behalten wird je Student die
+    neueste Zeile in dashboard_data und je Modul der erste Abschluss (mit
+    dem ursprünglichen Abschlussdatum, aber der zuletzt gespeicherten Note).
+    """
+    conn.execute('''DELETE FROM dashboard_data WHERE id NOT IN
+                    (SELECT MAX(id) FROM dashboard_data GROUP BY student_id)''')
+    conn.execute('CREATE UNIQUE INDEX idx_dashboard_data_student ON dashboard_data (student_id)')
 
-    def save_data(self):
-        """Speichert alle Dashboard-Daten in der Datenbank."""
-        data = {
-            'gpa': self.calculate_gpa(),
-            'target_gpa': self.target_gpa,
-            'target_end_date': self.calculate_target_end_date(),
-            'avg_module_time': self.calculate_avg_module_time(),
-            'target_module_time': self.study_progress.target_module_days
-        }
-        self._db.save_dashboard_data(self.student.student_id, data)
-        self.study_progress.save_module_completions(self.student.student_id, self.exams)
+    conn.execute('''UPDATE completed_modules SET grade =
+                        (SELECT latest.grade FROM completed_modules AS latest
+                         WHERE latest.student_id = completed_modules.student_id
+                           AND latest.module_id = completed_modules.module_id
+                         ORDER BY latest.id DESC LIMIT 1)
+                    WHERE id IN (SELECT MIN(id) FROM completed_modules
+                                 GROUP BY student_id, module_id HAVING COUNT(*) > 1)''')
+    conn.execute('''DELETE FROM completed_modules WHERE id NOT IN
+                    (SELECT MIN(id) FROM completed_modules GROUP BY student_id, module_id)''')
+    conn.execute('''CREATE UNIQUE INDEX idx_completed_modules_student_module
+                    ON completed_modules (student_id, module_id)''')
 
-    def display(self):
-        """Zeigt das Dashboard im Terminal an."""
-        completed = self.get_completed_modules()
-        total = self.student.study_course.modules
+    conn.execute('CREATE INDEX idx_deadlines_student_date ON deadlines (student_id, deadline_date)')
 
-        print(f"\n{'='*50}")
-        print(f"Dashboard für {self.student.name}")
-        print(f"{'='*50}")
-        print(f"Aktueller GPA: {self.calculate_gpa()}")
-        print(f"Ziel-GPA: {self.target_gpa}")
-        print(f"Ziel-Enddatum: {self.calculate_target_end_date()}")
-        print(f"Durchschnittliche Modulbearbeitungszeit: {self.calculate_avg_module_time()} Tage")
-        print(f"Ziel-Modulbearbeitungszeit: {self.study_progress.target_module_days} Tage")
-        print(f"\nModulfortschritt: {len(completed)}/{len(total)} abgeschlossen")
-        print(f"Abgeschlossene Module:")
-        for module in completed:
-            print(f"  ✓ {module.name} ({module.credits} Credits)")
-        print(f"\nVerbleibende Module:")
-        for module in [m for m in total if m not in completed]:
-            print(f"  ○ {module.name} ({module.credits} Credits)")
-        print(f"\nBevorstehende Fristen:")
-        for deadline in sorted(self.deadlines, key=lambda x: x['date']):
-            print(f"  {deadline['date']} - {deadline['type']}: {deadline['module']}")
-        print(f"{'='*50}\n")
 
+def _create_exams_table(conn):
+    """
+    Migration 3: Legt die Tabelle exams an und übernimmt die bisherigen Modulabschlüsse.
 
-def load_dashboard_html():
+    Jede Zeile trägt eine je Student fortlaufende Revision, die bei jedem
+    Schreiben der Zeile neu vergeben wird (siehe NEXT_EXAM_REVISION).
+    Übernommene Abschlüsse erhalten die Revision 1.
     """
-    Lädt die HTML-Vorlage aus der externen Datei dashboard.html.
-    
-    Returns:
-        str: Der HTML-Inhalt als String
+    conn.execute('''CREATE TABLE exams
+                    (id INTEGER PRIMARY KEY, student_id TEXT NOT NULL, module_id TEXT NOT NULL,
+                    semester_number INTEGER, semester_year INTEGER, grade REAL, exam_date TEXT,
+                    last_updated TEXT NOT NULL, revision INTEGER NOT NULL)''')
+    conn.execute('CREATE INDEX idx_exams_student_revision ON exams (student_id, revision)')
+    conn.execute('''INSERT INTO exams (student_id, module_id, grade, exam_date, last_updated, revision)
+                    SELECT student_id, module_id, grade, completion_date, ?, 1 FROM completed_modules
+                    ORDER BY id''', (datetime.datetime.now().isoformat(),))
+
+
+def _create_content_versions_table(conn):
     """
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    html_path = os.path.join(script_dir, 'dashboard.html')
-    with open(html_path, 'r', encoding='utf-8') as f:
-        return f.read()
-# Erstelle Testdaten
-def create_test_data():
+    Migration 4: Legt die prozessübergreifenden Inhaltsversionen an.
+
+    content_versions hält je Student die datenbankweit fortlaufende Nummer
+    seiner letzten Änderung und die Kennung der schreibenden Database-Instanz,
+    meta die Kennung der Datenbank für ETags.
     """
-    Erstellt Testdaten für das Dashboard.
-    
-    Erzeugt einen Beispiel-Studiengang mit Modulen, einen Studenten,
-    Prüfungen und Fristen zur Demonstration der Funktionalität.
-    
-    Returns:
-        Dashboard: Ein initialisiertes Dashboard mit Testdaten
+    conn.execute('''CREATE TABLE content_versions
+                    (student_id TEXT PRIMARY KEY, version INTEGER NOT NULL, changed REAL NOT NULL,
+                    origin TEXT NOT NULL)''')
+    conn.execute('CREATE INDEX idx_content_versions_version ON content_versions (version)')
+    conn.execute('CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)')
+    conn.execute("INSERT INTO meta (key, value) VALUES ('epoch', ?)", (f'{random.getrandbits(48):x}',))
+
+
+def _create_reminders_table(conn):
     """
-    course = StudyCourse("Cyber Security", "CS-2026", 6)
+    Migration 5: Vermerkt versandte Fristerinnerungen (je Frist höchstens eine).
+
+    Der Index auf deadline_date dient dem Laden aller offenen Erinnerungen
+    beim Start des ReminderScheduler.
+    """
+    conn.execute('CREATE TABLE reminders_sent (deadline_id INTEGER PRIMARY KEY, sent REAL NOT NULL)')
+    conn.execute('CREATE INDEX idx_deadlines_date ON deadlines (deadline_date)')
+
+
+# Schema-Migrationen in Reihenfolge; Position + 1 ist die Schemaversion.
+# Bestehende Einträge nicht verändern, neue Migrationen nur anhängen.
+MIGRATIONS = (
+    _create_base_schema,
+    _add_indexes_and_constraints,
+    _create_exams_table,
+    _create_content_versions_table,
+    _create_reminders_table,
+)
+
+# Nächste Revision der Prüfungen eines Studenten (Parameter: student_id). Der
+# Wert wird erst im schreibenden Statement ermittelt, also unter der
+# Schreibsperre von SQLite, und steigt damit in Commit-Reihenfolge.
+NEXT_EXAM_REVISION = '(SELECT COALESCE(MAX(revision), 0) + 1 FROM exams WHERE student_id = ?)'
+
+# Kennung der JSONL-Exporte (erste Zeile, siehe Database.export_rows)
+EXPORT_FORMAT = 'student-dashboard-export'
+
+
+class Database:
+    """
+    Verwaltet die SQLite-Datenbankverbindung und -operationen.
     
-    modules = [
-        Module("Objektorientierte Programmierung mit Python", "CS101", 5),
-        Module("Datenstrukturen", "CS102", 5),
-        Module("Algorithmen", "CS103", 5),
+    Speichert Dashboard-Daten, Fristen, Prüfungen und abgeschlossene Module persistent.
+    Alle Zugriffe laufen über einen ConnectionPool mit langlebigen
+    Verbindungen je Thread. Jeder Schreibzugriff erhöht in derselben
+    Transaktion die gemeinsame Inhaltsversion des betroffenen Studenten;
+    nach dem Commit steht sie in ``versions``. Änderungen anderer Prozesse
+    übernimmt poll_changes(). Mit transaction() lassen sich mehrere
+    Schreibzugriffe zu einer Transaktion zusammenfassen.
+
+    Attribute:
+        origin: Kennung dieser Instanz in content_versions
+    """
+    BACKUP_PAGES = 256                              # Seiten je Schritt der Online-Sicherung
+    BACKUP_PAUSE = 0.005                            # Pause zwischen zwei Schritten in Sekunden
+    EXPORT_SKIPPED = ('meta', 'content_versions')   # gehören zur Datenbankdatei, nicht zum Inhalt
+
+    def __init__(self, db_name='student_dashboard.db'):
+        """Initialisiert die Datenbank und erstellt ggf. die Tabellen."""
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        self.db_name = os.path.join(script_dir, db_name)
+        self._pool = ConnectionPool(self.db_name)
+        self.origin = f'{os.getpid():x}-{id(self):x}'
+        self._listeners = []
+        self._poll_lock = threading.Lock()
+        self._poll_state = threading.local()
+        self.init_database()
+        conn = self._pool.connection()
+        epoch = conn.execute("SELECT value FROM meta WHERE key = 'epoch'").fetchone()[0]
+        self._seen_version = conn.execute('SELECT COALESCE(MAX(version), 0) FROM content_versions').fetchone()[0]
+        self.versions = ContentVersions(epoch, self._load_version)
+    
+    def init_database(self):
+        """
+        Bringt das Datenbankschema auf den aktuellen Stand.
+
+        Die Schemaversion steht in PRAGMA user_version; jede noch nicht
+        angewendete Migration aus MIGRATIONS läuft in einer eigenen
+        Transaktion (BEGIN IMMEDIATE), sodass parallel startende Prozesse
+        sie nicht doppelt ausführen.
+        """
+        conn = self._pool.connection()
+        for version, migration in enumerate(MIGRATIONS, start=1):
+            if conn.execute('PRAGMA user_version').fetchone()[0] >= version:
+                continue
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                if conn.execute('PRAGMA user_version').fetchone()[0] < version:
+                    migration(conn)
+                    conn.execute(f'PRAGMA user_version = {version}')
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+    def close(self):
+        """Schließt alle Verbindungen des Pools."""
+        self._pool.close_all()
+
+    def backup(self, target, pages=BACKUP_PAGES, pause=BACKUP_PAUSE, progress=None):
+        """
+        Sichert die Datenbank im laufenden Betrieb nach target.
+
+        sqlite3.Connection.backup kopiert jeweils ``pages`` Seiten über eine
+        eigene Verbindung; zwischen zwei Schritten wird pausiert, sodass
+        Anfragen weiter bedient werden. Die Quelle liest in einer offenen
+        Lesetransaktion, die Sicherung zeigt also den Stand bei ihrem Beginn;
+        Schreiber arbeiten dank WAL ungehindert weiter. Die Datei entsteht
+        unter einem temporären Namen und ersetzt target erst, wenn sie
+        vollständig ist.
+
+        Args:
+            target: Pfad der Sicherungsdatei
+            pages: Seiten je Schritt
+            pause: Pause zwischen zwei Schritten in Sekunden
+            progress: Wird nach jedem Schritt als progress(verbleibend, gesamt) aufgerufen
+
+        Returns:
+            int: Anzahl der gesicherten Seiten
+        """
+        def step(status, remaining, total):
+            if progress is not None:
+                progress(remaining, total)
+            if remaining and pause:
+                time.sleep(pause)
+
+        partial = f'{target}.part'
+        source = sqlite3.connect(self.db_name, check_same_thread=False, isolation_level=None)
+        try:
+            # Ohne festen Lesestand beginnt SQLite nach jedem fremden
+            # Schreibzugriff von vorn und würde unter Dauerlast nie fertig
+            source.execute('BEGIN')
+            source.execute('SELECT COUNT(*) FROM sqlite_master').fetchone()
+            destination = sqlite3.connect(partial)
+            try:
+                source.backup(destination, pages=pages, progress=step)
+                # Die Sicherung soll ohne -wal-Datei vollständig sein
+                destination.execute('PRAGMA journal_mode = DELETE')
+                total = destination.execute('PRAGMA page_count').fetchone()[0]
+            finally:
+                destination.close()
+            os.replace(partial, target)
+        except BaseException:
+            if os.path.exists(partial):
+                os.remove(partial)
+            raise
+        finally:
+            source.close()
+        return total
+
+    def export_rows(self):
+        """
+        Liefert den Inhalt aller Tabellen als JSON-Zeilen (ohne Zeilenumbruch).
+
+        Die erste Zeile nennt Format und Schemaversion, jede weitere enthält
+        einen Datensatz als {"table": ..., "row": {...}}. Gelesen wird über
+        eine eigene Verbindung in einer Lesetransaktion: ein konsistenter
+        Stand, ohne Schreiber aufzuhalten, und Zeile für Zeile, sodass der
+        Speicherbedarf nicht mit der Datenbank wächst. Inhaltsversionen und
+        die Kennung der Datenbank (EXPORT_SKIPPED) werden nicht exportiert.
+        """
+        conn = sqlite3.connect(self.db_name, check_same_thread=False)
+        try:
+            conn.execute('BEGIN')
+            tables = [name for (name,) in conn.execute('''SELECT name FROM sqlite_master WHERE type = 'table'
+                                                          AND name NOT LIKE 'sqlite_%' ORDER BY name''')
+                      if name not in self.EXPORT_SKIPPED]
+            yield json.dumps({'format': EXPORT_FORMAT,
+                              'schema_version': conn.execute('PRAGMA user_version').fetchone()[0],
+                              'exported': datetime.datetime.now().isoformat(timespec='seconds')})
+            for table in tables:
+                cursor = conn.execute(f'SELECT * FROM "{table}" ORDER BY rowid')
+                columns = [column[0] for column in cursor.description]
+                for row in cursor:
+                    yield json.dumps({'table': table, 'row': dict(zip(columns, row))}, ensure_ascii=False)
+        finally:
+            conn.close()
+
+    def import_rows(self, lines, batch_size=5000):
+        """
+        Übernimmt einen Export von export_rows() Zeile für Zeile.
+
+        Datensätze mit gleichem Schlüssel werden ersetzt. Geschrieben wird in
+        Blöcken zu batch_size Datensätzen in jeweils einer Transaktion; die
+        betroffenen Studenten erhalten eine neue Inhaltsversion, Prüfungen
+        eine neue Revision, damit laufende Dashboards sie übernehmen.
+
+        Args:
+            lines: Iterable aus JSON-Zeilen (str oder bytes)
+            batch_size: Datensätze pro Transaktion
+
+        Returns:
+            int: Anzahl der übernommenen Datensätze
+
+        Raises:
+            ValueError: Bei fremdem Format, anderer Schemaversion oder
+                unbekannter Tabelle bzw. Spalte (bereits geschriebene Blöcke bleiben erhalten)
+        """
+        lines = (line for line in lines if line.strip())
+        try:
+            header = json.loads(next(lines))
+        except (StopIteration, ValueError):
+            raise ValueError('Leerer oder ungültiger Export')
+        if not isinstance(header, dict) or header.get('format') != EXPORT_FORMAT:
+            raise ValueError('Unbekanntes Exportformat')
+        if header.get('schema_version') != len(MIGRATIONS):
+            raise ValueError(f"Export mit Schemaversion {header.get('schema_version')}, erwartet {len(MIGRATIONS)}")
+
+        conn = self._pool.connection()
+        columns = {name: {column[1] for column in conn.execute(f'PRAGMA table_info("{name}")')}
+                   for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+                   if name not in self.EXPORT_SKIPPED and not name.startswith('sqlite_')}
+        count, batch = 0, []
+        for number, line in enumerate(lines, start=2):
+            try:
+                record = json.loads(line)
+                table, row = record['table'], record['row']
+                known = row.keys() <= columns[table]
+            except (ValueError, KeyError, TypeError, AttributeError):
+                raise ValueError(f'Zeile {number}: ungültiger Datensatz')
+            if not known or not row:
+                raise ValueError(f'Zeile {number}: unbekannte Spalte in {table}')
+            batch.append((table, row))
+            if len(batch) >= batch_size:
+                self._import_batch(batch)
+                count, batch = count + len(batch), []
+        if batch:
+            self._import_batch(batch)
+            count += len(batch)
+        return count
+
+    def _import_batch(self, batch):
+        """Schreibt einen Block von (Tabelle, Datensatz)-Paaren; gleich aufgebaute Folgen per executemany."""
+        with self._pool.transaction() as conn:
+            for (table, names), group in itertools.groupby(batch, key=lambda item: (item[0], tuple(item[1]))):
+                rows = [row for _, row in group]
+                if table == 'exams' and 'student_id' in names:
+                    # Neue Revision statt der exportierten, sonst übersieht ExamRepository.sync() die Zeile
+                    names = tuple(name for name in names if name != 'revision')
+                    conn.executemany(f'''INSERT OR REPLACE INTO exams ({', '.join(names)}, revision)
+                                         VALUES ({', '.join('?' * len(names))}, {NEXT_EXAM_REVISION})''',
+                                     [[row[name] for name in names] + [row['student_id']] for row in rows])
+                else:
+                    quoted = ', '.join(f'"{name}"' for name in names)
+                    conn.executemany(f'INSERT OR REPLACE INTO "{table}" ({quoted}) VALUES '
+                                     f'({", ".join("?" * len(names))})',
+                                     [[row[name] for name in names] for row in rows])
+            for student_id in {row.get('student_id') for _, row in batch} - {None}:
+                self._changed(student_id)
+
+    def transaction(self):
+        """
+        Unit of Work: bündelt alle Schreibzugriffe im Block in einer Transaktion.
+
+        Beispiel:
+            with db.transaction():
+                db.save_dashboard_data(student_id, data)
+                db.save_module_completions(student_id, completions)
+        """
+        return self._pool.transaction()
+
+    def _changed(self, student_id):
+        """
+        Vergibt in der laufenden Transaktion eine neue Inhaltsversion für den Studenten.
+
+        Die Nummer wird unter der Schreibsperre ermittelt und ist damit
+        datenbankweit eindeutig; in ``versions`` steht sie erst nach dem Commit.
+        """
+        conn = self._pool.connection()
+        changed = time.time()
+        # Die Transaktion hat bereits geschrieben und hält damit die Schreibsperre
+        version = conn.execute('SELECT COALESCE(MAX(version), 0) + 1 FROM content_versions').fetchone()[0]
+        conn.execute('''INSERT INTO content_versions (student_id, version, changed, origin) VALUES (?, ?, ?, ?)
+                        ON CONFLICT (student_id) DO UPDATE SET version = excluded.version,
+                        changed = excluded.changed, origin = excluded.origin''',
+                     (student_id, version, changed, self.origin))
+        self._pool.after_commit(self.versions.update, student_id, version, changed)
+
+    def _load_version(self, student_id):
+        """Gibt (Version, Änderungszeitpunkt) eines Studenten aus content_versions zurück oder None."""
+        conn = self._pool.connection()
+        return conn.execute('SELECT version, changed FROM content_versions WHERE student_id = ?',
+                            (student_id,)).fetchone()
+
+    def add_change_listener(self, listener):
+        """Registriert listener(student_id) für Änderungen, die poll_changes() von anderen übernimmt."""
+        self._listeners.append(listener)
+
+    def poll_changes(self):
+        """
+        Übernimmt Änderungen anderer Prozesse bzw. Database-Instanzen.
+
+        PRAGMA data_version ändert sich nur, wenn über eine andere Verbindung
+        committet wurde; nur dann werden die seither vergebenen
+        Inhaltsversionen gelesen (über einen Index, also in O(Änderungen)).
+        Für fremde Änderungen werden die registrierten Listener aufgerufen.
+        """
+        conn = self._pool.connection()
+        data_version = conn.execute('PRAGMA data_version').fetchone()[0]
+        state = self._poll_state
+        if getattr(state, 'conn', None) is conn and state.data_version == data_version:
+            return
+        state.conn, state.data_version = conn, data_version
+        with self._poll_lock:
+            rows = conn.execute('''SELECT student_id, version, changed, origin FROM content_versions
+                                   WHERE version > ? ORDER BY version''', (self._seen_version,)).fetchall()
+            for student_id, version, changed, origin in rows:
+                self._seen_version = version
+                self.versions.update(student_id, version, changed)
+                if origin != self.origin:
+                    for listener in self._listeners:
+                        listener(student_id)
+
+    def after_commit(self, callback, *args):
+        """Führt callback(*args) nach dem Commit der laufenden Transaktion aus (siehe ConnectionPool)."""
+        self._pool.after_commit(callback, *args)
+
+    def connection(self):
+        """Gibt die Verbindung des aktuellen Threads zurück (für lesende Auswertungen, siehe analytics.py)."""
+        return self._pool.connection()
+    
+    def save_dashboard_data(self, student_id, data):
+        """Speichert oder aktualisiert die Dashboard-Daten eines Studenten."""
+        with self._pool.transaction() as conn:
+            conn.execute('''INSERT INTO dashboard_data
+                            (student_id, gpa, target_gpa, target_end_date, 
+                            avg_module_time, target_module_time, last_updated)
+                            VALUES (?, ?, ?, ?, ?, ?, ?)
+                            ON CONFLICT (student_id) DO UPDATE SET
+                            gpa = excluded.gpa, target_gpa = excluded.target_gpa,
+                            target_end_date = excluded.target_end_date,
+                            avg_module_time = excluded.avg_module_time,
+                            target_module_time = excluded.target_module_time,
+                            last_updated = excluded.last_updated''',
+                        (student_id, data['gpa'], data['target_gpa'],
+                        data['target_end_date'], data['avg_module_time'],
+                        data['target_module_time'], datetime.datetime.now().isoformat()))
+            self._changed(student_id)
+    
+    def update_target_gpa(self, student_id, target_gpa):
+        """Aktualisiert die Ziel-Note eines Studenten."""
+        with self._pool.transaction() as conn:
+            conn.execute('''UPDATE dashboard_data SET target_gpa = ?, last_updated = ? 
+                           WHERE student_id = ?''', 
+                        (target_gpa, datetime.datetime.now().isoformat(), student_id))
+            self._changed(student_id)
+    
+    def update_target_end_date(self, student_id, target_end_date):
+        """Aktualisiert das Ziel-Enddatum eines Studenten."""
+        with self._pool.transaction() as conn:
+            conn.execute('''UPDATE dashboard_data SET target_end_date = ?, last_updated = ? 
+                           WHERE student_id = ?''', 
+                        (target_end_date, datetime.datetime.now().isoformat(), student_id))
+            self._changed(student_id)
+    
+    def save_deadline(self, student_id, deadline_type, module_name, deadline_date):
+        """Speichert eine neue Frist in der Datenbank und gibt ihre ID zurück."""
+        with self._pool.transaction() as conn:
+            cursor = conn.execute('''INSERT INTO deadlines (student_id, deadline_type, module_name, deadline_date)
+                                     VALUES (?, ?, ?, ?)''', (student_id, deadline_type, module_name, deadline_date))
+            self._changed(student_id)
+            return cursor.lastrowid
+    
+    def delete_deadline(self, deadline_id):
+        """Löscht eine Frist anhand ihrer ID."""
+        with self._pool.transaction() as conn:
+            row = conn.execute('SELECT student_id FROM deadlines WHERE id = ?', (deadline_id,)).fetchone()
+            conn.execute('DELETE FROM deadlines WHERE id = ?', (deadline_id,))
+            conn.execute('DELETE FROM reminders_sent WHERE deadline_id = ?', (deadline_id,))
+            if row is not None:
+                self._changed(row[0])
+    
+    def save_module_completion(self, student_id, module_id, grade, completion_date):
+        """
+        Speichert den Abschluss eines Moduls mit Note und Datum.
+
+        Ist das Modul bereits abgeschlossen, wird nur die Note aktualisiert;
+        das ursprüngliche Abschlussdatum bleibt erhalten.
+        """
+        with self._pool.transaction() as conn:
+            conn.execute('''INSERT INTO completed_modules
+                            (student_id, module_id, completion_date, grade)
+                            VALUES (?, ?, ?, ?)
+                            ON CONFLICT (student_id, module_id) DO UPDATE SET grade = excluded.grade''',
+                         (student_id, module_id, completion_date, grade))
+            self._changed(student_id)
+    
+    def save_module_completions(self, student_id, completions):
+        """
+        Speichert mehrere Modulabschlüsse mit einem einzigen executemany.
+
+        Args:
+            student_id: Matrikelnummer
+            completions: Iterable aus (module_id, grade, completion_date)
+        """
+        with self._pool.transaction() as conn:
+            conn.executemany('''INSERT INTO completed_modules
+                                (student_id, module_id, completion_date, grade)
+                                VALUES (?, ?, ?, ?)
+                                ON CONFLICT (student_id, module_id) DO UPDATE SET grade = excluded.grade''',
+                             [(student_id, module_id, completion_date, grade)
+                              for module_id, grade, completion_date in completions])
+            self._changed(student_id)
+    
+    def get_completed_modules(self, student_id):
+        """Gibt alle abgeschlossenen Module eines Studenten zurück."""
+        conn = self._pool.connection()
+        return conn.execute('SELECT * FROM completed_modules WHERE student_id = ?', (student_id,)).fetchall()
+
+    def save_exams(self, student_id, new_exams=(), grades=()):
+        """
+        Speichert neue Prüfungen und geänderte Noten in einer Transaktion.
+
+        Jede geschriebene Zeile erhält die nächste Revision des Studenten.
+
+        Args:
+            student_id: Matrikelnummer
+            new_exams: Iterable aus (module_id, semester_number, semester_year, grade)
+            grades: Iterable aus (exam_id, grade) bereits gespeicherter Prüfungen
+
+        Returns:
+            tuple: (IDs der neuen Prüfungen, höchste Revision vor und nach dem Schreiben)
+        """
+        now = datetime.datetime.now().isoformat()
+        with self._pool.transaction() as conn:
+            ids = [conn.execute(f'''INSERT INTO exams (student_id, module_id, semester_number, semester_year,
+                                    grade, exam_date, last_updated, revision)
+                                    VALUES (?, ?, ?, ?, ?, ?, ?, {NEXT_EXAM_REVISION})''',
+                                (student_id, module_id, number, year, grade, now, now, student_id)).lastrowid
+                   for module_id, number, year, grade in new_exams]
+            written = len(ids)
+            for exam_id, grade in grades:
+                written += conn.execute(f'''UPDATE exams SET grade = ?, last_updated = ?, revision = {NEXT_EXAM_REVISION}
+                                            WHERE id = ? AND student_id = ?''',
+                                        (grade, now, student_id, exam_id, student_id)).rowcount
+            after = conn.execute('SELECT COALESCE(MAX(revision), 0) FROM exams WHERE student_id = ?',
+                                 (student_id,)).fetchone()[0]
+            if written:
+                self._changed(student_id)
+            # Unter der Schreibsperre sind die eigenen Revisionen lückenlos
+            return ids, after - written, after
+
+    def get_exams(self, student_id, after_revision=0):
+        """
+        Gibt die seit einer Revision geschriebenen Prüfungen eines Studenten zurück.
+
+        Returns:
+            list: (id, module_id, semester_number, semester_year, grade, revision) nach Revision sortiert
+        """
+        conn = self._pool.connection()
+        return conn.execute('''SELECT id, module_id, semester_number, semester_year, grade, revision FROM exams
+                               WHERE student_id = ? AND revision > ? ORDER BY revision''',
+                            (student_id, after_revision)).fetchall()
+
+    def get_exam_statistics(self, student_id):
+        """
+        Berechnet die Kennzahlen der Prüfungen eines Studenten direkt in SQL.
+
+        Berücksichtigt werden wie im Dashboard nur Prüfungen in Modulen des
+        eigenen Studiengangs.
+
+        Returns:
+            tuple: (Prüfungen, benotete Prüfungen, Durchschnitt, nach Credits
+            gewichteter Durchschnitt, Credits bestandener Module); die
+            Durchschnitte sind None, solange keine Note vorliegt
+        """
+        conn = self._pool.connection()
+        return conn.execute('''SELECT COUNT(*), COUNT(e.grade), AVG(e.grade),
+                                      SUM(e.grade * m.credits) / SUM(CASE WHEN e.grade IS NOT NULL THEN m.credits END),
+                                      (SELECT COALESCE(SUM(passed.credits), 0) FROM course_modules AS passed
+                                       WHERE passed.course_id = s.course_id AND passed.module_id IN
+                                             (SELECT module_id FROM exams WHERE student_id = s.student_id
+                                              AND grade <= 4.0))
+                               FROM students AS s
+                               JOIN exams AS e ON e.student_id = s.student_id
+                               JOIN course_modules AS m ON m.course_id = s.course_id AND m.module_id = e.module_id
+                               WHERE s.student_id = ?''', (student_id,)).fetchone()
+    
+    def get_deadlines(self, student_id):
+        """Gibt alle Fristen eines Studenten sortiert nach Datum zurück."""
+        conn = self._pool.connection()
+        return conn.execute('SELECT * FROM deadlines WHERE student_id = ? ORDER BY deadline_date, id',
+                            (student_id,)).fetchall()
+
+    def get_pending_reminders(self, since_date, student_id=None):
+        """
+        Gibt die Fristen ab since_date zurück, an die noch nicht erinnert wurde.
+
+        Args:
+            since_date: Frühestes Fristdatum (ISO-Format)
+            student_id: Nur die Fristen dieses Studenten (Standard: alle)
+
+        Returns:
+            list: (id, student_id, deadline_type, module_name, deadline_date)-Tupel
+        """
+        conn = self._pool.connection()
+        query = '''SELECT d.id, d.student_id, d.deadline_type, d.module_name, d.deadline_date
+                   FROM deadlines d LEFT JOIN reminders_sent r ON r.deadline_id = d.id
+                   WHERE r.deadline_id IS NULL AND d.deadline_date >= ?'''
+        if student_id is None:
+            return conn.execute(query, (since_date,)).fetchall()
+        return conn.execute(query + ' AND d.student_id = ?', (since_date, student_id)).fetchall()
+
+    def claim_reminder(self, deadline_id):
+        """
+        Vermerkt die Erinnerung an eine Frist als versandt.
+
+        Returns:
+            bool: True, wenn die Frist noch besteht und bisher niemand an sie erinnert hat
+        """
+        with self._pool.transaction() as conn:
+            cursor = conn.execute('''INSERT OR IGNORE INTO reminders_sent (deadline_id, sent)
+                                     SELECT id, ? FROM deadlines WHERE id = ?''', (time.time(), deadline_id))
+            return cursor.rowcount == 1
+
+    def save_student(self, student):
+        """Speichert einen Studenten samt Studiengang und Modulen."""
+        course = student.study_course
+        with self._pool.transaction() as conn:
+            conn.execute('INSERT OR REPLACE INTO courses (course_id, name, duration_semesters) VALUES (?, ?, ?)',
+                         (course.course_id, course.name, course.duration_semesters))
+            conn.execute('DELETE FROM course_modules WHERE course_id = ?', (course.course_id,))
+            conn.executemany('''INSERT INTO course_modules (course_id, module_id, name, credits, position)
+                                VALUES (?, ?, ?, ?, ?)''',
+                             [(course.course_id, m.module_id, m.name, m.credits, position)
+                              for position, m in enumerate(course.modules)])
+            conn.execute('INSERT OR REPLACE INTO students (student_id, name, course_id) VALUES (?, ?, ?)',
+                         (student.student_id, student.name, course.course_id))
+            self._changed(student.student_id)
+
+    def get_student(self, student_id):
+        """Gibt (student_id, name, course_id) eines Studenten zurück oder None."""
+        conn = self._pool.connection()
+        return conn.execute('SELECT student_id, name, course_id FROM students WHERE student_id = ?',
+                            (student_id,)).fetchone()
+
+    def get_first_student_id(self):
+        """Gibt die ID des zuerst angelegten Studenten zurück oder None."""
+        conn = self._pool.connection()
+        row = conn.execute('SELECT student_id FROM students ORDER BY rowid LIMIT 1').fetchone()
+        return row[0] if row else None
+
+    def get_course(self, course_id):
+        """Gibt (course_id, name, duration_semesters) eines Studiengangs zurück oder None."""
+        conn = self._pool.connection()
+        return conn.execute('SELECT course_id, name, duration_semesters FROM courses WHERE course_id = ?',
+                            (course_id,)).fetchone()
+
+    def get_course_modules(self, course_id):
+        """Gibt alle Module eines Studiengangs als (module_id, name, credits) in Reihenfolge zurück."""
+        conn = self._pool.connection()
+        return conn.execute('''SELECT module_id, name, credits FROM course_modules
+                               WHERE course_id = ? ORDER BY position''', (course_id,)).fetchall()
+
+    def get_dashboard_data(self, student_id):
+        """Gibt (target_gpa, target_end_date, target_module_time) des Studenten zurück oder None."""
+        conn = self._pool.connection()
+        return conn.execute('''SELECT target_gpa, target_end_date, target_module_time FROM dashboard_data
+                               WHERE student_id = ?''', (student_id,)).fetchone()
+
+
+# Gezählt und zeitlich erfasst werden nur die Abfragen. Verwaltung (init_database, close,
+# poll_changes einmal je Anfrage), Sicherung und Export/Import würden die Verteilung verzerren.
+DATABASE_QUERIES = (
+    'save_dashboard_data', 'update_target_gpa', 'update_target_end_date', 'save_deadline', 'delete_deadline',
+    'save_module_completion', 'save_module_completions', 'get_completed_modules', 'save_exams', 'get_exams',
+    'get_exam_statistics', 'get_deadlines', 'get_pending_reminders', 'claim_reminder', 'save_student',
+    'get_student', 'get_first_student_id', 'get_course', 'get_course_modules', 'get_dashboard_data',
+)
+instrument_methods(Database, db_call_seconds, DATABASE_QUERIES)
+
+
+class BulkImporter:
+    """
+    Lädt ganze Jahrgänge aus CSV- oder JSONL-Dateien in die Datenbank.
+
+    Unterstützte Datensätze (CSV-Spalten bzw. JSON-Schlüssel):
+    - modules: course_id, course_name, duration_semesters, module_id, name, credits
+    - students: student_id, name, course_id [, target_gpa, target_module_time, target_end_date]
+    - exams: student_id, module_id, grade [, date, semester, year]
+    - completions: student_id, module_id, grade, completion_date
+
+    Prüfungen landen in der Tabelle exams, bestandene (Note <= 4.0)
+    zusätzlich als Modulabschluss. Modulabschlüsse, zu denen noch keine
+    bestandene Prüfung gespeichert ist, werden als Prüfung übernommen.
+    Die Dateien werden zeilenweise gelesen und in Blöcken zu batch_size
+    Zeilen per executemany in jeweils einer Transaktion geschrieben.
+
+    Attribute:
+        batch_size: Zeilen pro Transaktion
+    """
+    KINDS = ('modules', 'students', 'exams', 'completions')
+
+    def __init__(self, db, batch_size=5000):
+        """Initialisiert den Importer für die angegebene Datenbank."""
+        self._db = db
+        self.batch_size = batch_size
+
+    def import_file(self, kind, path):
+        """
+        Importiert eine Datei und gibt die Anzahl der gelesenen Datensätze zurück.
+
+        Args:
+            kind: Art der Datensätze (siehe KINDS)
+            path: Pfad zu einer .csv- oder .jsonl-Datei
+        """
+        if kind not in self.KINDS:
+            raise ValueError(f"Unbekannte Datensatzart: {kind}")
+        write_batch = getattr(self, f'_write_{kind}')
+        records = read_records(path)
+        count = 0
+        while True:
+            batch = list(itertools.islice(records, self.batch_size))
+            if not batch:
+                return count
+            with self._db.transaction() as conn:
+                write_batch(conn, batch)
+                for student_id in {record.get('student_id') for record in batch} - {None}:
+                    self._db._changed(student_id)
+            count += len(batch)
+
+    def _write_modules(self, conn, batch):
+        conn.executemany('''INSERT INTO courses (course_id, name, duration_semesters) VALUES (?, ?, ?)
+                            ON CONFLICT (course_id) DO UPDATE SET name = excluded.name,
+                            duration_semesters = excluded.duration_semesters''',
+                         {r['course_id']: (r['course_id'], r.get('course_name') or r['course_id'],
+                                           int(r.get('duration_semesters') or 6)) for r in batch}.values())
+        conn.executemany('''INSERT OR REPLACE INTO course_modules (course_id, module_id, name, credits, position)
+                            VALUES (?, ?, ?, ?, COALESCE(?, (SELECT COUNT(*) FROM course_modules WHERE course_id = ?)))''',
+                         [(r['course_id'], r['module_id'], r['name'], int(r['credits']),
+                           r.get('position') or None, r['course_id']) for r in batch])
+
+    def _write_students(self, conn, batch):
+        conn.executemany('INSERT OR REPLACE INTO students (student_id, name, course_id) VALUES (?, ?, ?)',
+                         [(r['student_id'], r['name'], r['course_id']) for r in batch])
+        now = datetime.datetime.now().isoformat()
+        conn.executemany('''INSERT INTO dashboard_data
+                            (student_id, target_gpa, target_end_date, target_module_time, last_updated)
+                            VALUES (?, ?, ?, ?, ?)
+                            ON CONFLICT (student_id) DO UPDATE SET target_gpa = excluded.target_gpa,
+                            target_end_date = excluded.target_end_date,
+                            target_module_time = excluded.target_module_time,
+                            last_updated = excluded.last_updated''',
+                         [(r['student_id'], float(r.get('target_gpa') or 3.0), r.get('target_end_date') or None,
+                           int(r.get('target_module_time') or 60), now) for r in batch])
+
+    def _write_exams(self, conn, batch):
+        now = datetime.datetime.now().isoformat()
+        batch = [dict(r, grade=float(r['grade']) if r.get('grade') not in (None, '') else None) for r in batch]
+        conn.executemany(f'''INSERT INTO exams (student_id, module_id, semester_number, semester_year,
+                             grade, exam_date, last_updated, revision)
+                             VALUES (?, ?, ?, ?, ?, ?, ?, {NEXT_EXAM_REVISION})''',
+                         [(r['student_id'], r['module_id'], optional_int(r.get('semester')),
+                           optional_int(r.get('year')), r['grade'], r.get('date') or None, now, r['student_id'])
+                          for r in batch])
+        self._write_module_completions(conn, [dict(r, completion_date=r.get('date') or now) for r in batch
+                                              if r['grade'] is not None and r['grade'] <= 4.0])
+
+    def _write_completions(self, conn, batch):
+        now = datetime.datetime.now().isoformat()
+        self._write_module_completions(conn, batch)
+        conn.executemany(f'''INSERT INTO exams (student_id, module_id, grade, exam_date, last_updated, revision)
+                             SELECT ?, ?, ?, ?, ?, {NEXT_EXAM_REVISION}
+                             WHERE NOT EXISTS (SELECT 1 FROM exams WHERE student_id = ? AND module_id = ?
+                                               AND grade <= 4.0)''',
+                         [(r['student_id'], r['module_id'], float(r['grade']), r['completion_date'], now,
+                           r['student_id'], r['student_id'], r['module_id']) for r in batch])
+
+    def _write_module_completions(self, conn, batch):
+        conn.executemany('''INSERT INTO completed_modules (student_id, module_id, completion_date, grade)
+                            VALUES (?, ?, ?, ?)
+                            ON CONFLICT (student_id, module_id) DO UPDATE SET grade = excluded.grade''',
+                         [(r['student_id'], r['module_id'], r['completion_date'], float(r['grade']))
+                          for r in batch])
+
+
+def optional_int(value):
+    """Wandelt einen optionalen Wert aus CSV oder JSON in int um (leer wird zu None)."""
+    return int(value) if value not in (None, '') else None
+
+
+def read_records(path):
+    """
+    Liest Datensätze zeilenweise aus einer CSV- oder JSONL-Datei.
+
+    Yields:
+        dict: Ein Datensatz je Zeile
+    """
+    import csv
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if path.endswith('.csv'):
+            yield from csv.DictReader(f)
+        else:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+class ExamAggregates:
+    """
+    Laufende Kennzahlen über die Prüfungen eines Dashboards.
+
+    Wird bei jeder neuen Prüfung und jeder Notenänderung in O(1)
+    fortgeschrieben, sodass Notendurchschnitt und Fortschritt nicht bei
+    jedem Seitenaufruf über die gesamte Prüfungshistorie berechnet werden.
+    Summen werden exakt (als Bruch) geführt und liefern damit dieselben
+    Werte wie statistics.mean. Prüfungen werden über ihren Index im
+    ExamStore angesprochen; je Modul werden nur die Indizes der bestandenen
+    Prüfungen aufsteigend sortiert gehalten, die erste davon zählt. Fällt
+    sie durch eine Notenänderung weg, rückt die nächste nach, ohne die
+    Historie zu durchsuchen.
+
+    Attribute:
+        exam_count: Anzahl der erfassten Prüfungen
+        grade_count: Anzahl der benoteten Prüfungen
+        completed_credits: Summe der Credits aller bestandenen Module
+    """
+    PASSING_GRADE = 4.0
+
+    def __init__(self, store):
+        """Initialisiert leere Kennzahlen über den Prüfungen eines ExamStore."""
+        self._store = store
+        self.reset()
+
+    def reset(self):
+        """Setzt alle Kennzahlen zurück."""
+        self.exam_count = 0
+        self.grade_count = 0
+        self.completed_credits = 0
+        self._grade_sum = Fraction(0)
+        self._weighted_sum = Fraction(0)
+        self._weighted_credits = 0
+        self._passing = {}
+        self._completed = {}
+
+    def rebuild(self):
+        """Berechnet alle Kennzahlen aus dem Store neu, z.B. nach Änderungen an ihm vorbei."""
+        self.reset()
+        for index in range(len(self._store)):
+            self.add(index)
+
+    def add(self, index):
+        """Nimmt die Prüfung mit dem angegebenen Index auf."""
+        self.exam_count += 1
+        self._apply(index, self._store.grade(index), 1)
+
+    def update_grade(self, index, old_grade, new_grade):
+        """Schreibt die Kennzahlen nach einer Notenänderung fort."""
+        self._apply(index, old_grade, -1)
+        self._apply(index, new_grade, 1)
+
+    @property
+    def gpa(self):
+        """Notendurchschnitt aller benoteten Prüfungen (0.0 ohne Noten)."""
+        return round(float(self._grade_sum / self.grade_count), 2) if self.grade_count else 0.0
+
+    @property
+    def weighted_gpa(self):
+        """Nach Credits gewichteter Notendurchschnitt aller benoteten Prüfungen."""
+        if not self._weighted_credits:
+            return 0.0
+        return round(float(self._weighted_sum / self._weighted_credits), 2)
+
+    @property
+    def completed_exams(self):
+        """Je bestandenem Modul die erste bestandene Prüfung, in Abschlussreihenfolge."""
+        return [self._store.view(index) for index in self._completed.values()]
+
+    @property
+    def completed_module_ids(self):
+        """Live-Sicht auf die module_ids aller bestandenen Module (Mitgliedstest in O(1))."""
+        return self._completed.keys()
+
+    def _apply(self, index, grade, sign):
+        """Addiert (sign=1) bzw. entfernt (sign=-1) den Beitrag einer Note."""
+        if grade is None:
+            return
+        module = self._store.module(index)
+        credits = module.credits
+        self.grade_count += sign
+        self._grade_sum += sign * Fraction(grade)
+        self._weighted_sum += sign * Fraction(grade) * credits
+        self._weighted_credits += sign * credits
+        if grade > self.PASSING_GRADE:
+            return
+
+        module_id = module.module_id
+        passing = self._passing.get(module_id)
+        if sign > 0:
+            if passing is None:
+                passing = self._passing[module_id] = []
+                self.completed_credits += credits
+            # Neue Prüfungen haben den größten Index; insort hängt dann nur an
+            bisect.insort(passing, index)
+        else:
+            del passing[bisect.bisect_left(passing, index)]
+            if not passing:
+                del self._passing[module_id]
+                del self._completed[module_id]
+                self.completed_credits -= credits
+                return
+        self._completed[module_id] = passing[0]
+
+
+class GpaCalculator:
+    """
+    Berechnet den Notendurchschnitt und verwaltet die Ziel-Note.
+
+    Attribute:
+        target_gpa: Angestrebter Notendurchschnitt
+    """
+    def __init__(self, target_gpa: float, db: Database, student_id: str, aggregates: ExamAggregates = None):
+        """Initialisiert den GpaCalculator mit Ziel-Note, Datenbankzugang und laufenden Kennzahlen."""
+        self.target_gpa = target_gpa
+        self._db = db
+        self._student_id = student_id
+        self._aggregates = aggregates
+
+    def calculate(self, exams: list = None) -> float:
+        """
+        Berechnet den aktuellen Notendurchschnitt aller benoteten Prüfungen.
+
+        Ohne Argument wird der laufend fortgeschriebene Wert verwendet (O(1)).
+        """
+        if exams is None:
+            return self._aggregates.gpa
+        graded_exams = [exam for exam in exams if exam.grade is not None]
+        return round(mean([exam.grade for exam in graded_exams]), 2) if graded_exams else 0.0
+
+    def calculate_weighted(self) -> float:
+        """Gibt den nach Credits gewichteten Notendurchschnitt zurück (O(1))."""
+        return self._aggregates.weighted_gpa
+
+    def update_target(self, new_target_gpa: float):
+        """Aktualisiert die Ziel-Note und speichert sie in der Datenbank."""
+        self.target_gpa = new_target_gpa
+        self._db.update_target_gpa(self._student_id, new_target_gpa)
+
+
+class DeadlineManager:
+    """
+    Verwaltet Fristen: Hinzufügen, Löschen und Neuladen aus der Datenbank.
+
+    Die Fristen liegen in einem nach (Datum, ID) sortierten Index, der per
+    bisect fortgeschrieben wird, und sind über ihre stabile Datenbank-ID
+    adressierbar. Neu geladen wird nur, wenn sich die Inhaltsversion des
+    Studenten seit dem letzten Abgleich geändert hat. Alle Änderungen laufen
+    unter einer Sperre; ``deadlines`` wird dabei jeweils ersetzt, nie
+    verändert, sodass Leser stets einen konsistenten Stand sehen.
+
+    Attribute:
+        deadlines: Nach Datum sortierte Liste der Fristen als Dictionaries
+    """
+    def __init__(self, student_id: str, db: Database):
+        """Initialisiert den DeadlineManager mit Studenten-ID und Datenbankzugang."""
+        self._student_id = student_id
+        self._db = db
+        self._lock = threading.RLock()
+        self._keys = []
+        self._by_id = {}
+        self._loaded_version = None
+        self.deadlines = []
+
+    def get(self, deadline_id: int):
+        """Gibt die Frist mit der angegebenen ID zurück oder None."""
+        return self._by_id.get(deadline_id)
+
+    def page(self, after=None, limit=None):
+        """
+        Gibt die Fristen nach dem Schlüssel (Datum, ID) after zurück.
+
+        Args:
+            after: Schlüssel der zuletzt gelieferten Frist oder None für den Anfang
+            limit: Höchstzahl der Fristen oder None für alle
+
+        Returns:
+            tuple: (Fristen, ob weitere Fristen folgen)
+        """
+        with self._lock:
+            start = 0 if after is None else bisect.bisect_right(self._keys, after)
+            end = len(self.deadlines) if limit is None else start + limit
+            return self.deadlines[start:end], end < len(self.deadlines)
+
+    def add(self, deadline_type: str, module_name: str, deadline_date: str) -> int:
+        """Fügt eine neue Frist hinzu, speichert sie in der Datenbank und gibt ihre ID zurück."""
+        with self._lock:
+            synced = self._is_synced()
+            deadline_id = self._db.save_deadline(self._student_id, deadline_type, module_name, deadline_date)
+            self._insert({'id': deadline_id, 'type': deadline_type, 'module': module_name, 'date': deadline_date})
+            self._mark_synced(synced)
+            if _reminders is not None:
+                self._db.after_commit(_reminders.add, deadline_id, self._student_id, deadline_type,
+                                      module_name, deadline_date)
+            return deadline_id
+
+    def delete(self, deadline_id: int) -> bool:
+        """Löscht eine Frist anhand ihrer ID; gibt False zurück, falls sie nicht existiert."""
+        with self._lock:
+            deadline = self._by_id.get(deadline_id)
+            if deadline is None:
+                return False
+            synced = self._is_synced()
+            self._db.delete_deadline(deadline_id)
+            position = bisect.bisect_left(self._keys, (deadline['date'], deadline_id))
+            del self._keys[position]
+            del self._by_id[deadline_id]
+            self.deadlines = self.deadlines[:position] + self.deadlines[position + 1:]
+            self._mark_synced(synced)
+            if _reminders is not None:
+                self._db.after_commit(_reminders.discard, deadline_id)
+            return True
+
+    def reload(self, force: bool = False):
+        """Lädt alle Fristen aus der Datenbank neu, sofern sich die Daten geändert haben."""
+        with self._lock:
+            version = self._db.versions.get(self._student_id)[0]
+            if not force and version == self._loaded_version:
+                return
+            deadlines = [{'id': deadline[0], 'type': deadline[2], 'module': deadline[3], 'date': deadline[4]}
+                         for deadline in self._db.get_deadlines(self._student_id)]
+            self._keys = [(deadline['date'], deadline['id']) for deadline in deadlines]
+            self._by_id = {deadline['id']: deadline for deadline in deadlines}
+            self.deadlines = deadlines
+            self._loaded_version = version
+
+    def _insert(self, deadline):
+        """Fügt eine Frist an der sortierten Position in den Index ein."""
+        key = (deadline['date'], deadline['id'])
+        position = bisect.bisect_left(self._keys, key)
+        self._keys.insert(position, key)
+        self._by_id[deadline['id']] = deadline
+        self.deadlines = self.deadlines[:position] + [deadline] + self.deadlines[position:]
+
+    def _is_synced(self):
+        """Prüft, ob der Index dem zuletzt geladenen Datenbankstand entspricht."""
+        return self._loaded_version == self._db.versions.get(self._student_id)[0]
+
+    def _mark_synced(self, synced):
+        """Übernimmt nach einer eigenen Änderung die neue Version, ohne neu zu laden."""
+        if synced:
+            self._loaded_version = self._db.versions.get(self._student_id)[0]
+
+
+class LogReminderSink:
+    """Schreibt Erinnerungen zeilenweise in eine Logdatei (UTF-8)."""
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def __call__(self, reminder: dict):
+        line = (f"{datetime.datetime.now().isoformat(timespec='seconds')} {reminder['student_id']} "
+                f"{reminder['date']} {reminder['type']}: {reminder['module']}\n")
+        with self._lock, open(self.path, 'a', encoding='utf-8') as log:
+            log.write(line)
+
+
+class OutboxReminderSink:
+    """
+    Legt Erinnerungen als E-Mails in einem Ausgangsordner ab (Ersatz für einen Mailserver).
+
+    Jede Nachricht ist eine .eml-Datei, die sich mit einem Mailprogramm
+    öffnen oder später per smtplib versenden lässt. Die Empfängeradresse
+    ist die Matrikelnummer an der angegebenen Domain.
+    """
+    def __init__(self, directory: str, sender: str = 'dashboard@localhost', domain: str = 'localhost'):
+        self.directory = directory
+        self.sender = sender
+        self.domain = domain
+
+    def __call__(self, reminder: dict):
+        from email.message import EmailMessage
+        message = EmailMessage()
+        message['From'] = self.sender
+        message['To'] = f"{reminder['student_id']}@{self.domain}"
+        message['Date'] = formatdate(localtime=True)
+        message['Subject'] = f"Erinnerung: {reminder['type']} {reminder['module']} am {reminder['date']}"
+        message.set_content(f"Hallo,\n\nam {reminder['date']} ist folgende Frist fällig:\n"
+                            f"{reminder['type']}: {reminder['module']}\n\nDein Studenten-Dashboard\n")
+        os.makedirs(self.directory, exist_ok=True)
+        name = re.sub(r'[^\w.-]', '_', f"{reminder['date']}-{reminder['id']}-{reminder['student_id']}")
+        path = os.path.join(self.directory, name + '.eml')
+        # Erst vollständig schreiben, dann umbenennen: Leser sehen nie halbe Nachrichten
+        with open(path + '.tmp', 'wb') as outbox:
+            outbox.write(message.as_bytes())
+        os.replace(path + '.tmp', path)
+
+
+class ReminderScheduler:
+    """
+    Erinnert an bevorstehende Fristen aller Studenten.
+
+    Die offenen Erinnerungen liegen in einem Heap, geordnet nach Fälligkeit
+    (``lead_days`` Tage vor der Frist, 0 Uhr Ortszeit). Ein Hintergrund-Thread
+    schläft an einer Condition bis zur nächsten Fälligkeit. add() und
+    discard() ändern den Heap in O(log n) und wecken den Thread nur, wenn
+    sich die nächste Fälligkeit nach vorn verschiebt; gelöschte Einträge
+    werden markiert und verworfen, sobald sie an die Spitze gelangen.
+
+    Beim Start werden alle offenen Fristen einmal geladen, danach meldet
+    DeadlineManager eigene Änderungen nach dem Commit. Änderungen anderer
+    Prozesse kommen über Database.poll_changes() an, das der Thread
+    spätestens alle POLL_INTERVAL Sekunden selbst aufruft (ein PRAGMA
+    data_version), also auch ohne eingehende Anfragen; dann werden nur die
+    Fristen des betroffenen Studenten neu gelesen. Vor dem Versand wird
+    jede Erinnerung in reminders_sent vermerkt, sodass auch bei mehreren
+    Prozessen (prefork) oder nach einem Neustart genau einmal erinnert wird.
+
+    Attribute:
+        sinks: Empfänger der Erinnerungen, aufgerufen als sink(reminder)
+        lead_days: Vorlauf in Tagen
+        sent: Anzahl der von diesem Prozess versandten Erinnerungen
+    """
+    POLL_INTERVAL = 5.0
+
+    def __init__(self, db: Database, sinks, lead_days: int = 1):
+        """
+        Initialisiert den Scheduler.
+
+        Args:
+            db: Datenbank mit den Fristen
+            sinks: Aufrufbare Empfänger; reminder ist ein Dictionary mit
+                id, student_id, type, module und date
+            lead_days: Wie viele Tage vor der Frist erinnert wird
+        """
+        self._db = db
+        self.sinks = list(sinks)
+        self.lead_days = lead_days
+        self.sent = 0
+        self._heap = []
+        self._entries = {}
+        self._by_student = {}
+        self._removed = 0
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._stopped = False
+        self._thread = None
+
+    def start(self):
+        """Lädt alle offenen Erinnerungen und startet den Hintergrund-Thread."""
+        self._db.add_change_listener(self.resync)
+        with self._condition:
+            for row in self._db.get_pending_reminders(datetime.date.today().isoformat()):
+                self.add(*row)
+        self._thread = threading.Thread(target=self._run, name='deadline-reminders', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        """Beendet den Hintergrund-Thread; bereits fällige Erinnerungen werden noch versandt."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def pending(self) -> int:
+        """Gibt die Anzahl der eingeplanten Erinnerungen zurück."""
+        with self._condition:
+            return len(self._entries)
+
+    def next_due(self):
+        """Gibt die Fälligkeit der nächsten Erinnerung als Unix-Zeit zurück oder None."""
+        with self._condition:
+            self._drop_removed()
+            return self._heap[0][0] if self._heap else None
+
+    def add(self, deadline_id: int, student_id: str, deadline_type: str, module_name: str, deadline_date: str):
+        """Plant die Erinnerung an eine Frist ein; eine frühere Planung derselben Frist wird ersetzt."""
+        due = self._due(deadline_date)
+        with self._condition:
+            self._remove(deadline_id)
+            if due is None:
+                return
+            reminder = {'id': deadline_id, 'student_id': student_id, 'type': deadline_type,
+                        'module': module_name, 'date': deadline_date}
+            # Die laufende Nummer ordnet gleich fällige Einträge, ohne die Dictionaries zu vergleichen
+            entry = [due, next(self._sequence), reminder]
+            heapq.heappush(self._heap, entry)
+            self._entries[deadline_id] = entry
+            self._by_student.setdefault(student_id, set()).add(deadline_id)
+            if self._heap[0] is entry:
+                self._condition.notify()
+
+    def discard(self, deadline_id: int):
+        """Streicht die Erinnerung an eine gelöschte Frist."""
+        with self._condition:
+            self._remove(deadline_id)
+
+    def resync(self, student_id: str):
+        """Liest die offenen Fristen eines von anderen geänderten Studenten neu ein."""
+        rows = self._db.get_pending_reminders(datetime.date.today().isoformat(), student_id)
+        with self._condition:
+            for deadline_id in list(self._by_student.get(student_id, ())):
+                self._remove(deadline_id)
+            for row in rows:
+                self.add(*row)
+
+    def _due(self, deadline_date):
+        """Fälligkeit der Erinnerung als Unix-Zeit; None für vergangene oder ungültige Fristen."""
+        try:
+            day = datetime.date.fromisoformat(str(deadline_date)[:10])
+        except ValueError:
+            return None
+        if day < datetime.date.today():
+            return None
+        return time.mktime((day - datetime.timedelta(days=self.lead_days)).timetuple())
+
+    def _remove(self, deadline_id):
+        """Markiert einen Eintrag als gelöscht; baut den Heap neu auf, wenn überwiegend Gelöschtes darin liegt."""
+        entry = self._entries.pop(deadline_id, None)
+        if entry is None:
+            return
+        self._by_student[entry[2]['student_id']].discard(deadline_id)
+        entry[2] = None
+        self._removed += 1
+        if self._removed > 64 and self._removed > len(self._entries):
+            self._heap = [entry for entry in self._heap if entry[2] is not None]
+            heapq.heapify(self._heap)
+            self._removed = 0
+
+    def _drop_removed(self):
+        while self._heap and self._heap[0][2] is None:
+            heapq.heappop(self._heap)
+            self._removed -= 1
+
+    def _pop_due(self, now):
+        """Entnimmt alle bis now fälligen Erinnerungen."""
+        due = []
+        self._drop_removed()
+        while self._heap and self._heap[0][0] <= now:
+            reminder = heapq.heappop(self._heap)[2]
+            del self._entries[reminder['id']]
+            self._by_student[reminder['student_id']].discard(reminder['id'])
+            due.append(reminder)
+            self._drop_removed()
+        return due
+
+    def _run(self):
+        next_poll = time.monotonic() + self.POLL_INTERVAL
+        while True:
+            if time.monotonic() >= next_poll:
+                self._poll()
+                next_poll = time.monotonic() + self.POLL_INTERVAL
+            with self._condition:
+                due = self._pop_due(time.time())
+                if not due:
+                    if self._stopped:
+                        return
+                    timeout = next_poll - time.monotonic()
+                    if self._heap:
+                        timeout = min(timeout, self._heap[0][0] - time.time())
+                    self._condition.wait(max(timeout, 0))
+                    continue
+            for reminder in due:
+                self._send(reminder)
+
+    def _poll(self):
+        """Übernimmt Änderungen anderer Prozesse, auch wenn der Server keine Anfragen erhält."""
+        try:
+            self._db.poll_changes()
+        except sqlite3.Error:
+            traceback.print_exc()
+
+    def _send(self, reminder):
+        """Vermerkt die Erinnerung und übergibt sie an alle Empfänger; Fehler eines Empfängers werden protokolliert."""
+        try:
+            if not self._db.claim_reminder(reminder['id']):
+                return
+        except sqlite3.Error:
+            traceback.print_exc()
+            return
+        for sink in self.sinks:
+            try:
+                sink(reminder)
+            except Exception:
+                print(f"Erinnerung an Frist {reminder['id']} konnte nicht zugestellt werden:", file=sys.stderr)
+                traceback.print_exc()
+        self.sent += 1
+
+
+class ExamRepository:
+    """
+    Lädt und speichert die Prüfungen eines Studenten (Tabelle exams).
+
+    Geladen wird erst beim ersten lesenden Zugriff und danach inkrementell:
+    Jede Zeile trägt eine je Student fortlaufende Revision, und sync() holt
+    nur Zeilen oberhalb der höchsten bereits übernommenen Revision
+    (``watermark``), und auch das nur, wenn sich die Inhaltsversion des
+    Studenten geändert hat. Neue Zeilen werden an den ExamStore angehängt,
+    geänderte Noten dort überschrieben. save() schreibt umgekehrt neue
+    Prüfungen und geänderte Noten aus dem Store in die Datenbank.
+
+    Attribute:
+        watermark: Höchste bereits übernommene Revision
+    """
+    def __init__(self, student_id: str, store: ExamStore, db: Database):
+        """Initialisiert das Repository für den ExamStore eines Studenten."""
+        self._student_id = student_id
+        self._store = store
+        self._db = db
+        self._ids = {}
+        self._indexes = {}
+        self._changed = set()
+        self._loaded_version = None
+        self.watermark = 0
+
+    def sync(self, force: bool = False) -> list:
+        """
+        Übernimmt neue und geänderte Prüfungen aus der Datenbank in den Store.
+
+        Returns:
+            list: Indizes der neu in den Store aufgenommenen Prüfungen
+        """
+        version = self._db.versions.get(self._student_id)[0]
+        if not force and version == self._loaded_version:
+            return []
+        store = self._store
+        course = store.student.study_course
+        added = []
+        for exam_id, module_id, number, year, grade, revision in self._db.get_exams(self._student_id, self.watermark):
+            self.watermark = revision
+            index = self._indexes.get(exam_id)
+            if index is None:
+                module = course.get_module(module_id)
+                if module is None:
+                    continue
+                index = store.add(module, Semester(number, year) if number is not None else None, grade)
+                self._remember(index, exam_id)
+                added.append(index)
+            elif store.grade(index) != grade:
+                store.set_grade(index, grade)
+                self._changed.discard(index)
+        self._loaded_version = version
+        return added
+
+    def is_synced(self) -> bool:
+        """Prüft, ob der Store dem zuletzt abgeglichenen Datenbankstand entspricht."""
+        return self._loaded_version == self._db.versions.get(self._student_id)[0]
+
+    def mark_synced(self, synced: bool):
+        """Übernimmt nach einer Änderung im Speicher die neue Version, ohne neu abzugleichen."""
+        if synced:
+            self._loaded_version = self._db.versions.get(self._student_id)[0]
+
+    def grade_changed(self, index: int):
+        """Merkt eine im Store geänderte Note für das nächste save() vor."""
+        self._changed.add(index)
+
+    def save(self):
+        """Schreibt neue Prüfungen und geänderte Noten aus dem Store in die Datenbank."""
+        store = self._store
+        new = [index for index in range(len(store)) if index not in self._ids]
+        changed = [index for index in self._changed if index in self._ids]
+        if not new and not changed:
+            return
+        records = []
+        for index in new:
+            semester = store.semester(index)
+            records.append((store.module(index).module_id, semester.number if semester is not None else None,
+                            semester.year if semester is not None else None, store.grade(index)))
+        with self._db.transaction():
+            ids, before, after = self._db.save_exams(self._student_id, records,
+                                                     [(self._ids[index], store.grade(index)) for index in changed])
+            self._db.after_commit(self._saved, tuple(zip(new, ids)), tuple(changed), before, after)
+
+    def statistics(self) -> dict:
+        """
+        Berechnet die Kennzahlen direkt in SQL, ohne die Prüfungen zu laden.
+
+        Für lange Historien, die (noch) nicht im Speicher liegen; die
+        Durchschnitte sind Gleitkommawerte, gerundet wie im Dashboard.
+        """
+        count, graded, gpa, weighted_gpa, credits = self._db.get_exam_statistics(self._student_id)
+        return {
+            'exam_count': count,
+            'graded_count': graded,
+            'gpa': round(gpa, 2) if gpa is not None else 0.0,
+            'weighted_gpa': round(weighted_gpa, 2) if weighted_gpa is not None else 0.0,
+            'completed_credits': credits or 0,
+        }
+
+    def _remember(self, index, exam_id):
+        """Verknüpft einen Index im Store mit der ID der gespeicherten Zeile."""
+        self._ids[index] = exam_id
+        self._indexes[exam_id] = index
+
+    def _saved(self, new, changed, before, after):
+        """Übernimmt nach dem Commit die neuen IDs und rückt die Wasserstandsmarke nach."""
+        for index, exam_id in new:
+            self._remember(index, exam_id)
+            self._changed.discard(index)
+        self._changed.difference_update(changed)
+        # Nur nachrücken, wenn keine fremden Zeilen dazwischen liegen
+        if before == self.watermark:
+            self.watermark = after
+
+
+class CompletionTimeline:
+    """
+    Nach Datum sortierte Abschlusstage der Module eines Studenten.
+
+    Je Modul zählt der erste Abschluss (wie in completed_modules); die Tage
+    liegen als Tagesnummern in einer per bisect fortgeschriebenen Liste.
+    Die durchschnittliche Bearbeitungszeit ist der mittlere Abstand zweier
+    aufeinanderfolgender Abschlüsse, also (letzter - erster Tag) geteilt
+    durch (Anzahl - 1), und steht nach jedem Eintrag ohne erneutes Durchlaufen bereit.
+    """
+    __slots__ = ('_days', '_modules')
+
+    def __init__(self, completions=()):
+        """Legt die Zeitleiste aus (Modul-ID, Abschlussdatum)-Paaren an."""
+        self._days = []
+        self._modules = {}
+        for module_id, completion_date in completions:
+            self.add(module_id, completion_date)
+
+    def __len__(self):
+        return len(self._days)
+
+    def add(self, module_id: str, completion_date: str) -> bool:
+        """
+        Trägt den Abschluss eines Moduls ein (ISO-Datum, optional mit Uhrzeit).
+
+        Ein bereits abgeschlossenes Modul behält sein erstes Datum; ungültige
+        Daten werden übergangen. Gibt zurück, ob ein Eintrag hinzukam.
+        """
+        if module_id in self._modules:
+            return False
+        try:
+            day = datetime.date.fromisoformat(str(completion_date)[:10]).toordinal()
+        except ValueError:
+            return False
+        self._modules[module_id] = day
+        bisect.insort(self._days, day)
+        return True
+
+    def last_date(self):
+        """Gibt das Datum des letzten Abschlusses zurück oder None."""
+        return datetime.date.fromordinal(self._days[-1]) if self._days else None
+
+    def average_days(self):
+        """
+        Mittlerer Abstand zwischen zwei Abschlüssen in Tagen.
+
+        None, solange keine zwei Abschlüsse an verschiedenen Tagen vorliegen.
+        """
+        if len(self._days) < 2 or self._days[-1] == self._days[0]:
+            return None
+        return (self._days[-1] - self._days[0]) / (len(self._days) - 1)
+
+
+class StudyProgressService:
+    """
+    Berechnet und verfolgt den Studienfortschritt:
+    abgeschlossene Module, Bearbeitungszeit und voraussichtliches Studienende.
+
+    Die Bearbeitungszeit ergibt sich aus den gespeicherten Abschlussdaten.
+    Die CompletionTimeline wird beim ersten Zugriff einmal geladen und danach
+    nur nach dem Commit neuer Abschlüsse fortgeschrieben.
+
+    Attribute:
+        target_module_days: Ziel-Tage pro Modul
+        target_end_date: Manuell gesetztes Ziel-Enddatum (optional)
+    """
+    def __init__(self, student: Student, target_module_days: int, db: Database,
+                 aggregates: ExamAggregates = None):
+        """Initialisiert den StudyProgressService."""
+        self._student = student
+        self._db = db
+        self._aggregates = aggregates
+        self._timeline = None
+        self.target_module_days = target_module_days
+        self.target_end_date = None
+
+    @property
+    def timeline(self) -> CompletionTimeline:
+        """Die Abschlusszeitleiste; beim ersten Zugriff aus completed_modules geladen."""
+        if self._timeline is None:
+            self._timeline = CompletionTimeline((row[2], row[3]) for row in
+                                                self._db.get_completed_modules(self._student.student_id))
+        return self._timeline
+
+    def get_completed_modules(self, exams: list = None) -> list:
+        """
+        Gibt eine Liste aller bestandenen Module zurück (Note <= 4.0).
+
+        Ohne Argument wird die laufend geführte Menge verwendet.
+        """
+        if exams is None:
+            return [exam.module for exam in self._aggregates.completed_exams]
+        return [exam.module for exam in exams if exam.grade is not None and exam.grade <= 4.0]
+
+    def get_completed_credits(self) -> int:
+        """Gibt die Summe der Credits aller bestandenen Module zurück (O(1))."""
+        return self._aggregates.completed_credits
+
+    def get_remaining_modules(self) -> list:
+        """Gibt die noch nicht bestandenen Module des Studiengangs zurück (lineare Laufzeit)."""
+        return self._student.study_course.partition_modules(self._aggregates.completed_module_ids)[1]
+
+    def calculate_avg_module_time(self) -> int:
+        """
+        Berechnet die durchschnittliche Bearbeitungszeit pro Modul in Tagen.
+
+        Maßgeblich ist der mittlere Abstand der gespeicherten Abschlüsse;
+        ohne zwei Abschlüsse an verschiedenen Tagen gilt die Ziel-Bearbeitungszeit.
+        """
+        average = self.timeline.average_days()
+        return self.target_module_days if average is None else round(average)
+
+    def calculate_projected_end_date(self) -> str:
+        """
+        Schätzt das Studienende aus den verbleibenden Modulen und dem bisherigen Tempo.
+
+        Gerechnet wird ab dem letzten Abschluss, frühestens ab heute; sind
+        alle Module bestanden, ist es der Tag des letzten Abschlusses.
+        """
+        remaining = len(self.get_remaining_modules())
+        today = datetime.date.today()
+        last = self.timeline.last_date()
+        if remaining == 0 and last is not None:
+            return last.isoformat()
+        start = max(today, last) if last is not None else today
+        return (start + datetime.timedelta(days=remaining * self.calculate_avg_module_time())).isoformat()
+
+    def calculate_target_end_date(self) -> str:
+        """Gibt das manuell gesetzte Ziel-Enddatum zurück, sonst das geschätzte Studienende."""
+        if self.target_end_date:
+            return self.target_end_date
+        return self.calculate_projected_end_date()
+
+    def update_target_end_date(self, new_date: str):
+        """Aktualisiert das Ziel-Enddatum und speichert es in der Datenbank."""
+        self.target_end_date = new_date
+        self._db.update_target_end_date(self._student.student_id, new_date)
+
+    def save_module_completions(self, student_id: str, exams: list):
+        """
+        Speichert alle abgeschlossenen Module in einem Schreibvorgang in der Datenbank.
+
+        Neue Abschlüsse übernimmt die Zeitleiste erst nach dem Commit.
+        """
+        completion_date = datetime.datetime.now().isoformat()
+        completions = [(exam.module.module_id, exam.grade, completion_date)
+                       for exam in exams if exam.grade is not None and exam.grade <= 4.0]
+        with self._db.transaction():
+            self._db.save_module_completions(student_id, completions)
+            self._db.after_commit(self._completed, tuple(module_id for module_id, _, _ in completions),
+                                  completion_date)
+
+    def _completed(self, module_ids, completion_date):
+        """Trägt gespeicherte Abschlüsse in die bereits geladene Zeitleiste ein."""
+        if self._timeline is not None:
+            for module_id in module_ids:
+                self._timeline.add(module_id, completion_date)
+
+
+class Dashboard:
+    """
+    Zentrale Koordinationsklasse (Facade) für das Studenten-Dashboard.
+
+    Delegiert GPA-Berechnungen an GpaCalculator, Fristenverwaltung an
+    DeadlineManager, Studienfortschritt an StudyProgressService und das
+    Laden und Speichern der Prüfungen an ExamRepository.
+    Änderungen und das Rendern einer Seite werden über ``lock`` serialisiert,
+    da mehrere Server-Threads dasselbe Dashboard nutzen. Änderungen an
+    Zielen und Fristen werden nach dem Commit an die mit add_listener()
+    registrierten Listener gemeldet (z.B. den EventBus der Registry).
+    """
+    def __init__(self, student, target_gpa=3.0, target_module_days=60, db=None):
+        """
+        Initialisiert ein neues Dashboard für einen Studenten.
+
+        Args:
+            student: Der zugehörige Student
+            target_gpa: Ziel-Notendurchschnitt (Standard: 3.0)
+            target_module_days: Ziel-Tage pro Modul (Standard: 60)
+            db: Gemeinsam genutzte Datenbank (Standard: eigene Instanz)
+        """
+        self.student = student
+        self.exams = ExamStore(student, observer=self._on_grade_change)
+        self.lock = threading.RLock()
+        self._db = db if db is not None else Database()
+        self._aggregates = ExamAggregates(self.exams)
+        self.gpa_calculator   = GpaCalculator(target_gpa, self._db, student.student_id, self._aggregates)
+        self.deadline_manager = DeadlineManager(student.student_id, self._db)
+        self.study_progress   = StudyProgressService(student, target_module_days, self._db, self._aggregates)
+        self.exam_repository  = ExamRepository(student.student_id, self.exams, self._db)
+        self._listeners = []
+        self._event_sequence = itertools.count()
+
+    @property
+    def target_gpa(self):
+        return self.gpa_calculator.target_gpa
+
+    @property
+    def deadlines(self):
+        return self.deadline_manager.deadlines
+
+    def add_exam(self, exam):
+        """Fügt eine Prüfung zum Dashboard hinzu; sie wird zur Ansicht auf den ExamStore."""
+        with self.lock:
+            self._ensure_aggregates()
+            self._aggregates.add(self.exams.append(exam))
+            self._exams_changed()
+
+    def add_exams(self, records):
+        """
+        Fügt viele Prüfungen hinzu, ohne Exam-Objekte anzulegen.
+
+        Args:
+            records: Iterierbare (Modul, Semester, Note)-Tupel
+        """
+        with self.lock:
+            self._ensure_aggregates()
+            for module, semester, grade in records:
+                self._aggregates.add(self.exams.add(module, semester, grade))
+            self._exams_changed()
+
+    def invalidate_aggregates(self):
+        """Berechnet die laufenden Kennzahlen aus dem ExamStore neu."""
+        with self.lock:
+            self._aggregates.rebuild()
+        self._db.versions.bump(self.student.student_id)
+
+    def reload_exams(self, force=False):
+        """Übernimmt neue und geänderte Prüfungen aus der Datenbank, sofern sich die Daten geändert haben."""
+        with self.lock:
+            self._ensure_aggregates(force)
+
+    def _ensure_aggregates(self, force=False):
+        """
+        Gleicht die Prüfungen mit der Datenbank ab und hält die Kennzahlen aktuell.
+
+        Baut die Kennzahlen neu auf, falls exams an add_exam vorbei ergänzt wurde.
+        """
+        if self._aggregates.exam_count != len(self.exams):
+            self.invalidate_aggregates()
+        for index in self.exam_repository.sync(force):
+            self._aggregates.add(index)
+
+    def _on_grade_change(self, index, old_grade, new_grade):
+        """Schreibt die Kennzahlen nach einer Notenänderung im ExamStore fort."""
+        with self.lock:
+            self._aggregates.update_grade(index, old_grade, new_grade)
+            self.exam_repository.grade_changed(index)
+            self._exams_changed()
+
+    def _exams_changed(self):
+        """Erhöht nach einer Änderung im Speicher die Inhaltsversion, ohne einen Datenbankabgleich auszulösen."""
+        synced = self.exam_repository.is_synced()
+        self._db.versions.bump(self.student.student_id)
+        self.exam_repository.mark_synced(synced)
+
+    def add_listener(self, listener):
+        """
+        Registriert listener(student_id, event, data) für Änderungen an Zielen und Fristen.
+
+        event ist einer von target_gpa, target_end_date, deadline_added und
+        deadline_deleted, data die Änderung als JSON-Text. Aufgerufen wird
+        erst nach dem Commit; bei einem Rollback entfällt die Meldung.
+        """
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def _publish(self, event, data):
+        """Meldet eine Änderung nach dem Commit der laufenden Transaktion an die Listener."""
+        if self._listeners:
+            # Die laufende Nummer verhindert, dass after_commit gleiche Meldungen zusammenfasst
+            self._db.after_commit(self._notify, event, json.dumps(data), next(self._event_sequence))
+
+    def _notify(self, event, data, sequence):
+        for listener in self._listeners:
+            listener(self.student.student_id, event, data)
+
+    def add_deadline(self, deadline_type, module_name, deadline_date):
+        """Fügt eine neue Frist hinzu und gibt ihre ID zurück."""
+        with self.lock:
+            deadline_id = self.deadline_manager.add(deadline_type, module_name, deadline_date)
+            self._publish('deadline_added', self.deadline_manager.get(deadline_id))
+            return deadline_id
+
+    @contextmanager
+    def transaction(self):
+        """
+        Fasst mehrere Änderungen zu einer Datenbanktransaktion zusammen.
+
+        Schlägt eine Änderung fehl, wird die Transaktion zurückgerollt und
+        der Zustand im Speicher (Ziele, Fristen) auf den gespeicherten Stand
+        zurückgesetzt. Die Inhaltsversion wird erst nach dem Commit und nur
+        einmal erhöht.
+        """
+        with self.lock:
+            target_gpa = self.gpa_calculator.target_gpa
+            target_end_date = self.study_progress.target_end_date
+            try:
+                with self._db.transaction():
+                    yield self
+            except BaseException:
+                self.gpa_calculator.target_gpa = target_gpa
+                self.study_progress.target_end_date = target_end_date
+                self.deadline_manager.reload(force=True)
+                raise
+
+    def update_target_gpa(self, new_target_gpa):
+        """Aktualisiert die Ziel-Note."""
+        with self.lock:
+            self.gpa_calculator.update_target(new_target_gpa)
+            self._publish('target_gpa', {'target_gpa': self.target_gpa})
+
+    def update_target_end_date(self, new_target_end_date):
+        """Aktualisiert das Ziel-Enddatum."""
+        with self.lock:
+            self.study_progress.update_target_end_date(new_target_end_date)
+            self._publish('target_end_date', {'target_end_date': new_target_end_date})
+
+    def delete_deadline(self, deadline_id):
+        """Löscht eine Frist anhand ihrer ID; gibt False zurück, falls sie nicht existiert."""
+        with self.lock:
+            if not self.deadline_manager.delete(deadline_id):
+                return False
+            self._publish('deadline_deleted', {'id': deadline_id})
+            return True
+
+    def reload_deadlines(self, force=False):
+        """Gleicht die Fristen mit der Datenbank ab, sofern sich die Daten geändert haben."""
+        with self.lock:
+            self.deadline_manager.reload(force)
+
+    def calculate_gpa(self):
+        """Gibt den aktuellen Notendurchschnitt zurück."""
+        with self.lock:
+            self._ensure_aggregates()
+            return self.gpa_calculator.calculate()
+
+    def calculate_weighted_gpa(self):
+        """Gibt den nach Credits gewichteten Notendurchschnitt zurück."""
+        with self.lock:
+            self._ensure_aggregates()
+            return self.gpa_calculator.calculate_weighted()
+
+    def calculate_avg_module_time(self):
+        """Gibt die durchschnittliche Bearbeitungszeit pro Modul zurück."""
+        with self.lock:
+            return self.study_progress.calculate_avg_module_time()
+
+    def calculate_projected_end_date(self):
+        """Schätzt das Studienende aus den verbleibenden Modulen und dem bisherigen Tempo."""
+        with self.lock:
+            self._ensure_aggregates()
+            return self.study_progress.calculate_projected_end_date()
+
+    def calculate_target_end_date(self):
+        """Berechnet das voraussichtliche Studienende."""
+        with self.lock:
+            self._ensure_aggregates()
+            return self.study_progress.calculate_target_end_date()
+
+    def get_completed_modules(self):
+        """Gibt eine Liste aller bestandenen Module zurück."""
+        with self.lock:
+            self._ensure_aggregates()
+            return self.study_progress.get_completed_modules()
+
+    def get_completed_exams(self):
+        """Gibt je bestandenem Modul die bestandene Prüfung zurück."""
+        with self.lock:
+            self._ensure_aggregates()
+            return self._aggregates.completed_exams
+
+    def get_completed_credits(self):
+        """Gibt die Summe der Credits aller bestandenen Module zurück."""
+        with self.lock:
+            self._ensure_aggregates()
+            return self.study_progress.get_completed_credits()
+
+    def get_remaining_modules(self):
+        """Gibt die noch nicht bestandenen Module des Studiengangs zurück."""
+        with self.lock:
+            self._ensure_aggregates()
+            return self.study_progress.get_remaining_modules()
+
+    def save_data(self):
+        """Speichert alle Dashboard-Daten in einer einzigen Transaktion in der Datenbank."""
+        with self.lock:
+            data = {
+                'gpa': self.calculate_gpa(),
+                'target_gpa': self.target_gpa,
+                # Nur das manuell gesetzte Ziel; die Hochrechnung ergibt sich beim Laden neu
+                'target_end_date': self.study_progress.target_end_date,
+                'avg_module_time': self.calculate_avg_module_time(),
+                'target_module_time': self.study_progress.target_module_days
+            }
+            with self._db.transaction():
+                self._db.save_student(self.student)
+                self._db.save_dashboard_data(self.student.student_id, data)
+                self.study_progress.save_module_completions(self.student.student_id, self.exams)
+                self.exam_repository.save()
+
+    def display(self):
+        """Zeigt das Dashboard im Terminal an."""
+        completed = self.get_completed_modules()
+        total = self.student.study_course.modules
+
+        print(f"\n{'='*50}")
+        print(f"Dashboard für {self.student.name}")
+        print(f"{'='*50}")
+        print(f"Aktueller GPA: {self.calculate_gpa()}")
+        print(f"Ziel-GPA: {self.target_gpa}")
+        print(f"Ziel-Enddatum: {self.calculate_target_end_date()}")
+        print(f"Durchschnittliche Modulbearbeitungszeit: {self.calculate_avg_module_time()} Tage")
+        print(f"Ziel-Modulbearbeitungszeit: {self.study_progress.target_module_days} Tage")
+        print(f"\nModulfortschritt: {len(completed)}/{len(total)} abgeschlossen")
+        print(f"Abgeschlossene Module:")
+        for module in completed:
+            print(f"  ✓ {module.name} ({module.credits} Credits)")
+        print(f"\nVerbleibende Module:")
+        for module in self.get_remaining_modules():
+            print(f"  ○ {module.name} ({module.credits} Credits)")
+        print(f"\nBevorstehende Fristen:")
+        for deadline in self.deadlines:
+            print(f"  {deadline['date']} - {deadline['type']}: {deadline['module']}")
+        print(f"{'='*50}\n")
+
+
+class DashboardRegistry:
+    """
+    Verwaltet die Dashboards vieler Studenten in einem Prozess.
+
+    Dashboards werden beim ersten Zugriff aus der Datenbank aufgebaut und in
+    einem LRU-Cache gehalten, der nach Größe und Alter (TTL) begrenzt ist.
+    Nicht angefragte Studenten belegen dadurch keinen Speicher. Speichert
+    ein anderer Prozess Änderungen an einem Studenten, wird dessen
+    Dashboard beim nächsten Zugriff verworfen und neu geladen. Änderungen
+    an Zielen und Fristen gehen an den EventBus ``events``.
+
+    Attribute:
+        max_size: Maximale Anzahl gleichzeitig gehaltener Dashboards
+        ttl: Lebensdauer eines Cache-Eintrags in Sekunden
+        default_student_id: Student, der ohne Angabe einer ID angezeigt wird
+            (ohne Vorgabe der zuerst angelegte Student der Datenbank)
+        hits: Anzahl der Zugriffe, die aus dem Cache bedient wurden
+        misses: Anzahl der Zugriffe, die die Datenbank laden mussten
+        evictions: Anzahl der wegen Größe oder TTL verdrängten Einträge
+        events: EventBus für die Event-Streams der Dashboards
+    """
+    def __init__(self, db, max_size=1024, ttl=600, default_student_id=None):
+        """Initialisiert die Registry mit gemeinsamer Datenbank und Cache-Grenzen."""
+        self._db = db
+        self.max_size = max_size
+        self.ttl = ttl
+        self._default_student_id = default_student_id
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._cache = OrderedDict()
+        self._courses = {}
+        self._lock = threading.Lock()
+        self._course_lock = threading.Lock()
+        self.events = EventBus(self._event_snapshot, self.poll_changes)
+        self._snapshots = {}
+        db.add_change_listener(self.invalidate)
+        db.add_change_listener(self.events.resync)
+
+    @property
+    def default_student_id(self):
+        if self._default_student_id is None:
+            self._default_student_id = self._db.get_first_student_id()
+        return self._default_student_id
+
+    @default_student_id.setter
+    def default_student_id(self, student_id):
+        self._default_student_id = student_id
+
+    def get(self, student_id):
+        """Gibt das Dashboard eines Studenten zurück oder None, falls er unbekannt ist."""
+        self.poll_changes()
+        now = time.monotonic()
+        with self._lock:
+            entry = self._cache.get(student_id)
+            if entry is not None:
+                dashboard, expires = entry
+                if expires > now:
+                    self._cache.move_to_end(student_id)
+                    self.hits += 1
+                    return dashboard
+                del self._cache[student_id]
+                self.evictions += 1
+            self.misses += 1
+        dashboard = self._hydrate(student_id)
+        if dashboard is not None:
+            dashboard = self.put(dashboard, replace=False)
+        return dashboard
+
+    def put(self, dashboard, replace=True):
+        """
+        Legt ein bereits aufgebautes Dashboard im Cache ab.
+
+        Mit replace=False bleibt ein zwischenzeitlich von einem anderen Thread
+        geladenes Dashboard erhalten und wird zurückgegeben, damit nie zwei
+        Instanzen desselben Studenten parallel verändert werden.
+        """
+        student_id = dashboard.student.student_id
+        with self._lock:
+            entry = self._cache.get(student_id)
+            if entry is not None and not replace:
+                return entry[0]
+            dashboard.add_listener(self.events.publish)
+            self._cache[student_id] = (dashboard, time.monotonic() + self.ttl)
+            self._cache.move_to_end(student_id)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+                self.evictions += 1
+        return dashboard
+
+    def invalidate(self, student_id):
+        """Entfernt ein Dashboard aus dem Cache; der nächste Zugriff lädt es neu."""
+        with self._lock:
+            self._cache.pop(student_id, None)
+
+    def poll_changes(self):
+        """Übernimmt Änderungen anderer Prozesse und verwirft die betroffenen Dashboards."""
+        self._db.poll_changes()
+
+    @property
+    def versions(self):
+        """Inhaltsversionen der Studenten (ohne Datenbankzugriff abrufbar)."""
+        return self._db.versions
+
+    def stats(self):
+        """Gibt die Cache-Zähler als Dictionary zurück."""
+        with self._lock:
+            return {'size': len(self._cache), 'hits': self.hits,
+                    'misses': self.misses, 'evictions': self.evictions}
+
+    def _event_snapshot(self, student_id):
+        """
+        Gibt Ziele und Fristen eines Studenten als JSON-Text zurück oder None, falls er unbekannt ist.
+
+        Das Ergebnis wird je Inhaltsversion zwischengespeichert, da sich nach
+        einem Neustart viele Clients gleichzeitig neu verbinden.
+        """
+        dashboard = self.get(student_id)
+        if dashboard is None:
+            return None
+        with dashboard.lock:
+            dashboard.reload_deadlines()
+            key = (self.versions.get(student_id)[0], datetime.date.today())
+            cached = self._snapshots.get(student_id)
+            if cached is not None and cached[0] == key:
+                return cached[1]
+            data = json.dumps({
+                'target_gpa': dashboard.target_gpa,
+                'target_end_date': dashboard.calculate_target_end_date(),
+                'deadlines': dashboard.deadlines,
+            })
+        with self._lock:
+            self._snapshots.pop(student_id, None)
+            self._snapshots[student_id] = (key, data)
+            if len(self._snapshots) > self.max_size:
+                self._snapshots.pop(next(iter(self._snapshots)))
+        return data
+
+    def _course(self, course_id):
+        """Lädt einen Studiengang einmalig; alle Studenten teilen sich die Instanz."""
+        with self._course_lock:
+            course = self._courses.get(course_id)
+            if course is None:
+                row = self._db.get_course(course_id)
+                if row is None:
+                    return None
+                course = StudyCourse(row[1], row[0], row[2])
+                for module_id, name, credits in self._db.get_course_modules(course_id):
+                    course.add_module(Module(name, module_id, credits))
+                self._courses[course_id] = course
+            return course
+
+    def _hydrate(self, student_id):
+        """Baut das Dashboard eines Studenten aus den gespeicherten Daten auf."""
+        row = self._db.get_student(student_id)
+        if row is None:
+            return None
+        course = self._course(row[2])
+        if course is None:
+            return None
+        student = Student(row[1], row[0], course)
+
+        data = self._db.get_dashboard_data(student_id)
+        if data is None:
+            dashboard = Dashboard(student, db=self._db)
+        else:
+            dashboard = Dashboard(student, target_gpa=data[0], target_module_days=data[2], db=self._db)
+            dashboard.study_progress.target_end_date = data[1]
+
+        # Die Prüfungen lädt das ExamRepository erst beim ersten Lesezugriff
+        dashboard.reload_deadlines()
+        return dashboard
+
+
+def format_event(event, data):
+    """Kodiert ein Ereignis im Format von Server-Sent Events (data ist einzeiliger JSON-Text)."""
+    return f'event: {event}\ndata: {data}\n\n'.encode('utf-8')
+
+
+class EventSubscription:
+    """
+    Warteschlange eines Event-Stream-Clients.
+
+    Ereignisse werden von beliebigen Threads eingereiht und in der
+    Event-Loop des Streams abgeholt. Läuft die Warteschlange über oder hat
+    ein anderer Prozess den Studenten geändert, wird sie verworfen und der
+    Client erhält stattdessen den vollständigen Stand (snapshot); dasselbe
+    gilt für den Beginn des Streams.
+
+    Attribute:
+        bus: Zugehöriger EventBus
+        student_id: Student, dessen Änderungen gemeldet werden
+    """
+    MAX_PENDING = 256
+
+    def __init__(self, bus, student_id):
+        self.bus = bus
+        self.student_id = student_id
+        self._pending = []
+        self._resync = True
+        self._loop = None
+        self._ready = None
+
+    def attach(self, loop):
+        """Bindet die Warteschlange an die Event-Loop, in der der Stream läuft."""
+        import asyncio
+        with self.bus.lock:
+            self._loop = loop
+            self._ready = asyncio.Event()
+            self._ready.set()
+
+    async def wait(self, timeout):
+        """Wartet höchstens timeout Sekunden auf neue Ereignisse."""
+        import asyncio
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def take(self):
+        """Gibt (ob der vollständige Stand nötig ist, kodierte Ereignisse) zurück und leert die Warteschlange."""
+        with self.bus.lock:
+            self._ready.clear()
+            resync, self._resync = self._resync, False
+            pending, self._pending = self._pending, []
+        return resync, ([] if resync else pending)
+
+    def push(self, chunk):
+        """Reiht ein kodiertes Ereignis ein (unter bus.lock aufzurufen; geweckt wird über den EventBus)."""
+        if len(self._pending) >= self.MAX_PENDING:
+            self.request_resync()
+        else:
+            self._pending.append(chunk)
+
+    def request_resync(self):
+        """Ersetzt die wartenden Ereignisse durch den vollständigen Stand (unter bus.lock aufzurufen)."""
+        self._pending = []
+        self._resync = True
+
+
+class EventBus:
+    """
+    Verteilt Änderungen an Dashboards an die Event-Streams der Clients.
+
+    Je Student werden die offenen Abonnements geführt; ohne Abonnenten
+    kostet eine Meldung nur einen Dictionary-Zugriff. Ereignisse werden
+    einmal kodiert und allen Abonnenten desselben Studenten eingereiht.
+
+    Attribute:
+        lock: Schützt die Abonnements und ihre Warteschlangen
+    """
+    def __init__(self, snapshot, poll=None):
+        """
+        Initialisiert den EventBus.
+
+        Args:
+            snapshot: Liefert zu einer Studenten-ID den vollständigen Stand als JSON-Text oder None
+            poll: Übernimmt Änderungen anderer Prozesse (wird von EventStreamer regelmäßig aufgerufen)
+        """
+        self.snapshot = snapshot
+        self.poll = poll
+        self.lock = threading.Lock()
+        self._subscriptions = {}
+
+    def subscribe(self, student_id):
+        """Legt ein Abonnement für die Änderungen eines Studenten an."""
+        subscription = EventSubscription(self, student_id)
+        with self.lock:
+            self._subscriptions.setdefault(student_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        """Entfernt ein Abonnement."""
+        with self.lock:
+            subscriptions = self._subscriptions.get(subscription.student_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[subscription.student_id]
+
+    def publish(self, student_id, event, data):
+        """Meldet ein Ereignis (data als JSON-Text) an alle Abonnenten des Studenten."""
+        if student_id not in self._subscriptions:
+            return
+        chunk = format_event(event, data)
+        with self.lock:
+            subscriptions = list(self._subscriptions.get(student_id, ()))
+            for subscription in subscriptions:
+                subscription.push(chunk)
+        self._wake(subscriptions)
+
+    def resync(self, student_id):
+        """Lässt allen Abonnenten des Studenten den vollständigen Stand senden (z.B. nach fremden Änderungen)."""
+        if student_id not in self._subscriptions:
+            return
+        with self.lock:
+            subscriptions = list(self._subscriptions.get(student_id, ()))
+            for subscription in subscriptions:
+                subscription.request_resync()
+        self._wake(subscriptions)
+
+    def count(self):
+        """Gibt die Zahl der offenen Abonnements zurück."""
+        with self.lock:
+            return sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+
+    @staticmethod
+    def _wake(subscriptions):
+        """Weckt die Streams; je Event-Loop genügt ein Aufruf von call_soon_threadsafe."""
+        by_loop = {}
+        for subscription in subscriptions:
+            if subscription._loop is not None:
+                by_loop.setdefault(subscription._loop, []).append(subscription._ready)
+        for loop, events in by_loop.items():
+            try:
+                loop.call_soon_threadsafe(_set_all, events)
+            except RuntimeError:
+                # Die Event-Loop ist bereits beendet; die Streams melden sich gleich ab
+                pass
+
+
+def _set_all(events):
+    for event in events:
+        event.set()
+
+
+class Template:
+    """
+    Vorkompilierte HTML-Vorlage mit Platzhaltern der Form {name}.
+
+    Die Datei wird einmal in Literal- und Platzhalter-Segmente zerlegt;
+    render() setzt die Werte in einem einzigen Durchlauf ein. Neu
+    eingelesen wird nur, wenn sich die Änderungszeit der Datei ändert.
+    Unbekannte Platzhalter bleiben unverändert stehen.
+
+    Attribute:
+        path: Pfad zur Vorlagendatei
+    """
+    PLACEHOLDER = re.compile(r'\{([a-z_][a-z0-9_]*)\}')
+
+    def __init__(self, path):
+        """Initialisiert die Vorlage; die Datei wird erst beim ersten Rendern gelesen."""
+        self.path = path
+        self._mtime = None
+        self._compiled = ((), ())
+        self._lock = threading.Lock()
+
+    @property
+    def version(self):
+        """Änderungszeit der zuletzt kompilierten Datei (ns)."""
+        self._refresh()
+        return self._mtime
+
+    def render(self, values):
+        """Setzt die Werte ein und gibt das fertige Dokument zurück."""
+        with template_render_seconds.timer(os.path.basename(self.path)):
+            self._refresh()
+            parts, slots = self._compiled
+            output = list(parts)
+            for index, name in slots:
+                value = values.get(name)
+                if value is not None:
+                    output[index] = value
+            return ''.join(output)
+
+    def _refresh(self):
+        """Kompiliert die Vorlage neu, falls sich die Datei geändert hat."""
+        mtime = os.stat(self.path).st_mtime_ns
+        if mtime == self._mtime:
+            return
+        with self._lock:
+            if mtime == self._mtime:
+                return
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._compiled = self._compile(f.read())
+            self._mtime = mtime
+
+    def _compile(self, text):
+        """Zerlegt den Text in Segmente; Platzhalter behalten ihren Originaltext als Vorgabe."""
+        parts, slots, position = [], [], 0
+        for match in self.PLACEHOLDER.finditer(text):
+            parts.append(text[position:match.start()])
+            slots.append((len(parts), match.group(1)))
+            parts.append(match.group(0))
+            position = match.end()
+        parts.append(text[position:])
+        return tuple(parts), tuple(slots)
+
+
+# Unterstützte Kompressionsverfahren in Präferenzreihenfolge
+COMPRESSIBLE_ENCODINGS = ('gzip', 'deflate')
+MIN_COMPRESS_SIZE = 512
+
+
+class StaticAssets:
+    """
+    Liefert statische Dateien (CSS, JS) unter inhaltsabhängigen URLs aus.
+
+    Jede Datei erhält eine URL der Form /static/<name>.<hash>.<endung>, die
+    sich mit dem Inhalt ändert und daher unbegrenzt gecacht werden darf.
+    Komprimierte Fassungen werden je Kodierung nur einmal erzeugt.
+
+    Attribute:
+        directory: Verzeichnis der Dateien
+        names: Ausgelieferte Dateinamen
+    """
+    CONTENT_TYPES = {
+        '.css': 'text/css; charset=utf-8',
+        '.js': 'application/javascript; charset=utf-8',
+    }
+
+    def __init__(self, directory, names):
+        """Initialisiert die Asset-Verwaltung; Dateien werden erst bei Bedarf gelesen."""
+        self.directory = directory
+        self.names = names
+        self._assets = {}
+        self._lock = threading.Lock()
+
+    def url(self, name):
+        """Gibt die aktuelle, inhaltsabhängige URL einer Datei zurück."""
+        return self._load(name)['url']
+
+    @property
+    def version(self):
+        """Kurzer Hash über alle Dateien; ändert sich mit jedem Asset."""
+        return hashlib.sha256(''.join(self.url(name) for name in self.names).encode()).hexdigest()[:12]
+
+    def find(self, path):
+        """Gibt das Asset zu einer URL zurück oder None."""
+        for name in self.names:
+            asset = self._load(name)
+            if asset['url'] == path:
+                return asset
+        return None
+
+    def encoded(self, asset, encoding):
+        """Gibt den Inhalt in der gewünschten Kodierung zurück (einmalig komprimiert)."""
+        data = asset['encodings'].get(encoding)
+        if data is None:
+            data = compress_body(asset['encodings']['identity'], encoding)
+            asset['encodings'][encoding] = data
+        return data
+
+    def _load(self, name):
+        """Liest eine Datei neu ein, falls sie sich seit dem letzten Zugriff geändert hat."""
+        path = os.path.join(self.directory, name)
+        mtime = os.stat(path).st_mtime_ns
+        asset = self._assets.get(name)
+        if asset is None or asset['mtime'] != mtime:
+            with open(path, 'rb') as f:
+                data = f.read()
+            digest = hashlib.sha256(data).hexdigest()[:12]
+            stem, extension = os.path.splitext(name)
+            asset = {'mtime': mtime, 'url': f'/static/{stem}.{digest}{extension}', 'etag': f'"{digest}"',
+                     'content_type': self.CONTENT_TYPES.get(extension, 'application/octet-stream'),
+                     'encodings': {'identity': data}}
+            with self._lock:
+                self._assets[name] = asset
+        return asset
+
+
+def negotiate_encoding(accept_encoding):
+    """
+    Wählt anhand des Accept-Encoding-Headers gzip, deflate oder identity.
+
+    Args:
+        accept_encoding: Headerwert, z.B. "gzip, deflate;q=0.5" (oder None)
+
+    Returns:
+        str: Die gewählte Kodierung
+    """
+    if not accept_encoding:
+        return 'identity'
+    weights = {}
+    for item in accept_encoding.split(','):
+        coding, _, params = item.strip().partition(';')
+        quality = 1.0
+        if params.strip().startswith('q='):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        weights[coding.strip().lower()] = quality
+    best = max(COMPRESSIBLE_ENCODINGS, key=lambda coding: weights.get(coding, weights.get('*', 0.0)))
+    return best if weights.get(best, weights.get('*', 0.0)) > 0 else 'identity'
+
+
+def compress_body(data, encoding):
+    """Komprimiert Bytes mit gzip oder deflate (zlib-Format gemäß HTTP)."""
+    if encoding == 'gzip':
+        return gzip.compress(data, compresslevel=6)
+    if encoding == 'deflate':
+        return zlib.compress(data, 6)
+    return data
+
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+dashboard_template = Template(os.path.join(SCRIPT_DIR, 'dashboard.html'))
+static_assets = StaticAssets(SCRIPT_DIR, ('dashboard.css', 'dashboard.js'))
+
+
+@lru_cache(maxsize=4096)
+def render_completed_modules_html(completed):
+    """Erzeugt die Karten der abgeschlossenen Module aus (Name, Credits, Note)-Tupeln."""
+    completed_html = ""
+    for name, credits, grade in completed:
+        completed_html += f'''
+            <div class="module-card completed">
+                <strong>{name}</strong><br>
+                Credits: {credits}<br>
+                Note: {grade}
+            </div>
+            '''
+    return completed_html
+
+
+@lru_cache(maxsize=4096)
+def render_remaining_modules_html(remaining):
+    """Erzeugt die Karten der verbleibenden Module aus (Name, Credits)-Tupeln."""
+    remaining_html = ""
+    for name, credits in remaining:
+        remaining_html += f'''
+        <div class="module-card pending">
+            <strong>{name}</strong><br>
+            Credits: {credits}
+        </div>
+        '''
+    return remaining_html
+
+
+@lru_cache(maxsize=4096)
+def render_deadlines_html(deadlines):
+    """Erzeugt die Fristenliste aus nach Datum sortierten (ID, Datum, Typ, Modul)-Tupeln."""
+    deadlines_html = ""
+    for deadline_id, date, deadline_type, module in deadlines:
+        deadlines_html += f'''
+        <div class="deadline-item" data-id="{deadline_id}" data-date="{date}">
+            <div>
+                <span class="deadline-date">{date}</span> - 
+                {deadline_type}: {module}
+            </div>
+            <button class="delete-btn" onclick="deleteDeadline({deadline_id})">Löschen</button>
+        </div>
+        '''
+    return deadlines_html
+
+
+def render_dashboard_html(dashboard):
+    """
+    Erzeugt die vollständige Dashboard-Seite eines Studenten.
+
+    Die Modul- und Fristenabschnitte werden aus einem Cache geliefert,
+    solange sich die zugrunde liegenden Daten nicht ändern.
+
+    Args:
+        dashboard: Das darzustellende Dashboard
+
+    Returns:
+        str: Die fertige HTML-Seite
+    """
+    # Lade Deadlines aus der Datenbank neu
+    dashboard.reload_deadlines()
+
+    # Generiere Dashboard-HTML
+    completed = dashboard.get_completed_modules()
+    total = dashboard.student.study_course.modules
+    completed_count = len(completed)
+    total_count = len(total)
+    progress = round((completed_count / total_count * 100) if total_count > 0 else 0, 1)
+
+    completed_key = tuple((exam.module.name, exam.module.credits, exam.grade)
+                          for exam in dashboard.get_completed_exams())
+    remaining_key = tuple((module.name, module.credits) for module in dashboard.get_remaining_modules())
+    deadlines_key = tuple((deadline['id'], deadline['date'], deadline['type'], deadline['module'])
+                          for deadline in dashboard.deadlines)
+
+    return dashboard_template.render({
+        'student_id': dashboard.student.student_id,
+        'student_name': dashboard.student.name,
+        'gpa': str(dashboard.calculate_gpa()),
+        'target_gpa': str(dashboard.target_gpa),
+        'avg_time': str(dashboard.calculate_avg_module_time()),
+        'end_date': dashboard.calculate_target_end_date(),
+        'completed_count': str(completed_count),
+        'total_count': str(total_count),
+        'progress': str(progress),
+        'completed_modules': render_completed_modules_html(completed_key),
+        'remaining_modules': render_remaining_modules_html(remaining_key),
+        'deadlines': render_deadlines_html(deadlines_key),
+        'css_url': static_assets.url('dashboard.css'),
+        'js_url': static_assets.url('dashboard.js'),
+    })
+
+
+# JSON-Lese-API
+API_PAGE_SIZE = 50
+API_MAX_PAGE_SIZE = 500
+STREAM_CHUNK_SIZE = 16 * 1024
+
+GPA_FIELDS = ('student_id', 'gpa', 'weighted_gpa', 'target_gpa')
+PROGRESS_FIELDS = ('student_id', 'completed_count', 'total_count', 'completed_credits', 'total_credits',
+                   'progress', 'avg_module_time', 'target_end_date', 'projected_end_date')
+MODULE_FIELDS = ('module_id', 'name', 'credits', 'status', 'grade')
+EXAM_FIELDS = ('module_id', 'module_name', 'credits', 'semester', 'year', 'grade', 'passed')
+DEADLINE_FIELDS = ('id', 'type', 'module', 'date')
+
+
+class StreamingJSONEncoder:
+    """
+    Kodiert JSON schrittweise in Byte-Blöcken.
+
+    Listen, Tupel und Dictionaries werden wie üblich kodiert; jeder andere
+    iterierbare Wert (z.B. ein Generator) wird als JSON-Array ausgegeben,
+    ohne ihn vorher vollständig im Speicher aufzubauen. Die Ausgabe wird
+    in Blöcken von etwa chunk_size Bytes gesammelt.
+    """
+    def __init__(self, chunk_size=STREAM_CHUNK_SIZE):
+        """Initialisiert den Encoder mit der gewünschten Blockgröße."""
+        self.chunk_size = chunk_size
+        self._encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+    def iterencode(self, obj):
+        """Liefert die UTF-8-kodierte JSON-Darstellung von obj in Blöcken."""
+        buffer, size = [], 0
+        for piece in self._pieces(obj):
+            buffer.append(piece)
+            size += len(piece)
+            if size >= self.chunk_size:
+                yield ''.join(buffer).encode('utf-8')
+                buffer, size = [], 0
+        if buffer:
+            yield ''.join(buffer).encode('utf-8')
+
+    def _pieces(self, obj):
+        """Zerlegt obj in JSON-Textstücke; nur Ströme werden Element für Element kodiert."""
+        if isinstance(obj, dict):
+            yield '{'
+            for index, (key, value) in enumerate(obj.items()):
+                yield ('{}:' if index == 0 else ',{}:').format(self._encoder.encode(str(key)))
+                yield from self._pieces(value)
+            yield '}'
+        elif isinstance(obj, (str, bytes, list, tuple, int, float, type(None))):
+            yield self._encoder.encode(obj)
+        else:
+            yield '['
+            for index, item in enumerate(obj):
+                if index:
+                    yield ','
+                yield from self._pieces(item)
+            yield ']'
+
+
+def jsonl_chunks(lines, chunk_size=STREAM_CHUNK_SIZE):
+    """Fasst JSON-Zeilen zu UTF-8-Blöcken von etwa chunk_size Bytes zusammen (eine Zeile je Datensatz)."""
+    buffer, size = [], 0
+    for line in lines:
+        buffer.append(line)
+        size += len(line) + 1
+        if size >= chunk_size:
+            yield ('\n'.join(buffer) + '\n').encode('utf-8')
+            buffer, size = [], 0
+    if buffer:
+        yield ('\n'.join(buffer) + '\n').encode('utf-8')
+
+
+def read_lines(stream, length, block_size=STREAM_CHUNK_SIZE):
+    """Liest genau length Bytes aus stream und liefert sie Zeile für Zeile, ohne alles zu puffern."""
+    rest = b''
+    while length > 0:
+        block = stream.read(min(block_size, length))
+        if not block:
+            break
+        length -= len(block)
+        *complete, rest = (rest + block).split(b'\n')
+        yield from complete
+    if rest:
+        yield rest
+
+
+def encode_cursor(key):
+    """Kodiert den Sortierschlüssel des letzten Eintrags einer Seite als Cursor."""
+    raw = json.dumps(key, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Dekodiert einen Cursor; Listen werden zu Tupeln, damit sie mit Schlüsseln vergleichbar sind."""
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+    except ValueError:
+        raise ValueError('Ungültiger Cursor')
+    return tuple(key) if isinstance(key, list) else key
+
+
+def parse_page(params, default_limit=API_PAGE_SIZE):
+    """
+    Liest Cursor und Seitengröße aus den Anfrageparametern.
+
+    Returns:
+        tuple: (Schlüssel nach dem fortgesetzt wird oder None, Seitengröße oder None)
+    """
+    cursor = params.get('cursor', [''])[0]
+    limit = params.get('limit', [default_limit])[0]
+    try:
+        limit = None if limit is None else max(1, min(int(limit), API_MAX_PAGE_SIZE))
+    except ValueError:
+        raise ValueError('Ungültiges limit')
+    return (decode_cursor(cursor) if cursor else None), limit
+
+
+def parse_fields(params, allowed):
+    """Liest die Feldauswahl aus dem Parameter fields; None bedeutet alle Felder."""
+    raw = params.get('fields', [''])[0]
+    if not raw:
+        return None
+    fields = tuple(dict.fromkeys(field.strip() for field in raw.split(',') if field.strip()))
+    unknown = [field for field in fields if field not in allowed]
+    if unknown:
+        raise ValueError(f"Unbekannte Felder: {', '.join(unknown)}")
+    return fields
+
+
+def project(record, fields):
+    """Beschränkt einen Datensatz auf die ausgewählten Felder."""
+    return record if fields is None else {field: record[field] for field in fields}
+
+
+def page_after(keys, after, limit):
+    """Gibt Start- und Endposition der Seite in einer nach keys sortierten Liste zurück."""
+    try:
+        start = 0 if after is None else bisect.bisect_right(keys, after)
+    except TypeError:
+        raise ValueError('Ungültiger Cursor')
+    return start, len(keys) if limit is None else start + limit
+
+
+def api_gpa(dashboard, params):
+    """Notendurchschnitt und Ziel-GPA eines Studenten."""
+    fields = parse_fields(params, GPA_FIELDS)
+    with dashboard.lock:
+        record = {
+            'student_id': dashboard.student.student_id,
+            'gpa': dashboard.calculate_gpa(),
+            'weighted_gpa': dashboard.calculate_weighted_gpa(),
+            'target_gpa': dashboard.target_gpa,
+        }
+    return project(record, fields)
+
+
+def api_progress(dashboard, params):
+    """Studienfortschritt: abgeschlossene Module und Credits, Bearbeitungszeit und Studienende."""
+    fields = parse_fields(params, PROGRESS_FIELDS)
+    with dashboard.lock:
+        course = dashboard.student.study_course
+        completed_count = len(dashboard.get_completed_exams())
+        total_count = len(course.modules)
+        record = {
+            'student_id': dashboard.student.student_id,
+            'completed_count': completed_count,
+            'total_count': total_count,
+            'completed_credits': dashboard.get_completed_credits(),
+            'total_credits': course.total_credits,
+            'progress': round((completed_count / total_count * 100) if total_count > 0 else 0, 1),
+            'avg_module_time': dashboard.calculate_avg_module_time(),
+            'target_end_date': dashboard.calculate_target_end_date(),
+            'projected_end_date': dashboard.calculate_projected_end_date(),
+        }
+    return project(record, fields)
+
+
+def api_modules(dashboard, params):
+    """
+    Module des Studiengangs mit Status und Note, seitenweise in Studiengangsreihenfolge.
+
+    Der Parameter status (completed, remaining) schränkt die Liste ein;
+    der Cursor ist die Position des letzten Moduls im Studiengang.
+    """
+    fields = parse_fields(params, MODULE_FIELDS)
+    status = params.get('status', ['all'])[0]
+    if status not in ('all', 'completed', 'remaining'):
+        raise ValueError('Ungültiger status')
+    after, limit = parse_page(params)
+    with dashboard.lock:
+        grades = {exam.module.module_id: exam.grade for exam in dashboard.get_completed_exams()}
+        modules = dashboard.student.study_course.modules
+    selected = [(position, module) for position, module in enumerate(modules)
+                if status == 'all' or (module.module_id in grades) == (status == 'completed')]
+    start, end = page_after([position for position, _ in selected], after, limit)
+    items = [project({
+        'module_id': module.module_id,
+        'name': module.name,
+        'credits': module.credits,
+        'status': 'completed' if module.module_id in grades else 'remaining',
+        'grade': grades.get(module.module_id),
+    }, fields) for _, module in selected[start:end]]
+    return {
+        'student_id': dashboard.student.student_id,
+        'items': items,
+        'next_cursor': encode_cursor(selected[end - 1][0]) if end < len(selected) else None,
+    }
+
+
+def api_deadlines(dashboard, params):
+    """Fristen nach Datum sortiert, seitenweise; der Cursor ist (Datum, ID) der letzten Frist."""
+    fields = parse_fields(params, DEADLINE_FIELDS)
+    after, limit = parse_page(params)
+    with dashboard.lock:
+        dashboard.reload_deadlines()
+        try:
+            deadlines, has_more = dashboard.deadline_manager.page(after, limit)
+        except TypeError:
+            raise ValueError('Ungültiger Cursor')
+    return {
+        'student_id': dashboard.student.student_id,
+        'items': [project(deadline, fields) for deadline in deadlines],
+        'next_cursor': encode_cursor([deadlines[-1]['date'], deadlines[-1]['id']]) if has_more else None,
+    }
+
+
+def api_exams(dashboard, params):
+    """
+    Prüfungshistorie eines Studenten in Erfassungsreihenfolge.
+
+    Ohne limit wird die gesamte Historie geliefert; die Einträge werden
+    erst beim Senden einzeln kodiert (siehe StreamingJSONEncoder).
+    """
+    fields = parse_fields(params, EXAM_FIELDS)
+    after, limit = parse_page(params, default_limit=None)
+    with dashboard.lock:
+        dashboard.reload_exams()
+        exams = dashboard.exams
+        count = len(exams)
+    start, end = page_after(range(count), after, limit)
+    end = min(end, count)
+
+    def records():
+        # Exam-Ansichten entstehen erst beim Kodieren und nur für die Seite
+        for exam in (exams.view(index) for index in range(start, end)):
+            semester = exam.semester
+            yield project({
+                'module_id': exam.module.module_id,
+                'module_name': exam.module.name,
+                'credits': exam.module.credits,
+                'semester': semester.number if semester is not None else None,
+                'year': semester.year if semester is not None else None,
+                'grade': exam.grade,
+                'passed': exam.grade is not None and exam.grade <= ExamAggregates.PASSING_GRADE,
+            }, fields)
+
+    return {
+        'student_id': dashboard.student.student_id,
+        'items': records(),
+        'next_cursor': encode_cursor(end - 1) if end < count else None,
+    }
+
+
+API_RESOURCES = {
+    'gpa': api_gpa,
+    'progress': api_progress,
+    'modules': api_modules,
+    'exams': api_exams,
+    'deadlines': api_deadlines,
+}
+
+
+# Jahrgangsweite Auswertungen (siehe analytics.py)
+def analytics_page(items, keys, params):
+    """Liefert eine Seite einer nach keys sortierten Auswertung samt Cursor und Gesamtzahl."""
+    after, limit = parse_page(params)
+    start, end = page_after(keys, after, limit)
+    return {
+        'total': len(items),
+        'items': items[start:end],
+        'next_cursor': encode_cursor(keys[end - 1]) if end < len(items) else None,
+    }
+
+
+def analytics_modules(analytics, params):
+    """Notenverteilung je Modul über alle Studenten; der Cursor ist die Modul-ID."""
+    modules = analytics.module_distribution()
+    return analytics_page(modules, [module['module_id'] for module in modules], params)
+
+
+def analytics_at_risk(analytics, params):
+    """Studenten mit einem schlechteren Notendurchschnitt als ihre Ziel-Note, größter Abstand zuerst."""
+    students = analytics.at_risk()
+    return analytics_page(students, [(-student['gap'], student['student_id']) for student in students], params)
+
+
+def analytics_deadline_weeks(analytics, params):
+    """Fristen je Kalenderwoche über alle Studenten; der Cursor ist die ISO-Woche."""
+    weeks = analytics.deadline_weeks()
+    return analytics_page(weeks, [week['week'] for week in weeks], params)
+
+
+ANALYTICS_VIEWS = {
+    'modules': analytics_modules,
+    'at-risk': analytics_at_risk,
+    'deadline-weeks': analytics_deadline_weeks,
+}
+
+
+# Schreibaktionen der API
+MAX_BATCH_ACTIONS = 1000
+
+
+def action_update_gpa(dashboard, args):
+    """Aktualisiert die Ziel-Note (Parameter value)."""
+    dashboard.update_target_gpa(float(args.get('value', '')))
+    return {'message': 'Ziel-GPA aktualisiert'}
+
+
+def action_update_date(dashboard, args):
+    """Aktualisiert das Ziel-Enddatum (Parameter value)."""
+    dashboard.update_target_end_date(str(args.get('value', '')))
+    return {'message': 'Ziel-Enddatum aktualisiert'}
+
+
+def action_add_deadline(dashboard, args):
+    """Fügt eine Frist hinzu (Parameter type, module, date) und liefert ihre ID."""
+    deadline_id = dashboard.add_deadline(str(args.get('type', '')), str(args.get('module', '')),
+                                         str(args.get('date', '')))
+    return {'message': 'Frist hinzugefügt', 'id': deadline_id}
+
+
+def action_delete_deadline(dashboard, args):
+    """Löscht eine Frist anhand ihrer ID (Parameter id, ältere Clients: index)."""
+    if 'id' in args:
+        deadline_id = int(args['id'])
+    else:
+        # Ältere Clients senden die Position in der sortierten Liste
+        index = int(args.get('index', ''))
+        deadlines = dashboard.deadlines
+        if not 0 <= index < len(deadlines):
+            raise LookupError('Frist nicht gefunden')
+        deadline_id = deadlines[index]['id']
+    if not dashboard.delete_deadline(deadline_id):
+        raise LookupError('Frist nicht gefunden')
+    return {'message': 'Frist gelöscht'}
+
+
+API_ACTIONS = {
+    'update_gpa': action_update_gpa,
+    'update_date': action_update_date,
+    'add_deadline': action_add_deadline,
+    'delete_deadline': action_delete_deadline,
+}
+
+
+def run_action(dashboard, args):
+    """
+    Führt eine Schreibaktion aus.
+
+    Args:
+        dashboard: Das betroffene Dashboard
+        args: Parameter der Aktion einschließlich 'action'
+
+    Returns:
+        dict: Ergebnis mit success, message und ggf. weiteren Feldern
+
+    Raises:
+        Exception: wenn die Aktion unbekannt ist oder fehlschlägt
+    """
+    action = API_ACTIONS.get(args.get('action'))
+    if action is None:
+        raise ValueError('Unbekannte Aktion')
+    return {'success': True, **action(dashboard, args)}
+
+
+# Erstelle Testdaten
+def create_test_data(db=None):
+    """
+    Erstellt Testdaten für das Dashboard.
+    
+    Erzeugt einen Beispiel-Studiengang mit Modulen, einen Studenten,
+    Prüfungen und Fristen zur Demonstration der Funktionalität.
+    
+    Args:
+        db: Zu verwendende Datenbank (Standard: eigene Instanz)
+
+    Returns:
+        Dashboard: Ein initialisiertes Dashboard mit Testdaten
+    """
+    course = StudyCourse("Cyber Security", "CS-2026", 6)
+    
+    modules = [
+        Module("Objektorientierte Programmierung mit Python", "CS101", 5),
+        Module("Datenstrukturen", "CS102", 5),
+        Module("Algorithmen", "CS103", 5),
         Module("Datenbanken", "CS201", 5),
         Module("Webentwicklung", "CS202", 5),
         Module("Software Engineering", "CS203", 5),
@@ -421,20 +3438,24 @@ def create_test_data():
         course.add_module(module)
     
     student = Student("Lukas Schwarzfeld", "IU123456789", course)
-    dashboard = Dashboard(student, target_gpa=2.5, target_module_days=60)
+    dashboard = Dashboard(student, target_gpa=2.5, target_module_days=60, db=db)
     
     semester1 = Semester(1, 2023)
     semester2 = Semester(2, 2024)
     
-    dashboard.add_exam(Exam(modules[0], student, semester1, 2.0))
-    dashboard.add_exam(Exam(modules[1], student, semester1, 2.3))
-    dashboard.add_exam(Exam(modules[2], student, semester1, 1.7))
-    dashboard.add_exam(Exam(modules[3], student, semester2, 2.7))
-    dashboard.add_exam(Exam(modules[4], student, semester2, 2.0))
+    # Lade gespeicherte Prüfungen; Testprüfungen nur beim ersten Mal anlegen
+    dashboard.reload_exams()
     
-    dashboard.add_exam(Exam(modules[5], student, semester2))
-    dashboard.add_exam(Exam(modules[6], student, semester2))
-    dashboard.add_exam(Exam(modules[7], student, semester2))
+    if len(dashboard.exams) == 0:
+        dashboard.add_exam(Exam(modules[0], student, semester1, 2.0))
+        dashboard.add_exam(Exam(modules[1], student, semester1, 2.3))
+        dashboard.add_exam(Exam(modules[2], student, semester1, 1.7))
+        dashboard.add_exam(Exam(modules[3], student, semester2, 2.7))
+        dashboard.add_exam(Exam(modules[4], student, semester2, 2.0))
+        
+        dashboard.add_exam(Exam(modules[5], student, semester2))
+        dashboard.add_exam(Exam(modules[6], student, semester2))
+        dashboard.add_exam(Exam(modules[7], student, semester2))
     
     # Lade existierende Deadlines aus der Datenbank
     dashboard.reload_deadlines()
@@ -451,18 +3472,874 @@ def create_test_data():
     return dashboard
 
 
-# Initialisiere Testdaten
-dashboard = create_test_data()
+# Gemeinsame Datenbank und Registry des Prozesses; beide entstehen erst beim
+# ersten Zugriff, sodass der Import des Moduls keine Seiteneffekte hat.
+database_name = 'student_dashboard.db'
+_database = None
+_registry = None
+_analytics = None
+_reminders = None
+_startup_lock = threading.Lock()
+
+
+def get_database():
+    """Gibt die gemeinsame Datenbank zurück und öffnet sie beim ersten Aufruf."""
+    global _database
+    if _database is None:
+        with _startup_lock:
+            if _database is None:
+                _database = Database(database_name)
+    return _database
+
+
+def get_registry():
+    """Gibt die gemeinsame Dashboard-Registry zurück und legt sie beim ersten Aufruf an."""
+    global _registry
+    if _registry is None:
+        db = get_database()
+        with _startup_lock:
+            if _registry is None:
+                _registry = DashboardRegistry(db)
+    return _registry
+
+
+def start_reminders(sinks, lead_days=1):
+    """Startet den ReminderScheduler dieses Prozesses über der gemeinsamen Datenbank."""
+    global _reminders
+    scheduler = ReminderScheduler(get_database(), sinks, lead_days)
+    scheduler.start()
+    _reminders = scheduler
+    return scheduler
+
+
+def stop_reminders():
+    """Beendet den ReminderScheduler dieses Prozesses, falls er läuft."""
+    global _reminders
+    scheduler, _reminders = _reminders, None
+    if scheduler is not None:
+        scheduler.stop()
+
+
+def get_analytics():
+    """Gibt die jahrgangsweiten Auswertungen zurück und legt sie beim ersten Aufruf an."""
+    global _analytics
+    if _analytics is None:
+        from analytics import CohortAnalytics
+        db = get_database()
+        with _startup_lock:
+            if _analytics is None:
+                _analytics = CohortAnalytics(db.connection)
+    return _analytics
+
+
+class BackupJob:
+    """
+    Führt eine Online-Sicherung in einem Hintergrund-Thread aus (siehe Database.backup).
+
+    Attribute:
+        path: Pfad der Sicherungsdatei
+        total, remaining: Seiten insgesamt bzw. noch zu kopieren (None vor dem ersten Schritt)
+        started, finished: Start- und Endzeitpunkt als Unix-Zeit (finished None, solange sie läuft)
+        error: Fehlermeldung, falls die Sicherung fehlgeschlagen ist
+    """
+    def __init__(self, db, path):
+        self.path = path
+        self.total = self.remaining = None
+        self.started = time.time()
+        self.finished = None
+        self.error = None
+        self._db = db
+        self._thread = threading.Thread(target=self._run, name='dashboard-backup', daemon=True)
+
+    @property
+    def running(self):
+        return self.finished is None
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def join(self, timeout=None):
+        self._thread.join(timeout)
+
+    def status(self):
+        """Gibt den Stand der Sicherung als Dictionary zurück."""
+        return {'path': self.path, 'running': self.running, 'total_pages': self.total,
+                'remaining_pages': self.remaining, 'started': self.started, 'finished': self.finished,
+                'error': self.error}
+
+    def _run(self):
+        try:
+            self.total = self._db.backup(self.path, progress=self._progress)
+            self.remaining = 0
+        except Exception as e:
+            self.error = str(e)
+        finally:
+            self.finished = time.time()
+
+    def _progress(self, remaining, total):
+        self.remaining, self.total = remaining, total
+
+
+_backup_job = None
+_backup_lock = threading.Lock()
+
+
+def start_backup(directory=None):
+    """
+    Startet eine Online-Sicherung im Hintergrund, sofern nicht schon eine läuft.
+
+    Die Datei heißt nach Datenbank und Zeitpunkt und liegt in directory
+    (Standard: Ordner backups neben der Datenbank).
+
+    Returns:
+        tuple: (BackupJob, ob er neu gestartet wurde)
+    """
+    global _backup_job
+    db = get_database()
+    with _backup_lock:
+        if _backup_job is not None and _backup_job.running:
+            return _backup_job, False
+        directory = directory or os.path.join(os.path.dirname(db.db_name), 'backups')
+        os.makedirs(directory, exist_ok=True)
+        name = os.path.splitext(os.path.basename(db.db_name))[0]
+        path = os.path.join(directory, f'{name}-{datetime.datetime.now():%Y%m%d-%H%M%S-%f}.db')
+        _backup_job = BackupJob(db, path).start()
+        return _backup_job, True
+
+
+def backup_status():
+    """Gibt den Stand der letzten Sicherung dieses Prozesses zurück oder None."""
+    return _backup_job.status() if _backup_job is not None else None
+
+
+class SamplingProfiler:
+    """
+    Profiliert einen zufälligen Anteil der Anfragen mit cProfile.
+
+    Die Abtastrate lässt sich zur Laufzeit ändern; 0 schaltet das
+    Profiling ab und kostet dann nur einen Vergleich je Anfrage. Die
+    Stichproben werden zu einer gemeinsamen Statistik zusammengefasst.
+
+    Attribute:
+        rate: Anteil der profilierten Anfragen (0.0 bis 1.0)
+        samples: Anzahl der bisher erfassten Stichproben
+    """
+    def __init__(self, rate=0.0):
+        """Initialisiert den Profiler mit der angegebenen Abtastrate."""
+        self.rate = 0.0
+        self.samples = 0
+        self._stats = None
+        self._lock = threading.Lock()
+        self.set_rate(rate)
+
+    def set_rate(self, rate):
+        """Setzt die Abtastrate (wird auf 0.0 bis 1.0 begrenzt)."""
+        self.rate = min(max(float(rate), 0.0), 1.0)
+
+    def reset(self):
+        """Verwirft alle bisher gesammelten Stichproben."""
+        with self._lock:
+            self._stats = None
+            self.samples = 0
+
+    @contextmanager
+    def sample(self):
+        """Profiliert den Block, falls er in die Stichprobe fällt."""
+        if self.rate <= 0.0 or random.random() >= self.rate:
+            yield
+            return
+        import cProfile
+        import pstats
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # In diesem Thread läuft bereits ein anderer Profiler
+            yield
+            return
+        try:
+            yield
+        finally:
+            profile.disable()
+            with self._lock:
+                if self._stats is None:
+                    self._stats = pstats.Stats(profile)
+                else:
+                    self._stats.add(profile)
+                self.samples += 1
+
+    def report(self, sort='cumulative', limit=40):
+        """Gibt die teuersten Funktionen der gesammelten Stichproben als Text zurück."""
+        output = io.StringIO()
+        output.write(f'Abtastrate: {self.rate}  Stichproben: {self.samples}\n')
+        with self._lock:
+            if self._stats is not None:
+                self._stats.stream = output
+                self._stats.sort_stats(sort).print_stats(limit)
+        return output.getvalue()
+
+
+profiler = SamplingProfiler()
+
+# Client-Adressen, denen die Verwaltungsrouten (/admin/...) offenstehen
+LOCAL_ADDRESSES = ('127.0.0.1', '::1', 'localhost')
+
+
+class AdmissionControl:
+    """
+    Zulassungskontrolle für HTTP-Anfragen.
+
+    Ein Token-Bucket je Client-Adresse begrenzt die Anfragerate (429),
+    max_body_size den Anfragekörper (413). Die Server lassen höchstens
+    max_pending Verbindungen auf einen freien Worker warten und weisen
+    weitere sofort ab (503), statt sie unbegrenzt einzureihen. Zeitlimits
+    gelten für das Lesen und Schreiben einer Anfrage sowie für ruhende
+    Keep-alive-Verbindungen. Im Modus prefork zählt jeder Prozess für sich.
+
+    Attribute:
+        rate: Anfragen je Sekunde und Client (0 = unbegrenzt)
+        burst: Anfragen, die ein Client auf einmal senden darf
+        max_body_size: Größter angenommener Anfragekörper in Bytes
+        request_timeout: Zeitlimit für Lesen und Schreiben einer Anfrage in Sekunden
+        keep_alive_timeout: So lange bleibt eine Verbindung ohne neue Anfrage offen
+        keep_alive_requests: Höchstens so viele Anfragen je Verbindung
+        max_pending: Höchstens so viele Verbindungen warten auf einen Worker
+        rejected: Abgewiesene Anfragen je Grund
+    """
+    MAX_CLIENTS = 10000
+    # Ohne Größenlimit für lokale Clients, zeilenweise gelesen (siehe DashboardHandler._post_import)
+    UNLIMITED_BODY = ('/admin/import',)
+    OVERLOADED = json.dumps({'success': False, 'message': 'Server ausgelastet'}).encode('utf-8')
+
+    def __init__(self, rate=0.0, burst=20, max_body_size=1024 * 1024, request_timeout=10.0,
+                 keep_alive_timeout=5.0, keep_alive_requests=100, max_pending=256):
+        """Initialisiert die Zulassungskontrolle; ohne rate gibt es keine Ratenbegrenzung."""
+        self.rate = rate
+        self.burst = burst
+        self.max_body_size = max_body_size
+        self.request_timeout = request_timeout
+        self.keep_alive_timeout = keep_alive_timeout
+        self.keep_alive_requests = keep_alive_requests
+        self.max_pending = max_pending
+        self.rejected = {}
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def configure(self, **settings):
+        """Übernimmt geänderte Einstellungen (Namen wie die Attribute) und leert die Token-Buckets."""
+        for name, value in settings.items():
+            if name not in ('rate', 'burst', 'max_body_size', 'request_timeout', 'keep_alive_timeout',
+                            'keep_alive_requests', 'max_pending'):
+                raise ValueError(f"Unbekannte Einstellung: {name}")
+            setattr(self, name, value)
+        with self._lock:
+            self._buckets.clear()
+
+    def admit(self, client):
+        """
+        Entnimmt dem Token-Bucket des Clients ein Token.
+
+        Returns:
+            float: Sekunden bis zum nächsten freien Token, wenn die Anfrage
+            abgewiesen wird, sonst None
+        """
+        if self.rate <= 0:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            tokens, stamp = self._buckets.get(client, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - stamp) * self.rate)
+            if tokens >= 1:
+                self._buckets[client] = (tokens - 1, now)
+                if len(self._buckets) > self.MAX_CLIENTS:
+                    self._prune(now)
+                return None
+            self._buckets[client] = (tokens, now)
+            return (1 - tokens) / self.rate
+
+    def _prune(self, now):
+        """Vergisst Clients, deren Bucket wieder voll wäre; bleiben zu viele, alle."""
+        refill = self.burst / self.rate
+        self._buckets = {client: bucket for client, bucket in self._buckets.items() if now - bucket[1] < refill}
+        if len(self._buckets) > self.MAX_CLIENTS:
+            self._buckets.clear()
+
+    def body_limit(self, path, client):
+        """Gibt die erlaubte Größe des Anfragekörpers für path und die Client-Adresse zurück (None = unbegrenzt)."""
+        if path in self.UNLIMITED_BODY and client in LOCAL_ADDRESSES:
+            return None
+        return self.max_body_size
+
+    def reject(self, reason):
+        """Zählt eine abgewiesene Anfrage."""
+        with self._lock:
+            self.rejected[reason] = self.rejected.get(reason, 0) + 1
+
+    def overloaded_response(self):
+        """Gibt die vollständige 503-Antwort zurück, mit der Server überzählige Verbindungen abweisen."""
+        self.reject('overloaded')
+        return (b'HTTP/1.1 503 Service Unavailable\r\nContent-Type: application/json\r\n'
+                b'Content-Length: %d\r\nRetry-After: 1\r\nConnection: close\r\n\r\n%s'
+                % (len(self.OVERLOADED), self.OVERLOADED))
+
+
+admission = AdmissionControl()
+
+
+@metrics.register_collector
+def collect_cache_metrics():
+    """Liefert Treffer, Fehlzugriffe und Trefferquote der Caches für /metrics."""
+    caches = [(function.__name__, function.cache_info())
+              for function in (render_completed_modules_html, render_remaining_modules_html, render_deadlines_html)]
+    counters = [(name, info.hits, info.misses) for name, info in caches]
+    evictions = []
+    if _registry is not None:
+        stats = _registry.stats()
+        counters.append(('registry', stats['hits'], stats['misses']))
+        evictions.append(({'cache': 'registry'}, stats['evictions']))
+    return [
+        ('dashboard_cache_hits_total', 'counter', 'Treffer der Caches.',
+         [({'cache': name}, hits) for name, hits, _ in counters]),
+        ('dashboard_cache_misses_total', 'counter', 'Fehlzugriffe der Caches.',
+         [({'cache': name}, misses) for name, _, misses in counters]),
+        ('dashboard_cache_hit_ratio', 'gauge', 'Anteil der Treffer an allen Zugriffen.',
+         [({'cache': name}, hits / (hits + misses) if hits + misses else 0.0) for name, hits, misses in counters]),
+        ('dashboard_cache_evictions_total', 'counter', 'Verdrängte Einträge des Dashboard-Caches.', evictions),
+        ('dashboard_profiler_sample_rate', 'gauge', 'Abtastrate des Profilers.', [({}, profiler.rate)]),
+        ('dashboard_profiler_samples_total', 'counter', 'Profilierte Anfragen.', [({}, profiler.samples)]),
+    ]
+
+
+@metrics.register_collector
+def collect_event_metrics():
+    """Liefert die Zahl der offenen Event-Streams für /metrics."""
+    streams = _registry.events.count() if _registry is not None else 0
+    return [('dashboard_event_streams', 'gauge', 'Offene Event-Streams (Server-Sent Events).', [({}, streams)])]
+
+
+@metrics.register_collector
+def collect_reminder_metrics():
+    """Liefert eingeplante und versandte Fristerinnerungen dieses Prozesses für /metrics."""
+    scheduler = _reminders
+    if scheduler is None:
+        return []
+    return [
+        ('dashboard_reminders_pending', 'gauge', 'Eingeplante Fristerinnerungen.', [({}, scheduler.pending())]),
+        ('dashboard_reminders_sent_total', 'counter', 'Versandte Fristerinnerungen.', [({}, scheduler.sent)]),
+    ]
+
+
+@metrics.register_collector
+def collect_admission_metrics():
+    """Liefert die von der Zulassungskontrolle abgewiesenen Anfragen für /metrics."""
+    with admission._lock:
+        rejected = sorted(admission.rejected.items())
+    return [('dashboard_http_rejected_total', 'counter', 'Abgewiesene Anfragen je Grund.',
+             [({'reason': reason}, count) for reason, count in rejected])]
+
+
+ROUTES = ('/', '/favicon.ico', '/api', '/api/batch', '/events', '/metrics', '/admin/profile', '/admin/export',
+          '/admin/import', '/admin/backup')
+
+
+def route_label(path):
+    """Fasst Pfade zu Routen zusammen, damit die Zahl der Zeitreihen begrenzt bleibt."""
+    path = urlparse(path).path
+    if path.startswith('/students/'):
+        return '/students/{id}'
+    if path.startswith('/static/'):
+        return '/static'
+    if path.startswith('/api/analytics/') and path[len('/api/analytics/'):].strip('/') in ANALYTICS_VIEWS:
+        return path.rstrip('/')
+    if path.startswith('/api/') and path[len('/api/'):].strip('/') in API_RESOURCES:
+        return path.rstrip('/')
+    return path if path in ROUTES else 'other'
+
+
+def instrumented(method):
+    """Erfasst Dauer und Status einer Handler-Methode und profiliert sie stichprobenweise."""
+    @wraps(method)
+    def wrapper(self):
+        start = time.perf_counter()
+        self._status = None
+        try:
+            with profiler.sample():
+                method(self)
+        finally:
+            http_request_seconds.observe(time.perf_counter() - start,
+                                         self.command, route_label(self.path), str(self._status))
+    return wrapper
+
+
+request_logger = logging.getLogger('dashboard.requests')
+
+
+def start_request_logging(stream=None):
+    """
+    Schreibt das Anfrage-Log über eine Warteschlange in einem eigenen Thread.
+
+    Die Handler-Threads legen Einträge nur in die Warteschlange; die
+    Ausgabe auf stream (Standard: stdout) blockiert sie nicht.
+
+    Returns:
+        QueueListener: der gestartete Listener, mit stop_request_logging() zu beenden
+    """
+    import logging.handlers
+    log_queue = queue.SimpleQueue()
+    output = logging.StreamHandler(stream or sys.stdout)
+    output.setFormatter(logging.Formatter('[%(asctime)s] %(message)s', '%d/%b/%Y %H:%M:%S'))
+    listener = logging.handlers.QueueListener(log_queue, output)
+    listener.queue_handler = logging.handlers.QueueHandler(log_queue)
+    request_logger.addHandler(listener.queue_handler)
+    request_logger.setLevel(logging.INFO)
+    request_logger.propagate = False
+    listener.start()
+    return listener
+
+
+def stop_request_logging(listener):
+    """Schreibt noch wartende Einträge aus und beendet das Anfrage-Log."""
+    request_logger.removeHandler(listener.queue_handler)
+    listener.stop()
+
+
+class DashboardHandler(BaseHTTPRequestHandler):
+    """
+    HTTP-Request-Handler für das Web-Dashboard.
+    
+    Verarbeitet GET-Anfragen zur Anzeige des Dashboards und
+    POST-Anfragen zur Aktualisierung von Daten (Fristen, Ziele).
+    Der Student wird über den Pfad (/students/<id>) oder den Parameter
+    student_id bestimmt; ohne Angabe wird der Standard-Student angezeigt.
+    /events liefert Änderungen an Zielen und Fristen als Server-Sent Events.
+
+    Verbindungen bleiben nach HTTP/1.1 offen (Keep-alive), begrenzt durch
+    die Zulassungskontrolle (siehe AdmissionControl).
+    """
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        """Setzt das Zeitlimit für Lesen und Schreiben, bevor die Verbindung geöffnet wird."""
+        self.timeout = admission.request_timeout or None
+        self.requests_served = 0
+        self._unread = 0
+        super().setup()
+
+    def handle(self):
+        """Bearbeitet die Anfragen einer Verbindung, solange sie offen bleiben darf."""
+        self.close_connection = True
+        self.handle_one_request()
+        while not self.close_connection and self._wait_for_request():
+            self.handle_one_request()
+
+    def _wait_for_request(self):
+        """
+        Wartet auf die nächste Anfrage einer Keep-alive-Verbindung.
+
+        Gibt False zurück, wenn die Verbindung geschlossen werden soll: nach
+        keep_alive_timeout Sekunden Ruhe, wenn der Client sie geschlossen hat
+        oder sobald andere Verbindungen auf einen Worker warten. Eine ruhende
+        Verbindung hält so keinen Worker fest, den jemand braucht.
+        """
+        deadline = time.monotonic() + admission.keep_alive_timeout
+        watched = [self.connection, self.server.wakeup_socket()]
+        self.connection.setblocking(False)
+        try:
+            while not self.rfile.peek(1):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self.server.waiting():
+                    return False
+                readable, _, _ = select.select(watched, [], [], remaining)
+                if self.connection in readable and not self.rfile.peek(1):
+                    return False   # vom Client geschlossen
+            return True
+        except OSError:
+            return False
+        finally:
+            self.connection.settimeout(self.timeout)
+
+    def parse_request(self):
+        """
+        Wertet die Kopfzeilen aus und lässt die Anfrage nur zu, wenn sie die Grenzen einhält.
+
+        Abgewiesen werden zu schnelle Clients (429 mit Retry-After), zu große
+        Anfragekörper (413), Körper ohne Längenangabe (411) und ungültige
+        Längen (400). Ein abgewiesener Körper wird nicht gelesen, die
+        Verbindung danach geschlossen.
+        """
+        self.requests_served += 1
+        self._unread = 0
+        if not super().parse_request():
+            return False
+        if self.requests_served >= admission.keep_alive_requests:
+            self.close_connection = True
+        retry_after = admission.admit(self.client_address[0])
+        if retry_after is not None:
+            self._reject(429, 'rate', 'Zu viele Anfragen', {'Retry-After': str(math.ceil(retry_after))})
+            return False
+        if 'Transfer-Encoding' in self.headers:
+            self._reject(411, 'length', 'Anfragekörper nur mit Content-Length')
+            return False
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+        except ValueError:
+            length = -1
+        if length < 0:
+            self._reject(400, 'length', 'Ungültige Content-Length')
+            return False
+        limit = admission.body_limit(urlparse(self.path).path, self.client_address[0])
+        if limit is not None and length > limit:
+            self._reject(413, 'size', f'Anfragekörper größer als {limit} Bytes')
+            return False
+        self._unread = length
+        return True
+
+    def _reject(self, status, reason, message, headers=None):
+        """Weist eine Anfrage vor ihrer Bearbeitung ab und schließt danach die Verbindung."""
+        admission.reject(reason)
+        self.close_connection = True
+        body = json.dumps({'success': False, 'message': message}).encode('utf-8')
+        self._send_body(status, 'application/json', body, headers)
 
-class DashboardHandler(BaseHTTPRequestHandler):
-    """
-    HTTP-Request-Handler für das Web-Dashboard.
-    
-    Verarbeitet GET-Anfragen zur Anzeige des Dashboards und
-    POST-Anfragen zur Aktualisierung von Daten (Fristen, Ziele).
-    """
+    def _read_body(self):
+        """Liest den (bereits geprüften) Anfragekörper vollständig."""
+        body = self.rfile.read(self._unread)
+        self._unread = 0
+        return body
+
+    def send_response(self, code, message=None):
+        """Sendet die Statuszeile und merkt sich den Status für die Metriken."""
+        self._status = code
+        self._connection_header = False
+        super().send_response(code, message)
+
+    def send_header(self, keyword, value):
+        """Sendet eine Kopfzeile und merkt sich, ob Connection schon gesetzt ist."""
+        if keyword.lower() == 'connection':
+            self._connection_header = True
+        super().send_header(keyword, value)
+
+    def end_headers(self):
+        """
+        Kündigt bei HTTP/1.1 an, wenn die Verbindung nach dieser Antwort geschlossen wird.
+
+        Das ist auch der Fall, wenn der Anfragekörper ungelesen blieb (z.B.
+        bei 403 oder 404): er stünde sonst vor der nächsten Anfrage.
+        """
+        if self._unread:
+            self.close_connection = True
+        if (self.close_connection and self.request_version == 'HTTP/1.1'
+                and not self._connection_header):
+            self.send_header('Connection', 'close')
+        super().end_headers()
+
+    def _send_empty(self, status):
+        """Sendet eine Antwort ohne Inhalt (z.B. 403, 404)."""
+        self.send_response(status)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def _resolve_student_id(self, parsed_path, params):
+        """Ermittelt die Studenten-ID aus Pfad oder Parametern der Anfrage."""
+        if parsed_path.path.startswith('/students/'):
+            return unquote(parsed_path.path[len('/students/'):].strip('/'))
+        return params.get('student_id', [get_registry().default_student_id])[0]
+
+    def _validators(self, student_id):
+        """
+        Bildet ETag und Last-Modified der Dashboard-Seite eines Studenten.
+
+        Neben der Inhaltsversion fließen Vorlage, Asset-URLs und das aktuelle
+        Datum ein, da das berechnete Studienende vom heutigen Tag abhängt.
+        """
+        registry = get_registry()
+        registry.poll_changes()
+        version, modified = registry.versions.get(student_id)
+        today = datetime.date.today()
+        etag = (f'W/"{registry.versions.epoch}-{version}-{dashboard_template.version:x}-'
+                f'{static_assets.version}-{today:%Y%m%d}"')
+        midnight = time.mktime(today.timetuple())
+        return etag, max(modified, midnight)
+
+    def _not_modified(self, etag, last_modified):
+        """Prüft If-None-Match bzw. If-Modified-Since gegen die aktuellen Validatoren."""
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match is not None:
+            tags = [tag.strip() for tag in if_none_match.split(',')]
+            return '*' in tags or any(tag.removeprefix('W/') == etag.removeprefix('W/') for tag in tags)
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since:
+            try:
+                since = parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+            return int(last_modified) <= since
+        return False
+
+    def _send_body(self, status, content_type, body, headers=None):
+        """
+        Sendet eine vollständige Antwort, bei Bedarf komprimiert.
+
+        Die Kodierung wird anhand von Accept-Encoding ausgehandelt; sehr
+        kleine Antworten bleiben unkomprimiert.
+        """
+        encoding = negotiate_encoding(self.headers.get('Accept-Encoding'))
+        if encoding != 'identity' and len(body) >= MIN_COMPRESS_SIZE:
+            body = compress_body(body, encoding)
+        else:
+            encoding = 'identity'
+        self.send_response(status)
+        self.send_header('Content-type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Vary', 'Accept-Encoding')
+        if encoding != 'identity':
+            self.send_header('Content-Encoding', encoding)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_stream(self, status, content_type, chunks, headers=None):
+        """
+        Sendet eine Antwort, deren Inhalt blockweise erzeugt wird.
+
+        Bei HTTP/1.1 wird chunked übertragen, sonst endet die Antwort mit
+        dem Schließen der Verbindung. Komprimiert wird fortlaufend.
+        """
+        encoding = negotiate_encoding(self.headers.get('Accept-Encoding'))
+        compressor = None
+        if encoding != 'identity':
+            compressor = zlib.compressobj(6, zlib.DEFLATED, 31 if encoding == 'gzip' else 15)
+        chunked = self.request_version == 'HTTP/1.1' and self.protocol_version == 'HTTP/1.1'
+        self.send_response(status)
+        self.send_header('Content-type', content_type)
+        self.send_header('Vary', 'Accept-Encoding')
+        if compressor is not None:
+            self.send_header('Content-Encoding', encoding)
+        if chunked:
+            self.send_header('Transfer-Encoding', 'chunked')
+        else:
+            self.send_header('Connection', 'close')
+            self.close_connection = True
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+
+        def write(data):
+            if not data:
+                return
+            if chunked:
+                self.wfile.write(b'%x\r\n%s\r\n' % (len(data), data))
+            else:
+                self.wfile.write(data)
+
+        for chunk in chunks:
+            write(compressor.compress(chunk) if compressor is not None else chunk)
+        if compressor is not None:
+            write(compressor.flush())
+        if chunked:
+            self.wfile.write(b'0\r\n\r\n')
+
+    def _send_api(self, parsed_path):
+        """
+        Beantwortet GET /api/<ressource> mit JSON.
+
+        Ressourcen: gpa, progress, modules, exams, deadlines. Listen werden
+        über cursor und limit seitenweise geliefert, fields wählt Felder aus.
+        Antworten, die in einen Block passen, werden vollständig gesendet,
+        größere (z.B. lange Prüfungshistorien) gestreamt.
+        """
+        resource = API_RESOURCES.get(parsed_path.path[len('/api/'):].strip('/'))
+        if resource is None:
+            self._send_empty(404)
+            return
+        params = parse_qs(parsed_path.query)
+        student_id = self._resolve_student_id(parsed_path, params)
+        etag, last_modified = self._validators(student_id)
+        headers = {
+            'ETag': etag,
+            'Last-Modified': formatdate(last_modified, usegmt=True),
+            'Cache-Control': 'no-cache',
+        }
+        if self._not_modified(etag, last_modified):
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'no-cache')
+            self.end_headers()
+            return
+
+        dashboard = get_registry().get(student_id)
+        if dashboard is None:
+            self._send_empty(404)
+            return
+        content_type = 'application/json; charset=utf-8'
+        try:
+            payload = resource(dashboard, params)
+        except ValueError as e:
+            body = json.dumps({'success': False, 'message': str(e)}).encode('utf-8')
+            self._send_body(400, content_type, body)
+            return
+
+        chunks = StreamingJSONEncoder().iterencode(payload)
+        first = next(chunks)
+        second = next(chunks, None)
+        if second is None:
+            self._send_body(200, content_type, first, headers)
+        else:
+            self._send_stream(200, content_type, itertools.chain((first, second), chunks), headers)
+
+    def _send_analytics(self, parsed_path):
+        """
+        Beantwortet GET /api/analytics/<auswertung> mit JSON über alle Studenten.
+
+        Auswertungen: modules, at-risk, deadline-weeks (seitenweise über
+        cursor und limit). ETag und Last-Modified folgen dem Datenstand der
+        Datenbank, sodass unveränderte Auswertungen mit 304 beantwortet werden.
+        """
+        view = ANALYTICS_VIEWS.get(parsed_path.path[len('/api/analytics/'):].strip('/'))
+        if view is None:
+            self._send_empty(404)
+            return
+        analytics = get_analytics()
+        versions = get_database().versions
+        version, changed = analytics.version()
+        changed = changed or versions.started
+        etag = f'W/"{versions.epoch}-a{version}"'
+        if self._not_modified(etag, changed):
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'no-cache')
+            self.end_headers()
+            return
+        content_type = 'application/json; charset=utf-8'
+        try:
+            payload = view(analytics, parse_qs(parsed_path.query))
+        except ValueError as e:
+            body = json.dumps({'success': False, 'message': str(e)}).encode('utf-8')
+            self._send_body(400, content_type, body)
+            return
+        self._send_body(200, content_type, json.dumps(payload).encode('utf-8'), {
+            'ETag': etag,
+            'Last-Modified': formatdate(changed, usegmt=True),
+            'Cache-Control': 'no-cache',
+        })
+
+    def _send_static(self, path):
+        """Liefert ein statisches Asset mit Langzeit-Caching aus dem vorkomprimierten Cache."""
+        asset = static_assets.find(path)
+        if asset is None:
+            self._send_empty(404)
+            return
+        if self.headers.get('If-None-Match') == asset['etag']:
+            self.send_response(304)
+            self.send_header('ETag', asset['etag'])
+            self.end_headers()
+            return
+        encoding = negotiate_encoding(self.headers.get('Accept-Encoding'))
+        body = static_assets.encoded(asset, encoding)
+        self.send_response(200)
+        self.send_header('Content-type', asset['content_type'])
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'public, max-age=31536000, immutable')
+        self.send_header('ETag', asset['etag'])
+        self.send_header('Vary', 'Accept-Encoding')
+        if encoding != 'identity':
+            self.send_header('Content-Encoding', encoding)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_events(self, parsed_path):
+        """
+        Öffnet einen Event-Stream (Server-Sent Events) mit den Änderungen eines Studenten.
+
+        Gesendet werden hier nur die Kopfzeilen; danach übernimmt der
+        EventStreamer des Servers die Verbindung und der Worker ist frei.
+        """
+        student_id = self._resolve_student_id(parsed_path, parse_qs(parsed_path.query))
+        registry = get_registry()
+        if registry.get(student_id) is None:
+            self._send_empty(404)
+            return
+        self.send_response(200)
+        self.send_header('Content-type', 'text/event-stream; charset=utf-8')
+        self.send_header('Cache-Control', 'no-store')
+        self.send_header('Connection', 'close')
+        self.send_header('X-Accel-Buffering', 'no')
+        self.end_headers()
+        self.wfile.write(b'retry: 3000\n\n')
+        self.close_connection = True
+        self.server.stream_events(self, registry.events.subscribe(student_id))
+
+    def _is_local(self):
+        """Prüft, ob die Anfrage vom lokalen Rechner stammt."""
+        return self.client_address[0] in LOCAL_ADDRESSES
+
+    def _send_profile(self, params=None):
+        """Liefert den Profiler-Bericht; mit params werden Abtastrate bzw. Reset übernommen."""
+        if not self._is_local():
+            self._send_empty(403)
+            return
+        if params:
+            try:
+                if 'rate' in params:
+                    profiler.set_rate(params['rate'][0])
+            except ValueError:
+                self._send_body(400, 'text/plain; charset=utf-8', 'Ungültige Abtastrate\n'.encode())
+                return
+            if params.get('reset', ['0'])[0] == '1':
+                profiler.reset()
+        self._send_body(200, 'text/plain; charset=utf-8', profiler.report().encode('utf-8'),
+                        {'Cache-Control': 'no-store'})
+
+    def _send_export(self):
+        """Streamt alle Tabellen als JSONL (siehe Database.export_rows); nur lokal."""
+        if not self._is_local():
+            self._send_empty(403)
+            return
+        filename = f'dashboard-export-{datetime.datetime.now():%Y%m%d-%H%M%S}.jsonl'
+        self._send_stream(200, 'application/x-ndjson; charset=utf-8', jsonl_chunks(get_database().export_rows()), {
+            'Cache-Control': 'no-store',
+            'Content-Disposition': f'attachment; filename="{filename}"',
+        })
+
+    def _post_import(self):
+        """
+        Übernimmt einen JSONL-Export aus dem Anfragekörper; nur lokal.
+
+        Der Import schreibt über eine eigene Database-Instanz. Dieser und alle
+        anderen Server-Prozesse übernehmen ihn damit wie jede fremde Änderung
+        (poll_changes), verwerfen also die betroffenen Dashboards.
+        """
+        if not self._is_local():
+            self._send_empty(403)
+            return
+        importer = Database(database_name)
+        try:
+            count = importer.import_rows(read_lines(self.rfile, self._unread))
+            self._unread = 0
+            status, response = 200, {'success': True, 'records': count}
+        except ValueError as e:
+            status, response = 400, {'success': False, 'message': str(e)}
+        finally:
+            importer.close()
+        self._send_body(status, 'application/json', json.dumps(response).encode())
+
+    def _send_backup(self, start=False):
+        """Liefert den Stand der letzten Sicherung; mit start wird eine neue begonnen (202); nur lokal."""
+        if not self._is_local():
+            self._send_empty(403)
+            return
+        status = 200
+        if start:
+            job, started = start_backup()
+            status = 202 if started else 409
+        body = json.dumps(backup_status()).encode('utf-8')
+        self._send_body(status, 'application/json', body, {'Cache-Control': 'no-store'})
+
+    @instrumented
     def do_GET(self):
-        """Verarbeitet GET-Anfragen und liefert die Dashboard-HTML-Seite."""
+        """Verarbeitet GET-Anfragen und liefert die Dashboard-HTML-Seite und statische Assets."""
         parsed_path = urlparse(self.path)
 
         if parsed_path.path == '/favicon.ico':
@@ -470,178 +4347,998 @@ class DashboardHandler(BaseHTTPRequestHandler):
             self.end_headers()
             return
 
-        if parsed_path.path == '/':
-            # Lade Deadlines aus der Datenbank neu
-            dashboard.reload_deadlines()
-            
-            # Generiere Dashboard-HTML
-            completed = dashboard.get_completed_modules()
-            total = dashboard.student.study_course.modules
-            completed_count = len(completed)
-            total_count = len(total)
-            progress = round((completed_count / total_count * 100) if total_count > 0 else 0, 1)
-            
-            # Erstelle HTML für abgeschlossene Module
-            completed_html = ""
-            for exam in dashboard.exams:
-                if exam.grade is not None and exam.grade <= 4.0:
-                    completed_html += f'''
-                    <div class="module-card completed">
-                        <strong>{exam.module.name}</strong><br>
-                        Credits: {exam.module.credits}<br>
-                        Note: {exam.grade}
-                    </div>
-                    '''
-            
-            # Erstelle HTML für verbleibende Module
-            remaining_html = ""
-            for module in [m for m in total if m not in completed]:
-                remaining_html += f'''
-                <div class="module-card pending">
-                    <strong>{module.name}</strong><br>
-                    Credits: {module.credits}
-                </div>
-                '''
-            
-            # Erstelle HTML für Deadlines
-            deadlines_html = ""
-            for idx, deadline in enumerate(sorted(dashboard.deadlines, key=lambda x: x['date'])):
-                deadlines_html += f'''
-                <div class="deadline-item">
-                    <div>
-                        <span class="deadline-date">{deadline['date']}</span> - 
-                        {deadline['type']}: {deadline['module']}
-                    </div>
-                    <button class="delete-btn" onclick="deleteDeadline({idx})">Löschen</button>
-                </div>
-                '''
-            
-            # Formatiere das HTML
-            html = load_dashboard_html()
-            replacements = {
-                '{student_name}': dashboard.student.name,
-                '{gpa}': str(dashboard.calculate_gpa()),
-                '{target_gpa}': str(dashboard.target_gpa),
-                '{avg_time}': str(dashboard.calculate_avg_module_time()),
-                '{end_date}': dashboard.calculate_target_end_date(),
-                '{completed_count}': str(completed_count),
-                '{total_count}': str(total_count),
-                '{progress}': str(progress),
-                '{completed_modules}': completed_html,
-                '{remaining_modules}': remaining_html,
-                '{deadlines}': deadlines_html,
-            }
-            for placeholder, value in replacements.items():
-                html = html.replace(placeholder, value)
-            
-            html_bytes = html.encode('utf-8')
-            self.send_response(200)
-            self.send_header('Content-type', 'text/html; charset=utf-8')
-            self.send_header('Content-Length', str(len(html_bytes)))
-            self.end_headers()
-            self.wfile.write(html_bytes)
+        if parsed_path.path == '/metrics':
+            self._send_body(200, 'text/plain; version=0.0.4; charset=utf-8', metrics.exposition().encode('utf-8'),
+                            {'Cache-Control': 'no-store'})
+            return
+
+        if parsed_path.path == '/admin/profile':
+            self._send_profile()
+            return
+
+        if parsed_path.path == '/admin/export':
+            self._send_export()
+            return
+
+        if parsed_path.path == '/admin/backup':
+            self._send_backup()
+            return
+
+        if parsed_path.path == '/' or parsed_path.path.startswith('/students/'):
+            student_id = self._resolve_student_id(parsed_path, parse_qs(parsed_path.query))
+            etag, last_modified = self._validators(student_id)
+            if self._not_modified(etag, last_modified):
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.send_header('Cache-Control', 'no-cache')
+                self.end_headers()
+                return
+
+            dashboard = get_registry().get(student_id)
+            if dashboard is None:
+                self._send_empty(404)
+                return
+
+            with dashboard.lock:
+                html = render_dashboard_html(dashboard)
+
+            self._send_body(200, 'text/html; charset=utf-8', html.encode('utf-8'), {
+                'ETag': etag,
+                'Last-Modified': formatdate(last_modified, usegmt=True),
+                'Cache-Control': 'no-cache',
+            })
+        elif parsed_path.path.startswith('/api/analytics/'):
+            self._send_analytics(parsed_path)
+        elif parsed_path.path.startswith('/api/'):
+            self._send_api(parsed_path)
+        elif parsed_path.path == '/events':
+            self._send_events(parsed_path)
+        elif parsed_path.path.startswith('/static/'):
+            self._send_static(parsed_path.path)
         else:
-            self.send_response(404)
-            self.end_headers()
+            self._send_empty(404)
     
+    @instrumented
     def do_POST(self):
         """
         Verarbeitet POST-Anfragen für API-Operationen.
         
-        Unterstützte Aktionen:
+        Unterstützte Aktionen (siehe API_ACTIONS):
         - update_gpa: Aktualisiert die Ziel-Note
         - update_date: Aktualisiert das Ziel-Enddatum
         - add_deadline: Fügt eine neue Frist hinzu
         - delete_deadline: Löscht eine Frist
+
+        /api erwartet eine Aktion als Formular, /api/batch ein JSON-Array
+        von Aktionen, die gemeinsam oder gar nicht übernommen werden.
+        /admin/profile setzt die Abtastrate des Profilers (rate, reset=1).
         """
-        if self.path == '/api':
-            content_length = int(self.headers['Content-Length'])
-            post_data = self.rfile.read(content_length).decode('utf-8')
-            params = parse_qs(post_data)
-            
-            action = params.get('action', [''])[0]
-            response = {'success': False, 'message': 'Unbekannte Aktion'}
+        parsed_path = urlparse(self.path)
+        if parsed_path.path == '/api':
+            params = parse_qs(self._read_body().decode('utf-8'))
+            dashboard = get_registry().get(self._resolve_student_id(parsed_path, params))
+            if dashboard is None:
+                self._send_empty(404)
+                return
 
             try:
-                if action == 'update_gpa':
-                    new_gpa = float(params.get('value', [''])[0])
-                    dashboard.update_target_gpa(new_gpa)
-                    response = {'success': True, 'message': 'Ziel-GPA aktualisiert'}
-
-                elif action == 'update_date':
-                    new_date = params.get('value', [''])[0]
-                    dashboard.update_target_end_date(new_date)
-                    response = {'success': True, 'message': 'Ziel-Enddatum aktualisiert'}
-
-                elif action == 'add_deadline':
-                    deadline_type = params.get('type', [''])[0]
-                    module_name = params.get('module', [''])[0]
-                    deadline_date = params.get('date', [''])[0]
-                    dashboard.add_deadline(deadline_type, module_name, deadline_date)
-                    response = {'success': True, 'message': 'Frist hinzugefügt'}
-
-                elif action == 'delete_deadline':
-                    index = int(params.get('index', [''])[0])
-                    dashboard.delete_deadline(index)
-                    dashboard.reload_deadlines()
-                    response = {'success': True, 'message': 'Frist gelöscht'}
-            
+                with dashboard.lock:
+                    response = run_action(dashboard, {name: values[0] for name, values in params.items()})
             except Exception as e:
                 response = {'success': False, 'message': str(e)}
             
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(response).encode())
+            self._send_body(200, 'application/json', json.dumps(response).encode())
+        elif parsed_path.path == '/api/batch':
+            self._post_batch(parsed_path, self._read_body())
+        elif parsed_path.path == '/admin/profile':
+            self._send_profile(parse_qs(self._read_body().decode('utf-8')))
+        elif parsed_path.path == '/admin/import':
+            self._post_import()
+        elif parsed_path.path == '/admin/backup':
+            self._send_backup(start=True)
         else:
-            self.send_response(404)
-            self.end_headers()
+            self._send_empty(404)
+
+    def _post_batch(self, parsed_path, body):
+        """
+        Führt ein JSON-Array von Aktionen in einer einzigen Transaktion aus.
+
+        Schlägt eine Aktion fehl, wird keine Änderung übernommen. Die Antwort
+        enthält je ausgeführter Aktion ein Ergebnis; failed_index bezeichnet
+        die fehlgeschlagene Aktion.
+        """
+        try:
+            actions = json.loads(body.decode('utf-8'))
+        except ValueError:
+            actions = None
+        if (not isinstance(actions, list) or len(actions) > MAX_BATCH_ACTIONS
+                or not all(isinstance(action, dict) for action in actions)):
+            message = f'Erwartet wird ein JSON-Array mit höchstens {MAX_BATCH_ACTIONS} Aktionen'
+            self._send_body(400, 'application/json', json.dumps({'success': False, 'message': message}).encode())
+            return
+
+        dashboard = get_registry().get(self._resolve_student_id(parsed_path, parse_qs(parsed_path.query)))
+        if dashboard is None:
+            self._send_empty(404)
+            return
+
+        results = []
+        try:
+            with dashboard.transaction():
+                for action in actions:
+                    results.append(run_action(dashboard, action))
+        except Exception as e:
+            results.append({'success': False, 'message': str(e)})
+            response = {
+                'success': False,
+                'message': f'Aktion {len(results)} fehlgeschlagen, keine Änderung übernommen',
+                'failed_index': len(results) - 1,
+                'results': results,
+            }
+        else:
+            response = {'success': True, 'message': f'{len(results)} Aktionen ausgeführt', 'results': results}
+        self._send_body(200, 'application/json', json.dumps(response).encode())
     
     def log_message(self, format, *args):
-        """Gibt Log-Nachrichten mit Zeitstempel aus."""
-        print(f"[{self.log_date_time_string()}] {format % args}")
+        """Übergibt Log-Nachrichten an das gepufferte Anfrage-Log (siehe start_request_logging)."""
+        request_logger.info(format, *args)
 
 
 class DashboardHTTPServer(HTTPServer):
     """
     Erweiterter HTTP-Server mit Windows-Kompatibilität.
 
-    Unterdrückt ConnectionAbortedError, der auf Windows auftritt wenn
-    der Browser eine Verbindung vorzeitig trennt (z.B. beim Favicon-Abruf).
+    Unterdrückt Verbindungsabbrüche (z.B. ConnectionAbortedError auf
+    Windows), die auftreten wenn der Browser eine Verbindung vorzeitig
+    trennt (z.B. beim Favicon-Abruf). Event-Streams übernimmt ein
+    EventStreamer in einem eigenen Thread.
+
+    Attribute:
+        event_streamer: Hält die offenen Event-Streams
     """
     allow_reuse_address = True
+    # Wiederverbindende Event-Streams dürfen die Warteschlange nicht überlaufen lassen
+    request_queue_size = 128
+
+    def __init__(self, server_address, handler_class, bind_and_activate=True):
+        """Initialisiert den Server; der Thread des EventStreamers startet erst beim ersten Stream."""
+        super().__init__(server_address, handler_class, bind_and_activate)
+        self.event_streamer = EventStreamer()
+
+    def waiting(self):
+        """Prüft, ob eine weitere Verbindung darauf wartet, angenommen zu werden."""
+        return bool(select.select([self.socket], [], [], 0)[0])
+
+    def wakeup_socket(self):
+        """Gibt den Socket zurück, der lesbar wird, sobald waiting() zutrifft."""
+        return self.socket
+
+    def stream_events(self, handler, subscription):
+        """Übergibt die Verbindung eines Handlers nach den Kopfzeilen an den EventStreamer."""
+        sock = socket.socket(fileno=handler.connection.detach())
+        self.event_streamer.adopt(sock, subscription)
+
+    def server_close(self):
+        """Schließt den Socket und alle offenen Event-Streams."""
+        super().server_close()
+        self.event_streamer.close()
 
     def handle_error(self, request, client_address):
-        """Ignoriert Windows-spezifische Verbindungsabbrüche."""
+        """Ignoriert vom Client verursachte Verbindungsabbrüche."""
         import sys
-        if sys.exc_info()[0] is ConnectionAbortedError:
+        if issubclass(sys.exc_info()[0], ConnectionError):
             pass
         else:
             super().handle_error(request, client_address)
 
 
+class ThreadedDashboardHTTPServer(ThreadingMixIn, DashboardHTTPServer):
+    """
+    HTTP-Server, der Anfragen parallel in einem begrenzten Thread-Pool bearbeitet.
+
+    Entspricht ThreadingHTTPServer, startet aber nicht pro Anfrage einen
+    neuen Thread, sondern verteilt die Verbindungen auf eine feste Anzahl
+    langlebiger Worker. Deren Datenbankverbindungen bleiben so im
+    ConnectionPool erhalten. Warten bereits admission.max_pending
+    Verbindungen auf einen Worker, wird jede weitere mit 503 abgewiesen.
+
+    Attribute:
+        workers: Anzahl der Worker-Threads
+    """
+    daemon_threads = True
+
+    def __init__(self, server_address, handler_class, workers=8, bind_and_activate=True):
+        """Initialisiert den Server und den Worker-Pool."""
+        from concurrent.futures import ThreadPoolExecutor
+        super().__init__(server_address, handler_class, bind_and_activate)
+        self.workers = workers
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='dashboard-worker')
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+        # Lesbar, solange Verbindungen warten; weckt ruhende Keep-alive-Verbindungen
+        self._wakeup, self._wakeup_signal = socket.socketpair()
+        self._wakeup.setblocking(False)
+        self._closing = False
+
+    def waiting(self):
+        """Prüft, ob Verbindungen auf einen freien Worker warten oder der Server schließt."""
+        return self._pending > 0 or self._closing
+
+    def wakeup_socket(self):
+        """Gibt den Socket zurück, der lesbar ist, solange Verbindungen auf einen Worker warten."""
+        return self._wakeup
+
+    def process_request(self, request, client_address):
+        """Übergibt die Verbindung an einen freien Worker oder weist sie ab, wenn zu viele warten."""
+        with self._pending_lock:
+            overloaded = self._pending >= admission.max_pending
+            if not overloaded:
+                self._pending += 1
+                if self._pending == 1:
+                    self._wakeup_signal.send(b'.')
+        if overloaded:
+            try:
+                request.sendall(admission.overloaded_response())
+            except OSError:
+                pass
+            self.shutdown_request(request)
+            return
+        self._executor.submit(self._process_pending, request, client_address)
+
+    def _process_pending(self, request, client_address):
+        with self._pending_lock:
+            self._pending -= 1
+            if self._pending == 0:
+                self._wakeup.recv(16)
+        self.process_request_thread(request, client_address)
+
+    def server_close(self):
+        """Schließt den Socket, beendet ruhende Keep-alive-Verbindungen und wartet auf laufende Anfragen."""
+        super().server_close()
+        with self._pending_lock:
+            self._closing = True
+            self._wakeup_signal.send(b'.')
+        self._executor.shutdown(wait=True)
+        self._wakeup.close()
+        self._wakeup_signal.close()
+
+
+class EventStreamer:
+    """
+    Hält die offenen Event-Streams (Server-Sent Events) in einer asyncio-Event-Loop.
+
+    Ein wartender Client belegt so nur einen Socket und wenige Objekte,
+    keinen Worker-Thread. Im Modus asyncio laufen die Streams in der Loop
+    des Servers; die übrigen Modi übergeben die Verbindung nach dem Senden
+    der Kopfzeilen an eine eigene Loop in einem Hintergrund-Thread. Solange
+    Streams offen sind, werden einmal pro POLL_INTERVAL Sekunden Änderungen
+    anderer Prozesse übernommen, damit auch diese die Clients erreichen.
+    """
+    HEARTBEAT = 15
+    POLL_INTERVAL = 1.0
+
+    def __init__(self, loop=None):
+        """Initialisiert den Streamer; ohne loop wird beim ersten Stream ein eigener Thread gestartet."""
+        self._loop = loop
+        self._thread = None
+        self._lock = threading.Lock()
+        self._streams = {}
+        self._poller = None
+
+    def count(self):
+        """Gibt die Zahl der offenen Streams zurück."""
+        return len(self._streams)
+
+    def adopt(self, sock, subscription):
+        """Übernimmt eine Verbindung, deren Antwort-Kopfzeilen bereits gesendet sind (aus beliebigem Thread)."""
+        import asyncio
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name='dashboard-events', daemon=True)
+                self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._adopt(sock, subscription), self._loop)
+
+    async def _adopt(self, sock, subscription):
+        import asyncio
+        try:
+            reader, writer = await asyncio.open_connection(sock=sock)
+        except OSError:
+            sock.close()
+            subscription.bus.unsubscribe(subscription)
+            return
+        await self.stream(reader, writer, subscription)
+
+    async def stream(self, reader, writer, subscription):
+        """
+        Sendet die Ereignisse eines Abonnements, bis der Client die Verbindung trennt.
+
+        Zuerst und nach jedem Überlauf geht der vollständige Stand (snapshot)
+        hinaus, danach die einzelnen Änderungen. Ohne Änderungen hält ein
+        Kommentar alle HEARTBEAT Sekunden die Verbindung offen.
+        """
+        import asyncio
+        loop = asyncio.get_running_loop()
+        task = asyncio.current_task()
+        self._streams[task] = subscription
+        if self._poller is None:
+            self._poller = loop.create_task(self._poll())
+        subscription.attach(loop)
+        # Clients senden auf einem Event-Stream nichts; Ende der Eingabe heißt Verbindungsabbau
+        closed = loop.create_task(reader.read(4096))
+        waiting = None
+        try:
+            while not closed.done():
+                waiting = loop.create_task(subscription.wait(self.HEARTBEAT))
+                await asyncio.wait((waiting, closed), return_when=asyncio.FIRST_COMPLETED)
+                if closed.done():
+                    break
+                resync, chunks = subscription.take()
+                if resync:
+                    data = await loop.run_in_executor(None, subscription.bus.snapshot, subscription.student_id)
+                    if data is None:
+                        break
+                    chunks = [format_event('snapshot', data)]
+                writer.write(b''.join(chunks) or b': keep-alive\n\n')
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            closed.cancel()
+            if waiting is not None:
+                waiting.cancel()
+            subscription.bus.unsubscribe(subscription)
+            self._streams.pop(task, None)
+            writer.close()
+
+    async def _poll(self):
+        """Übernimmt regelmäßig fremde Änderungen, solange Streams offen sind."""
+        import asyncio
+        loop = asyncio.get_running_loop()
+        try:
+            while self._streams:
+                await asyncio.sleep(self.POLL_INTERVAL)
+                for bus in {subscription.bus for subscription in list(self._streams.values())}:
+                    if bus.poll is not None:
+                        await loop.run_in_executor(None, bus.poll)
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            traceback.print_exc()
+        finally:
+            self._poller = None
+
+    async def aclose(self):
+        """Beendet alle Streams der laufenden Event-Loop."""
+        import asyncio
+        tasks = list(self._streams) + ([self._poller] if self._poller is not None else [])
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def close(self):
+        """Beendet alle Streams und hält den eigenen Thread an (nur ohne vorgegebene Loop)."""
+        import asyncio
+        with self._lock:
+            loop, thread, self._thread = self._loop, self._thread, None
+        if thread is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.aclose(), loop).result()
+        asyncio.run_coroutine_threadsafe(loop.shutdown_default_executor(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+        self._loop = None
+
+
+def request_body_length(head, client):
+    """
+    Gibt (Länge des Anfragekörpers, ob die Event-Loop ihn vorab liest) zurück.
+
+    Die Länge ist 0 bei fehlender oder ungültiger Längenangabe und bei
+    Körpern über der erlaubten Größe; solche Anfragen weist der Handler
+    anhand der Kopfzeilen ab, ohne den Körper zu benötigen. Körper ohne
+    Größenlimit (AdmissionControl.UNLIMITED_BODY) liest erst der Handler
+    aus dem Stream, damit sie nicht vollständig im Speicher landen.
+    """
+    lines = head.split(b'\r\n')
+    target = lines[0].split(b' ')
+    path = urlparse(target[1].decode('latin-1')).path if len(target) > 1 else ''
+    for line in lines[1:]:
+        name, _, value = line.partition(b':')
+        if name.strip().lower() == b'content-length':
+            try:
+                length = int(value.strip())
+            except ValueError:
+                return 0, True
+            limit = admission.body_limit(path, client)
+            if length <= 0 or (limit is not None and length > limit):
+                return 0, True
+            return length, limit is not None
+    return 0, True
+
+
+class _BufferedConnection:
+    """
+    Socket-Ersatz, über den ein BaseHTTPRequestHandler im asyncio-Modus arbeitet.
+
+    Die Anfrage liegt bereits vollständig gelesen vor, außer einem Körper
+    ohne Größenlimit: den liest der Handler über die Event-Loop aus reader
+    (siehe _StreamedRequestFile). Antworten werden über die Event-Loop an
+    den asyncio-Stream weitergereicht. requests_served zählt die zuvor auf
+    derselben Verbindung bearbeiteten Anfragen.
+    """
+    def __init__(self, raw_request, writer, loop, requests_served=0, reader=None, body_length=0):
+        self._raw_request = raw_request
+        self._writer = writer
+        self._loop = loop
+        self._reader = reader
+        self._body_length = body_length
+        self.requests_served = requests_served
+        self.event_subscription = None
+
+    def makefile(self, mode, buffering=None):
+        if self._reader is not None:
+            return _StreamedRequestFile(self._raw_request, self._reader, self._loop, self._body_length)
+        return io.BytesIO(self._raw_request)
+
+    def settimeout(self, timeout):
+        # Die Anfrage ist bereits gelesen; Zeitlimits setzt die Event-Loop
+        pass
+
+    def sendall(self, data):
+        import asyncio
+        asyncio.run_coroutine_threadsafe(self._write(bytes(data)), self._loop).result()
+
+    async def _write(self, data):
+        import asyncio
+        self._writer.write(data)
+        # Ein Client, der nicht liest, darf den Worker nicht unbegrenzt festhalten
+        await asyncio.wait_for(self._writer.drain(), admission.request_timeout or None)
+
+
+class _StreamedRequestFile:
+    """
+    rfile eines Handlers im asyncio-Modus, dessen Anfragekörper noch nicht gelesen ist.
+
+    Die Kopfzeilen kommen aus dem Puffer, der Körper blockweise über die
+    Event-Loop aus dem asyncio-Stream (je Block höchstens request_timeout).
+    """
+    def __init__(self, head, reader, loop, length):
+        self._head = io.BytesIO(head)
+        self._reader = reader
+        self._loop = loop
+        self._length = length
+
+    def readline(self, limit=-1):
+        return self._head.readline(limit)
+
+    def read(self, size=-1):
+        import asyncio
+        if size is None or size < 0 or size > self._length:
+            size = self._length
+        if size <= 0:
+            return b''
+        block = asyncio.run_coroutine_threadsafe(self._read(size), self._loop).result()
+        self._length -= len(block)
+        return block
+
+    async def _read(self, size):
+        import asyncio
+        return await asyncio.wait_for(self._reader.read(size), admission.request_timeout or None)
+
+    def close(self):
+        pass
+
+
+class AsyncDashboardServer:
+    """
+    HTTP-Server auf Basis von asyncio.start_server.
+
+    Verbindungen werden in der Event-Loop angenommen und gelesen, sodass
+    langsame oder wartende Clients keine Threads belegen. Die eigentliche
+    Bearbeitung (Datenbank, Rendering) läuft im Thread-Pool über denselben
+    DashboardHandler wie in den anderen Modi. Event-Streams bleiben danach
+    in der Event-Loop und belegen keinen Thread. Sind alle Worker belegt
+    und warten bereits admission.max_pending Anfragen, wird jede weitere
+    mit 503 abgewiesen.
+
+    Attribute:
+        server_address: Tatsächlich gebundene Adresse (host, port)
+        workers: Anzahl der Worker-Threads für die Bearbeitung
+        event_streamer: Hält die offenen Event-Streams (ab serve_forever())
+    """
+    def __init__(self, server_address, handler_class, workers=8):
+        """Bindet den Socket sofort, damit der Port danach feststeht."""
+        from concurrent.futures import ThreadPoolExecutor
+        self.workers = workers
+        self._socket = socket.create_server(server_address)
+        self.server_address = self._socket.getsockname()[:2]
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='dashboard-worker')
+        self._loop = None
+        self._stopped = None
+        self._active = 0
+        self.event_streamer = None
+
+        class BridgedHandler(handler_class):
+            def handle(self):
+                self.close_connection = True
+                self.requests_served = self.connection.requests_served
+                self.handle_one_request()
+
+        self._handler_class = BridgedHandler
+
+    def serve_forever(self):
+        """Startet die Event-Loop und blockiert bis shutdown() aufgerufen wird."""
+        import asyncio
+        asyncio.run(self._serve())
+
+    def shutdown(self):
+        """Beendet serve_forever() aus einem anderen Thread heraus."""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._stopped.set)
+
+    def server_close(self):
+        """Schließt den Socket und den Worker-Pool."""
+        self._socket.close()
+        self._executor.shutdown(wait=True)
+
+    def stream_events(self, handler, subscription):
+        """Merkt vor, dass die Verbindung nach dem Handler als Event-Stream weiterläuft."""
+        handler.connection.event_subscription = subscription
+
+    async def _serve(self):
+        import asyncio
+        self._loop = asyncio.get_running_loop()
+        self._stopped = asyncio.Event()
+        self.event_streamer = EventStreamer(self._loop)
+        server = await asyncio.start_server(self._handle_client, sock=self._socket)
+        async with server:
+            await self._stopped.wait()
+            await self.event_streamer.aclose()
+
+    async def _handle_client(self, reader, writer):
+        """
+        Liest Anfragen einer Verbindung und lässt sie im Thread-Pool bearbeiten.
+
+        Die Kopfzeilen müssen innerhalb von request_timeout eintreffen, bei
+        Folgeanfragen innerhalb von keep_alive_timeout. Einen Anfragekörper
+        über der erlaubten Größe liest die Loop nicht; der Handler weist die
+        Anfrage dann ab (siehe DashboardHandler.parse_request). Einen Körper
+        ohne Größenlimit liest der Handler selbst aus dem Stream.
+        """
+        import asyncio
+        client_address = writer.get_extra_info('peername')
+        served = 0
+        try:
+            keep_alive = True
+            while keep_alive:
+                timeout = admission.keep_alive_timeout if served else admission.request_timeout
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), timeout or None)
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError):
+                    break
+                length, buffered = request_body_length(head, client_address[0])
+                body = b''
+                if length and buffered:
+                    body = await asyncio.wait_for(reader.readexactly(length), admission.request_timeout or None)
+                if self._active >= self.workers + admission.max_pending:
+                    writer.write(admission.overloaded_response())
+                    break
+                if buffered:
+                    connection = _BufferedConnection(head + body, writer, self._loop, served)
+                else:
+                    connection = _BufferedConnection(head, writer, self._loop, served, reader, length)
+                self._active += 1
+                try:
+                    handler = await self._loop.run_in_executor(
+                        self._executor, self._handler_class, connection, client_address, self)
+                finally:
+                    self._active -= 1
+                served += 1
+                if connection.event_subscription is not None:
+                    await self.event_streamer.stream(reader, writer, connection.event_subscription)
+                    break
+                keep_alive = not handler.close_connection
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.TimeoutError):
+            pass
+        except asyncio.CancelledError:
+            # Beim Beenden bricht asyncio.run() noch offene Verbindungen ab
+            pass
+        except Exception:
+            traceback.print_exc()
+        finally:
+            writer.close()
+
+
+class PreforkServer:
+    """
+    Verteilt die Verbindungen auf mehrere Worker-Prozesse (nur Unix).
+
+    Der Elternprozess bindet den Socket und startet per fork ``processes``
+    Worker, die ihn erben und darauf je einen ThreadedDashboardHTTPServer
+    betreiben; der Kernel verteilt die Verbindungen. Rendering und
+    Berechnungen laufen so parallel, ohne sich eine GIL zu teilen. Jeder
+    Worker öffnet seine Datenbankverbindungen erst nach dem fork und
+    übernimmt Änderungen der anderen über Database.poll_changes().
+
+    Signale an den Elternprozess:
+    - SIGHUP: alle Worker nacheinander ersetzen; der neue Worker startet,
+      bevor der alte beendet wird, laufende Anfragen werden abgeschlossen
+    - SIGTERM, SIGINT: alle Worker geordnet beenden
+
+    Unerwartet beendete Worker werden neu gestartet.
+
+    Attribute:
+        server_address: Tatsächlich gebundene Adresse (host, port)
+        processes: Anzahl der Worker-Prozesse
+        workers: Worker-Threads je Prozess
+        worker_init: Wird in jedem Worker nach dem fork aufgerufen (optional)
+    """
+    GRACE_PERIOD = 10   # Sekunden bis zum SIGKILL für nicht beendete Worker
+    BACKLOG = 128
+
+    def __init__(self, server_address, handler_class, processes=None, workers=8, worker_init=None):
+        """Bindet den Socket sofort, damit der Port danach feststeht."""
+        if not hasattr(os, 'fork'):
+            raise RuntimeError('Der Modus prefork benötigt os.fork (nicht unter Windows)')
+        self.processes = processes or os.cpu_count() or 1
+        self.workers = workers
+        self.worker_init = worker_init
+        self._handler_class = handler_class
+        self._socket = socket.create_server(server_address, backlog=self.BACKLOG)
+        self.server_address = self._socket.getsockname()[:2]
+        self._children = {}
+        self._generation = 0
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._restart_requested = False
+        self._stop_requested = False
+        self._stop_deadline = None
+
+    def serve_forever(self):
+        """Startet die Worker und überwacht sie, bis shutdown() aufgerufen oder SIGTERM empfangen wurde."""
+        if _database is not None:
+            _database.close()   # keine SQLite-Verbindungen über fork vererben
+        previous = {}
+        if threading.current_thread() is threading.main_thread():
+            handlers = {signal.SIGHUP: self.restart, signal.SIGTERM: self._request_stop,
+                        signal.SIGINT: self._request_stop}
+            for signum, handler in handlers.items():
+                previous[signum] = signal.signal(signum, lambda signum, frame, handler=handler: handler())
+        self._stopped.clear()
+        try:
+            for _ in range(self.processes):
+                self._spawn()
+            while self._children:
+                self._wakeup.wait(0.5)
+                self._wakeup.clear()
+                if self._stop_requested and self._stop_deadline is None:
+                    self._stop_deadline = time.monotonic() + self.GRACE_PERIOD
+                    self._signal_all(signal.SIGTERM)
+                elif self._stop_deadline is not None and time.monotonic() > self._stop_deadline:
+                    self._signal_all(signal.SIGKILL)
+                if self._restart_requested and not self._stop_requested:
+                    self._restart_requested = False
+                    self._replace_workers()
+                self._reap()
+        finally:
+            for signum, handler in previous.items():
+                signal.signal(signum, handler)
+            self._stop_requested = False
+            self._stop_deadline = None
+            self._stopped.set()
+
+    def restart(self):
+        """Ersetzt alle Worker nacheinander (graceful restart), z.B. nach SIGHUP."""
+        self._restart_requested = True
+        self._wakeup.set()
+
+    def shutdown(self):
+        """Beendet serve_forever() aus einem anderen Thread und wartet auf das Ende aller Worker."""
+        self._request_stop()
+        self._stopped.wait()
+
+    def server_close(self):
+        """Schließt den gemeinsamen Socket."""
+        self._socket.close()
+
+    def _request_stop(self):
+        self._stop_requested = True
+        self._wakeup.set()
+
+    def _spawn(self):
+        """Startet einen Worker-Prozess der aktuellen Generation."""
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid == 0:
+            code = 1
+            try:
+                self._run_worker()
+                code = 0
+            except BaseException:
+                traceback.print_exc()
+            finally:
+                os._exit(code)
+        self._children[pid] = (self._generation, time.monotonic())
+
+    def _run_worker(self):
+        """Läuft im Worker: bedient den geerbten Socket, bis SIGTERM eintrifft."""
+        global _database, _registry, _analytics, _reminders, _backup_job
+        _database = _registry = _analytics = _reminders = _backup_job = None
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGHUP, signal.SIG_IGN)
+        if self.worker_init is not None:
+            self.worker_init()
+        httpd = ThreadedDashboardHTTPServer(self.server_address, self._handler_class, self.workers,
+                                            bind_and_activate=False)
+        httpd.socket.close()
+        httpd.socket = self._socket
+        httpd.server_name, httpd.server_port = self.server_address[0], self.server_address[1]
+        # shutdown() wartet auf serve_forever, darf also nicht in dessen Thread laufen
+        signal.signal(signal.SIGTERM, lambda signum, frame: threading.Thread(target=httpd.shutdown).start())
+        listener = start_request_logging()
+        try:
+            httpd.serve_forever()
+        finally:
+            httpd.server_close()
+            stop_request_logging(listener)
+            if _database is not None:
+                _database.close()
+
+    def _replace_workers(self):
+        """Startet je Worker der alten Generation einen neuen und beendet dann den alten."""
+        old = [pid for pid, (generation, _) in self._children.items() if generation == self._generation]
+        self._generation += 1
+        for pid in old:
+            self._spawn()
+            self._kill(pid, signal.SIGTERM)
+
+    def _reap(self):
+        """Sammelt beendete Worker ein und ersetzt unerwartet beendete."""
+        while self._children:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+            if pid == 0:
+                return
+            generation, started = self._children.pop(pid, (None, None))
+            if generation == self._generation and not self._stop_requested:
+                print(f"Worker {pid} unerwartet beendet (Exit-Code {os.waitstatus_to_exitcode(status)}), "
+                      f"wird neu gestartet", file=sys.stderr)
+                if time.monotonic() - started < 1:
+                    time.sleep(1)   # keine Neustartschleife bei sofort abbrechenden Workern
+                self._spawn()
+
+    def _signal_all(self, signum):
+        for pid in list(self._children):
+            self._kill(pid, signum)
+
+    def _kill(self, pid, signum):
+        try:
+            os.kill(pid, signum)
+        except ProcessLookupError:
+            pass
+
+
 class Server:
     """
     Kapselt den HTTP-Server: Konfiguration, Start und Ausgabe der Server-URL.
 
+    Unterstützte Modi:
+    - single: ein Thread, Anfragen nacheinander (ursprüngliches Verhalten)
+    - threaded: ThreadingHTTPServer mit begrenztem Worker-Pool
+    - asyncio: Event-Loop für Verbindungen, Worker-Pool für die Bearbeitung
+    - prefork: mehrere Worker-Prozesse mit je einem Thread-Pool (nur Unix)
+
     Attribute:
         host: Hostname oder IP-Adresse
         port: Port-Nummer
+        mode: Betriebsmodus (single, threaded, asyncio, prefork)
+        workers: Anzahl der Worker-Threads (je Prozess)
+        processes: Anzahl der Worker-Prozesse im Modus prefork (Standard: Anzahl der Kerne)
+        reminder_sinks: Empfänger für Fristerinnerungen; leer bedeutet keine Erinnerungen
+        reminder_days: Vorlauf der Erinnerungen in Tagen
     """
-    def __init__(self, host='127.0.0.1', port=5000):
-        """Initialisiert den Server mit Host und Port."""
+    MODES = ('single', 'threaded', 'asyncio') + (('prefork',) if hasattr(os, 'fork') else ())
+
+    def __init__(self, host='127.0.0.1', port=5000, mode='threaded', workers=8, processes=None,
+                 reminder_sinks=(), reminder_days=1):
+        """Initialisiert den Server mit Host, Port und Betriebsmodus."""
+        if mode not in self.MODES:
+            raise ValueError(f"Unbekannter Server-Modus: {mode}")
         self.host = host
         self.port = port
+        self.mode = mode
+        self.workers = workers
+        self.processes = processes
+        self.reminder_sinks = list(reminder_sinks)
+        self.reminder_days = reminder_days
+        self.httpd = None
+
+    def create_httpd(self):
+        """Erzeugt den zum Modus passenden Server und bindet den Port."""
+        if self.mode == 'threaded':
+            self.httpd = ThreadedDashboardHTTPServer((self.host, self.port), DashboardHandler, self.workers)
+        elif self.mode == 'asyncio':
+            self.httpd = AsyncDashboardServer((self.host, self.port), DashboardHandler, self.workers)
+        elif self.mode == 'prefork':
+            # Jeder Worker plant selbst; reminders_sent verhindert doppelte Erinnerungen
+            self.httpd = PreforkServer((self.host, self.port), DashboardHandler, self.processes, self.workers,
+                                       self.start_reminders if self.reminder_sinks else None)
+        else:
+            self.httpd = DashboardHTTPServer((self.host, self.port), DashboardHandler)
+        self.port = self.httpd.server_address[1]
+        return self.httpd
 
     def start(self):
         """Startet den HTTP-Server und blockiert bis zum Abbruch."""
-        httpd = DashboardHTTPServer((self.host, self.port), DashboardHandler)
+        httpd = self.create_httpd()
+        # Im Modus prefork protokolliert jeder Worker selbst
+        listener = start_request_logging() if self.mode != 'prefork' else None
         print("\n" + "*" * 60)
-        print("Dashboard Server gestartet!")
+        if self.mode == 'prefork':
+            print(f"Dashboard Server gestartet! (Modus: prefork, {httpd.processes} Prozesse, PID {os.getpid()})")
+        else:
+            print(f"Dashboard Server gestartet! (Modus: {self.mode})")
         print(f"Dashboard URL: http://{self.host}:{self.port}")
         print("*" * 60 + "\n")
-        httpd.serve_forever()
+        if not os.path.exists(os.path.join(SCRIPT_DIR, database_name)):
+            print("Noch keine Datenbank vorhanden - Testdaten mit 'python dashboard.py seed' anlegen.\n")
+        if self.reminder_sinks and self.mode != 'prefork':
+            self.start_reminders()
+        try:
+            httpd.serve_forever()
+        finally:
+            httpd.server_close()
+            stop_reminders()
+            if listener is not None:
+                stop_request_logging(listener)
+
+    def start_reminders(self):
+        """Startet die Fristerinnerungen dieses Prozesses mit den konfigurierten Empfängern."""
+        start_reminders(self.reminder_sinks, self.reminder_days)
+
+    def stop(self):
+        """Beendet einen laufenden Server aus einem anderen Thread."""
+        if self.httpd is not None:
+            self.httpd.shutdown()
+
+
+def seed(args):
+    """Legt die Testdaten des Beispiel-Studenten an."""
+    dashboard = create_test_data(get_database())
+    print(f"Testdaten für {dashboard.student.name} ({dashboard.student.student_id}) angelegt.")
+
+
+def import_cohort(args):
+    """Importiert Jahrgangsdaten aus den angegebenen Dateien."""
+    importer = BulkImporter(get_database(), batch_size=args.batch_size)
+    for kind in BulkImporter.KINDS:
+        path = getattr(args, kind)
+        if path:
+            start = time.perf_counter()
+            count = importer.import_file(kind, path)
+            elapsed = time.perf_counter() - start
+            print(f"{kind}: {count} Datensätze in {elapsed:.2f} s ({count / max(elapsed, 1e-9):,.0f}/s)")
+
+
+def backup_database(args):
+    """Sichert die Datenbank schrittweise in die angegebene Datei."""
+    start = time.perf_counter()
+    pages = get_database().backup(os.path.abspath(args.target), pages=args.pages)
+    print(f"{pages} Seiten nach {args.target} gesichert ({time.perf_counter() - start:.2f} s)")
+
+
+def export_snapshot(args):
+    """Schreibt alle Tabellen als JSONL in eine Datei oder auf die Standardausgabe."""
+    count = -1  # ohne Kopfzeile
+    output = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8', newline='\n')
+    try:
+        for line in get_database().export_rows():
+            output.write(line + '\n')
+            count += 1
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    print(f"{count} Datensätze exportiert", file=sys.stderr)
+
+
+def import_snapshot(args):
+    """Übernimmt einen JSONL-Export aus einer Datei oder von der Standardeingabe."""
+    source = sys.stdin if args.input == '-' else open(args.input, 'r', encoding='utf-8')
+    try:
+        count = get_database().import_rows(source, batch_size=args.batch_size)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+    print(f"{count} Datensätze importiert", file=sys.stderr)
+
+
+def main(argv=None):
+    """
+    Wertet die Kommandozeile aus.
+
+    Ohne Befehl (oder mit "serve") wird der Server gestartet.
+    """
+    import argparse
+    global database_name
+
+    parser = argparse.ArgumentParser(description='Studenten-Dashboard')
+    commands = parser.add_subparsers(dest='command')
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--db', default=database_name, help='Pfad zur Datenbankdatei')
+
+    serve = commands.add_parser('serve', parents=[common], help='Startet den Webserver (Standard)')
+    serve.add_argument('--host', default='127.0.0.1', help='Hostname oder IP-Adresse')
+    serve.add_argument('--port', type=int, default=5000, help='Port-Nummer')
+    serve.add_argument('--mode', choices=Server.MODES, default='threaded', help='Server-Modus')
+    serve.add_argument('--workers', type=int, default=8, help='Anzahl der Worker-Threads (je Prozess)')
+    serve.add_argument('--processes', type=int, help='Worker-Prozesse im Modus prefork (Standard: Anzahl der Kerne)')
+    serve.add_argument('--profile-rate', type=float, default=0.0,
+                       help='Anteil der mit cProfile profilierten Anfragen (zur Laufzeit über /admin/profile änderbar)')
+    serve.add_argument('--reminder-log', metavar='DATEI', help='Fristerinnerungen in diese Logdatei schreiben')
+    serve.add_argument('--reminder-outbox', metavar='ORDNER',
+                       help='Fristerinnerungen als E-Mails (.eml) in diesem Ordner ablegen')
+    serve.add_argument('--reminder-days', type=int, default=1, help='Wie viele Tage vor einer Frist erinnert wird')
+    serve.add_argument('--rate-limit', type=float, default=admission.rate,
+                       help='Anfragen je Sekunde und Client (0 = unbegrenzt)')
+    serve.add_argument('--rate-burst', type=int, default=admission.burst,
+                       help='Anfragen, die ein Client auf einmal senden darf')
+    serve.add_argument('--max-body-size', type=int, default=admission.max_body_size,
+                       help='Größter angenommener Anfragekörper in Bytes')
+    serve.add_argument('--request-timeout', type=float, default=admission.request_timeout,
+                       help='Zeitlimit für Lesen und Schreiben einer Anfrage in Sekunden')
+    serve.add_argument('--keep-alive-timeout', type=float, default=admission.keep_alive_timeout,
+                       help='Sekunden, die eine Verbindung ohne neue Anfrage offen bleibt')
+    serve.add_argument('--max-pending', type=int, default=admission.max_pending,
+                       help='Verbindungen, die höchstens auf einen Worker warten (weitere erhalten 503)')
+
+    commands.add_parser('seed', parents=[common], help='Legt Testdaten für einen Beispiel-Studenten an')
+
+    cohort = commands.add_parser('import-cohort', parents=[common], help='Importiert Jahrgänge aus CSV/JSONL-Dateien')
+    for kind in BulkImporter.KINDS:
+        cohort.add_argument(f'--{kind}', metavar='DATEI', help=f'Datei mit Datensätzen vom Typ {kind}')
+    cohort.add_argument('--batch-size', type=int, default=5000, help='Zeilen pro Transaktion')
+
+    backup = commands.add_parser('backup', parents=[common], help='Sichert die Datenbank im laufenden Betrieb')
+    backup.add_argument('target', help='Pfad der Sicherungsdatei')
+    backup.add_argument('--pages', type=int, default=Database.BACKUP_PAGES, help='Seiten je Schritt')
+
+    export = commands.add_parser('export', parents=[common], help='Exportiert alle Tabellen als JSONL')
+    export.add_argument('output', nargs='?', default='-', help='Zieldatei (Standard: Standardausgabe)')
+
+    restore = commands.add_parser('import', parents=[common], help='Übernimmt einen JSONL-Export')
+    restore.add_argument('input', help='JSONL-Datei (- für Standardeingabe)')
+    restore.add_argument('--batch-size', type=int, default=5000, help='Datensätze pro Transaktion')
+
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv or (argv[0].startswith('-') and argv[0] not in ('-h', '--help')):
+        argv = ['serve'] + argv
+    args = parser.parse_args(argv)
+    database_name = args.db
+
+    if args.command == 'seed':
+        seed(args)
+    elif args.command == 'import-cohort':
+        import_cohort(args)
+    elif args.command == 'backup':
+        backup_database(args)
+    elif args.command == 'export':
+        export_snapshot(args)
+    elif args.command == 'import':
+        import_snapshot(args)
+    else:
+        profiler.set_rate(args.profile_rate)
+        admission.configure(rate=args.rate_limit, burst=args.rate_burst, max_body_size=args.max_body_size,
+                            request_timeout=args.request_timeout, keep_alive_timeout=args.keep_alive_timeout,
+                            max_pending=args.max_pending)
+        sinks = []
+        if args.reminder_log:
+            sinks.append(LogReminderSink(args.reminder_log))
+        if args.reminder_outbox:
+            sinks.append(OutboxReminderSink(args.reminder_outbox))
+        Server(args.host, args.port, args.mode, args.workers, args.processes, sinks, args.reminder_days).start()
 
 
 if __name__ == '__main__':
-    Server().start()
\ No newline at end of file
+    main()